@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+缓存读写锁分段基准测试
+
+用模拟磁盘延迟的后端，测量缓存查询吞吐量随线程数的变化。
+读锁按键分段，读取吞吐量应随线程数近似线性增长。
+
+用法:
+    python benchmarks/cache_lock_benchmark.py [--threads 1,4,16] [--seconds 1.0] [--delay-ms 2]
+"""
+
+import argparse
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from web_scraping_toolkit import CacheMechanism
+from web_scraping_toolkit.cache.backends.memory_backend import MemoryCacheBackend
+
+
+class SlowBackend(MemoryCacheBackend):
+    """每次读取有固定延迟的内存后端，模拟磁盘读取"""
+
+    def __init__(self, delay: float):
+        super().__init__()
+        self.delay = delay
+
+    def get(self, key):
+        time.sleep(self.delay)
+        return super().get(key)
+
+    def get_status(self, key):
+        time.sleep(self.delay)
+        return super().get_status(key)
+
+
+def throughput(cache, urls, threads: int, seconds: float) -> float:
+    """返回指定线程数下每秒完成的查询次数"""
+    done = []
+    stop = time.monotonic() + seconds
+
+    def worker(offset):
+        count = 0
+        while time.monotonic() < stop:
+            url = urls[(offset + count) % len(urls)]
+            cache.get_cached_data(url)
+            cache.is_processed_by_stage(url, "parse")
+            count += 1
+        done.append(count)
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(worker, range(threads)))
+    return sum(done) / seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cache read throughput by thread count")
+    parser.add_argument("--threads", default="1,4,16", help="逗号分隔的线程数")
+    parser.add_argument("--seconds", type=float, default=1.0, help="每个线程数的测量时长(秒)")
+    parser.add_argument("--delay-ms", type=float, default=2.0, help="模拟的每次读取延迟(毫秒)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = CacheMechanism("bench", cache_dir=cache_dir, expiration_seconds=3600, enabled=True,
+                               backend=SlowBackend(args.delay_ms / 1000), sweep_interval=3600)
+        urls = [f"https://example.com/page/{i}" for i in range(256)]
+        for url in urls:
+            cache.cache_data(url, {"content": url})
+            cache.mark_as_processed(url, "parse")
+
+        print(f"{'threads':>8}{'lookups/s':>12}{'speedup':>10}")
+        baseline = None
+        for threads in (int(t) for t in args.threads.split(",")):
+            ops = throughput(cache, urls, threads, args.seconds)
+            baseline = baseline or ops
+            print(f"{threads:>8}{ops:>12.0f}{ops / baseline:>9.1f}x")
+        cache.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+_needs_browser 标签计数基准测试
+
+比较原来的 BeautifulSoup 解析方式与流式标签计数器在大页面上的耗时，
+并确认两者给出相同的判断。
+
+用法:
+    python benchmarks/needs_browser_benchmark.py [--sizes 100,1000,5000] [--repeat 5]
+"""
+
+import argparse
+import time
+
+from bs4 import BeautifulSoup
+
+from web_scraping_toolkit.detection.tag_counter import is_script_heavy
+
+CONTENT_TAGS = ['p', 'div', 'span', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6']
+
+
+def soup_is_script_heavy(html: str) -> bool:
+    """原来 _needs_browser 中基于 BeautifulSoup 的判断"""
+    body = BeautifulSoup(html, 'html.parser').find('body')
+    if body:
+        return len(body.find_all('script')) > len(body.find_all(CONTENT_TAGS)) * 2
+    return False
+
+
+def build_page(size_kb: int, script_heavy: bool) -> str:
+    """生成指定大小的新闻页面或脚本外壳页面"""
+    head = (
+        "<html><head><title>Benchmark</title>"
+        "<script>window.__STATE__ = {\"items\": [\"<div>\", \"<p>\"]};</script>"
+        "<style>.article p { margin: 0 }</style></head><body>"
+    )
+    if script_heavy:
+        block = "<script src='/static/chunk.js'></script><script>hydrate('<div class=x>');</script><div id='app'></div>"
+    else:
+        block = (
+            "<div class='article'><h2>Section title</h2>"
+            "<p>Lorem ipsum dolor sit amet, <span>consectetur</span> adipiscing elit. "
+            "<a href='/next?page=2&amp;x=1'>more</a></p><!-- <p>ad slot</p> --></div>"
+        )
+    repeats = max(1, size_kb * 1024 // len(block))
+    return head + block * repeats + "</body></html>"
+
+
+def time_call(func, arg, repeat: int) -> float:
+    """返回多次调用中最快的一次耗时（毫秒）"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(arg)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark _needs_browser tag counting")
+    parser.add_argument("--sizes", default="100,1000,5000", help="逗号分隔的页面大小(KB)")
+    parser.add_argument("--repeat", type=int, default=5, help="每项测量的重复次数")
+    args = parser.parse_args()
+
+    print(f"{'page':<16}{'size':>10}{'soup ms':>12}{'scan ms':>12}{'speedup':>10}  same")
+    for size_kb in (int(s) for s in args.sizes.split(",")):
+        for script_heavy in (False, True):
+            html = build_page(size_kb, script_heavy)
+            raw = html.encode("utf-8")
+
+            soup_ms = time_call(soup_is_script_heavy, html, args.repeat)
+            scan_ms = time_call(is_script_heavy, raw, args.repeat)
+            same = soup_is_script_heavy(html) == is_script_heavy(raw)
+
+            name = "script shell" if script_heavy else "article"
+            print(f"{name:<16}{len(raw) // 1024:>8}KB{soup_ms:>12.1f}{scan_ms:>12.1f}{soup_ms / scan_ms:>9.1f}x  {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,7 @@ import time
 import json
 import datetime
 import argparse
+import itertools
 from urllib.parse import urlparse
 from dotenv import load_dotenv
 from bs4 import BeautifulSoup
@@ -95,12 +96,13 @@ class NewsScraperPipeline:
         
         print(f"News scraper pipeline initialized")
     
-    def extract_article_content(self, url):
+    def extract_article_content(self, url, response=None):
         """
         Extract article content from a news URL.
         
         Args:
             url: The URL of the news article
+            response: Optional response that was already fetched for the URL
             
         Returns:
             NewsArticle: The extracted article with content
@@ -141,7 +143,8 @@ class NewsScraperPipeline:
             print(f"Fetching article: {url}")
             
             # Fetch the article - force browser mode for reliable content extraction
-            response = self.scraper.get(url, force_browser=True)
+            if response is None:
+                response = self.scraper.get(url, force_browser=True)
             
             # Parse with BeautifulSoup
             soup = BeautifulSoup(response.text, 'html.parser')
@@ -263,9 +266,28 @@ class NewsScraperPipeline:
         """
         articles = []
         
-        for i, url in enumerate(urls):
+        # Articles that were already processed are loaded from disk, not fetched
+        to_fetch = []
+        results = []
+        for url in dict.fromkeys(urls):
+            if self.cache.is_processed_by_stage(url, "content_extraction"):
+                results.append((url, None))
+            else:
+                to_fetch.append(url)
+        
+        # Fetch the rest concurrently, at most 2 requests per news site at a time
+        results = itertools.chain(
+            results,
+            self.scraper.fetch_many(to_fetch, concurrency=4, per_host_limit=2, force_browser=True)
+        )
+        
+        for i, (url, result) in enumerate(results):
             print(f"\n[{i+1}/{len(urls)}] Processing {url}")
-            article = self.extract_article_content(url)
+            if isinstance(result, Exception):
+                print(f"Error fetching article: {result}")
+                continue
+            
+            article = self.extract_article_content(url, response=result)
             
             if article.title:
                 print(f"Title: {article.title}")
@@ -277,10 +299,6 @@ class NewsScraperPipeline:
                 articles.append(article)
             else:
                 print(f"Failed to extract article")
-            
-            # Sleep between articles
-            if i < len(urls) - 1:
-                time.sleep(3)
         
         return articles
 
@@ -9,7 +9,9 @@ __version__ = "0.1.0"
 from .proxy.proxy_manager import ProxyManager
 from .captcha.captcha_solver import CaptchaSolver
 from .cache.cache_mechanism import CacheMechanism
+from .ratelimit.rate_limiter import RateLimiter
 from .scraper import WebScraper
+from .async_scraper import AsyncWebScraper
 
 # Import trends module
 from .trends import (
@@ -36,7 +38,9 @@ __all__ = [
     'ProxyManager',
     'CaptchaSolver', 
     'CacheMechanism',
+    'RateLimiter',
     'WebScraper',
+    'AsyncWebScraper',
     # Trends module exports
     'get_trend_score_via_serpapi',
     'get_trend_score_via_pytrends',
@@ -0,0 +1,534 @@
+"""
+Asynchronous Web Scraper for the Web Scraping Toolkit.
+
+This module provides an asyncio-based scraper that shares the cache lookup,
+CAPTCHA/JavaScript detection, proxy rotation and browser fallback of
+WebScraper, while keeping many HTTP requests in flight from a single thread.
+"""
+
+import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Callable, Tuple, TypeVar
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from .scraper import WebScraper
+from .proxy.proxy_manager import ProxyManager
+from .captcha.captcha_solver import CaptchaSolver
+from .cache.cache_mechanism import CacheMechanism
+from .cache.cache_policy import CachePolicy
+from .ratelimit.rate_limiter import RateLimiter
+from .browser.browser_pool import BrowserPool
+from .browser.render_service import RenderService
+from .browser.resource_policy import ResourceBlockPolicy
+from .browser.wait_policy import DomainWaitPolicies
+from .detection.captcha_classifier import CaptchaClassifier
+from .strategy.fetch_mode_memory import FetchModeMemory, MODE_HTTP, MODE_BROWSER
+from .strategy.escalation_policy import (
+    EscalationPolicy, OUTCOME_LEARNED_BROWSER,
+    ACTION_RETURN, ACTION_FAIL, ACTION_RETRY, ACTION_RENDER
+)
+from .utils.logger import get_logger
+from .utils.config import get_scraper_config
+
+# Initialize logger
+logger = get_logger("async_web_scraper")
+
+T = TypeVar("T")
+
+class AsyncWebScraper(WebScraper):
+    """
+    Asyncio variant of WebScraper built on aiohttp.
+
+    This class provides:
+    - A coroutine `aget` with the same semantics as `WebScraper.get`
+    - A global concurrency limit shared by all in-flight requests
+    - Browser fallback, cache I/O and page detection executed in worker threads
+      so the event loop never blocks
+
+    The synchronous `get` inherited from WebScraper keeps working unchanged.
+    """
+
+    def __init__(
+        self,
+        proxy_manager: Optional[ProxyManager] = None,
+        captcha_solver: Optional[CaptchaSolver] = None,
+        cache_mechanism: Optional[CacheMechanism] = None,
+        user_agent: Optional[str] = None,
+        browser_headless: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        browser_pool: Optional[BrowserPool] = None,
+        render_service: Optional[RenderService] = None,
+        max_concurrency: Optional[int] = None,
+        resource_policy: Optional[ResourceBlockPolicy] = None,
+        wait_policies: Optional[DomainWaitPolicies] = None,
+        fetch_modes: Optional[FetchModeMemory] = None,
+        captcha_classifier: Optional[CaptchaClassifier] = None,
+        escalation_policy: Optional[EscalationPolicy] = None,
+        cache_policy: Optional[CachePolicy] = None
+    ):
+        """
+        Initialize the asynchronous web scraper with optional components.
+
+        Args:
+            proxy_manager: Optional proxy manager for IP rotation
+            captcha_solver: Optional CAPTCHA solver
+            cache_mechanism: Optional cache mechanism
+            user_agent: Custom user agent string
+            browser_headless: Whether to run browser in headless mode
+            rate_limiter: Optional per-host rate limiter (defaults to one built from config)
+            browser_pool: Optional shared browser pool (defaults to a pool owned by this scraper)
+            render_service: Optional render worker processes used instead of in-process browsers
+            max_concurrency: Maximum number of requests in flight (overrides config)
+            resource_policy: Optional policy for blocking browser sub-resources (defaults to config)
+            wait_policies: Optional per-domain policies deciding when a rendered page is ready (defaults to config)
+            fetch_modes: Optional per-domain memory of which fetch mode works (defaults to config)
+            captcha_classifier: Optional classifier deciding which pages are CAPTCHAs (defaults to config)
+            escalation_policy: Optional policy mapping HTTP outcomes to retry/render/fail (defaults to config)
+            cache_policy: Optional policy deciding how long each cached response stays fresh (defaults to config)
+        """
+        super().__init__(
+            proxy_manager=proxy_manager,
+            captcha_solver=captcha_solver,
+            cache_mechanism=cache_mechanism,
+            user_agent=user_agent,
+            browser_headless=browser_headless,
+            rate_limiter=rate_limiter,
+            browser_pool=browser_pool,
+            render_service=render_service,
+            resource_policy=resource_policy,
+            wait_policies=wait_policies,
+            fetch_modes=fetch_modes,
+            captcha_classifier=captcha_classifier,
+            escalation_policy=escalation_policy,
+            cache_policy=cache_policy
+        )
+
+        # Load scraper configuration
+        config = get_scraper_config()
+        self.max_concurrency = max_concurrency or config.get("max_concurrency", 100)
+        self.io_workers = config.get("io_workers", 4)
+
+        # Loop-bound resources are created lazily inside the running event loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._client_session = None
+        self._loop = None
+
+        # Background refreshes of stale cache entries
+        self._refresh_tasks: set = set()
+
+        # Threads for blocking cache, detection and fetch mode work, started on first use
+        self._io_executor: Optional[ThreadPoolExecutor] = None
+
+        logger.info(f"Async web scraper initialized (max concurrency: {self.max_concurrency})")
+
+    async def __aenter__(self) -> "AsyncWebScraper":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client session, browsers and HTTP connections."""
+        # Let background refreshes finish while the client session is still open
+        if self._refresh_tasks:
+            await asyncio.gather(*self._refresh_tasks, return_exceptions=True)
+        if self._client_session is not None and not self._client_session.closed:
+            await self._client_session.close()
+        self.close()
+
+    def close(self) -> None:
+        """
+        Release the browsers and HTTP connections held by this scraper.
+
+        The aiohttp client session can only be closed from its event loop, by
+        `aclose` (or `async with`); if it is still open this only warns.
+        """
+        session = self._client_session
+        if session is not None and not session.closed:
+            logger.warning("close() does not close the aiohttp client session, "
+                           "use 'await scraper.aclose()' or 'async with' instead")
+        else:
+            self._client_session = None
+            self._semaphore = None
+            self._loop = None
+        with self._lock:
+            executor, self._io_executor = self._io_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        super().close()
+
+    async def _run_blocking(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Run a blocking call on the scraper's I/O threads and wait for it.
+
+        Args:
+            fn: The function to call
+            *args: Its positional arguments
+
+        Returns:
+            Whatever `fn` returns
+        """
+        with self._lock:
+            if self._io_executor is None:
+                self._io_executor = ThreadPoolExecutor(
+                    max_workers=self.io_workers,
+                    thread_name_prefix="async-scraper-io"
+                )
+            executor = self._io_executor
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, functools.partial(fn, *args))
+
+    def _lookup_cached(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        force_browser: bool
+    ) -> Tuple[Optional[requests.Response], Optional[requests.Response]]:
+        """
+        Look a URL up in the cache (blocking).
+
+        Args:
+            url: The URL to fetch
+            params: Optional query parameters
+            headers: Optional HTTP headers
+            force_browser: Whether to force browser-based fetching
+
+        Returns:
+            Tuple of (fresh response, stale response within the stale-while-revalidate window); either may be None
+        """
+        cache_keys = self._lookup_cache_keys(url, params, headers, force_browser)
+        cached_response = self._get_cached_response(url, cache_keys)
+        if cached_response is not None:
+            return cached_response, None
+        return None, self._get_stale_response(url, cache_keys)
+
+    async def _ensure_loop_resources(self) -> None:
+        """Create the semaphore and client session for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._client_session is not None and not self._client_session.closed:
+            return
+
+        if aiohttp is None:
+            raise ImportError("AsyncWebScraper requires aiohttp. Install with: pip install aiohttp")
+
+        # A session is bound to the loop it was created in; close the one left
+        # behind by a previous loop rather than leaking its connections
+        stale_session, stale_loop = self._client_session, self._loop
+        if stale_session is not None and not stale_session.closed:
+            if stale_loop is not None and stale_loop.is_running():
+                asyncio.run_coroutine_threadsafe(stale_session.close(), stale_loop)
+            else:
+                await stale_session.close()
+
+        self._loop = loop
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._client_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.max_concurrency),
+            headers={"User-Agent": self.user_agent}
+        )
+
+    async def aget(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        use_cache: Optional[bool] = None,
+        force_browser: bool = False,
+        retry_count: int = 3,
+        timeout: int = 30
+    ) -> requests.Response:
+        """
+        Fetch a URL asynchronously, with proxy rotation and caching.
+
+        Args:
+            url: The URL to fetch
+            params: Optional query parameters
+            headers: Optional HTTP headers
+            use_cache: Whether to use cache (overrides cache_mechanism setting)
+            force_browser: Whether to force browser-based fetching
+            retry_count: Number of retries on failure
+            timeout: Request timeout in seconds
+
+        Returns:
+            requests.Response: The HTTP response
+
+        Raises:
+            requests.RequestException: If the request fails after all retries
+        """
+        # Check if the URL is already in cache
+        should_use_cache = use_cache if use_cache is not None else bool(self.cache_mechanism)
+        if should_use_cache and self.cache_mechanism:
+            cached_response, stale_response = await self._run_blocking(
+                self._lookup_cached, url, params, headers, force_browser
+            )
+            if cached_response is not None:
+                return cached_response
+
+            # Within the stale-while-revalidate window the stale body is served
+            # right away and the entry is refreshed in a background task
+            if stale_response is not None:
+                stale_response.fetch_info['refreshing'] = self._refresh_in_background_async(
+                    url, stale_response.fetch_info['cache_key'], params, headers, force_browser, retry_count, timeout
+                )
+                return stale_response
+
+        return await self._afetch(url, params, headers, should_use_cache, force_browser, retry_count, timeout)
+
+    async def _afetch(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        should_use_cache: bool,
+        force_browser: bool,
+        retry_count: int,
+        timeout: int
+    ) -> requests.Response:
+        """
+        Asynchronous counterpart of `_fetch`: fetch a URL from the network, bypassing cache hits.
+
+        Args:
+            url: The URL to fetch
+            params: Optional query parameters
+            headers: Optional HTTP headers
+            should_use_cache: Whether to revalidate and store cache entries
+            force_browser: Whether to force browser-based fetching
+            retry_count: Number of retries on failure
+            timeout: Request timeout in seconds
+
+        Returns:
+            requests.Response: The HTTP response
+
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        cache_key = self._cache_key(url, params, headers, MODE_HTTP)
+
+        # An expired entry with an ETag/Last-Modified is revalidated instead of refetched
+        revalidation_data = await self._run_blocking(self._get_revalidation_data, cache_key) if should_use_cache else None
+        http_headers = self._conditional_headers(headers, revalidation_data)
+
+        # The browser loads the same URL, query parameters included
+        browser_url = self._url_with_params(url, params)
+
+        # Steps taken for this URL, reported in response.fetch_info['path']
+        path: List[Dict[str, Any]] = []
+
+        # Try browser-based fetching if forced
+        if force_browser:
+            return await self._get_with_browser_async(browser_url, headers, retry_count, path)
+
+        # Skip the HTTP attempt for domains where it is known to fail
+        if self.fetch_modes.choose_mode(url) == MODE_BROWSER:
+            logger.info(f"HTTP keeps failing for this domain, using browser mode for {url}")
+            path.append(self._escalation_step(MODE_HTTP, OUTCOME_LEARNED_BROWSER, ACTION_RENDER))
+            try:
+                return await self._get_with_browser_async(browser_url, headers, retry_count, path,
+                                                          record=True, on_error=ACTION_RETRY)
+            except requests.RequestException as e:
+                logger.warning(f"Browser mode failed for {url}, falling back to HTTP: {e}")
+
+        # Try regular HTTP fetching, escalating according to the outcome of each attempt
+        for attempt in range(retry_count):
+            response, error = None, None
+            try:
+                response = await self._get_with_aiohttp(url, params, http_headers, timeout)
+                if revalidation_data is not None and response.status_code == 304:
+                    return await self._run_blocking(
+                        self._serve_revalidated, url, revalidation_data, response, path, cache_key
+                    )
+                outcome = await self._run_blocking(self._classify_outcome, response)
+            except requests.RequestException as e:
+                logger.warning(f"Request failed (attempt {attempt+1}/{retry_count}): {e}")
+                error = e
+                outcome = self.escalation_policy.classify_exception(e)
+
+            action = await self._run_blocking(self._next_action, url, outcome, attempt, retry_count, response, path)
+
+            if action == ACTION_RETURN:
+                return await self._run_blocking(self._finish_http, url, response, path, should_use_cache, cache_key)
+            if action == ACTION_RENDER:
+                return await self._get_with_browser_async(browser_url, headers, retry_count - attempt, path, record=True)
+            if action == ACTION_FAIL:
+                return self._fail_fast(response, error, path)
+
+            # Sleep before retry
+            await asyncio.sleep(self.escalation_policy.retry_delay(attempt, response))
+
+        raise requests.RequestException(f"Failed to fetch {url} after all retries")
+
+    def _refresh_in_background_async(
+        self,
+        url: str,
+        cache_key: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        force_browser: bool,
+        retry_count: int,
+        timeout: int
+    ) -> bool:
+        """
+        Refresh a stale cache entry in a background task, once per cache entry at a time.
+
+        Args:
+            url: The URL to refresh
+            cache_key: Identifier of the stale entry, used to run one refresh per entry
+            params: Optional query parameters
+            headers: Optional HTTP headers
+            force_browser: Whether to force browser-based fetching
+            retry_count: Number of retries on failure
+            timeout: Request timeout in seconds
+
+        Returns:
+            bool: True if a refresh is running for the entry (started now or earlier)
+        """
+        with self._lock:
+            if cache_key in self._refreshing:
+                return True
+            self._refreshing.add(cache_key)
+
+        async def refresh() -> None:
+            try:
+                await self._afetch(url, params, headers, True, force_browser, retry_count, timeout)
+            except Exception as e:
+                logger.warning(f"Background refresh of {url} failed: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(cache_key)
+
+        # Keep a reference so the task is not garbage collected, and so aclose() can wait for it
+        task = asyncio.ensure_future(refresh())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+        return True
+
+    async def _get_with_aiohttp(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: int = 30
+    ) -> requests.Response:
+        """
+        Perform an HTTP GET request using aiohttp.
+
+        The aiohttp response is converted into a requests.Response so that the
+        detection and caching helpers of WebScraper can be reused unchanged.
+
+        Args:
+            url: The URL to fetch
+            params: Optional query parameters
+            headers: Optional HTTP headers
+            timeout: Request timeout in seconds
+
+        Returns:
+            requests.Response: The HTTP response
+
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        await self._ensure_loop_resources()
+
+        # Throttle requests to avoid overloading the host, without holding a concurrency slot
+        await self._respect_rate_limits_async(url)
+
+        # Prepare headers
+        request_headers = {"User-Agent": self.user_agent}
+        if headers:
+            request_headers.update(headers)
+
+        # Get proxy if proxy manager is available (aiohttp takes a single proxy URL)
+        proxy = None
+        if self.proxy_manager:
+            proxies = self.proxy_manager.get_requests_proxies()
+            if proxies:
+                proxy = proxies.get(url.split(':', 1)[0]) or proxies.get('http')
+                logger.debug(f"Using proxy for request to {url}")
+
+        async with self._semaphore:
+            try:
+                async with self._client_session.get(
+                    url,
+                    params=params,
+                    headers=request_headers,
+                    proxy=proxy,
+                    timeout=aiohttp.ClientTimeout(total=timeout)
+                ) as client_response:
+                    content = await client_response.read()
+
+                    # Create a Response-like object
+                    response = requests.Response()
+                    response.url = str(client_response.url)
+                    response._content = content
+                    response.status_code = client_response.status
+                    response.reason = client_response.reason
+                    response.headers = CaseInsensitiveDict(client_response.headers)
+                    response.encoding = client_response.charset
+            except asyncio.TimeoutError as e:
+                raise requests.exceptions.Timeout(f"Request to {url} timed out: {e}")
+            except aiohttp.ClientProxyConnectionError as e:
+                raise requests.exceptions.ProxyError(str(e))
+            except aiohttp.ClientConnectionError as e:
+                raise requests.exceptions.ConnectionError(str(e))
+            except aiohttp.ClientError as e:
+                raise requests.RequestException(str(e))
+
+        # Update last request time
+        self.last_request_time = time.time()
+
+        # Log the result
+        logger.info(f"Fetched {url} (Status: {response.status_code})")
+
+        return response
+
+    async def _get_with_browser_async(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        retry_count: int = 1,
+        path: Optional[List[Dict[str, Any]]] = None,
+        record: bool = False,
+        on_error: str = ACTION_FAIL
+    ) -> requests.Response:
+        """
+        Run the synchronous browser fallback in a worker thread.
+
+        Args:
+            url: The URL to fetch
+            headers: Optional HTTP headers
+            retry_count: Number of retries on failure
+            path: Escalation steps taken so far
+            record: Whether to remember the outcome in the per-domain fetch mode memory
+            on_error: Action recorded in the path if the browser fails
+
+        Returns:
+            requests.Response: A requests.Response-like object
+        """
+        fetch = functools.partial(
+            self._get_with_browser_escalated, url, headers, retry_count,
+            path if path is not None else [], record, on_error
+        )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, fetch)
+
+    async def _respect_rate_limits_async(self, url: str) -> None:
+        """
+        Non-blocking counterpart of `_respect_rate_limits`.
+
+        Args:
+            url: The URL about to be requested
+        """
+        wait_time = self.rate_limiter.reserve(url)
+        if wait_time > 0:
+            logger.debug(f"Rate limiting: sleeping for {wait_time:.2f} seconds")
+            await asyncio.sleep(wait_time)
@@ -0,0 +1,381 @@
+"""
+Browser Pool for the Web Scraping Toolkit.
+
+This module keeps Playwright browsers alive between renders so that each
+render only pays for a fresh browser context and the page navigation,
+instead of starting Playwright and launching Chromium every time. Renders
+run on a small set of threads owned by the pool, so the number of browsers
+stays bounded however many threads the callers use.
+"""
+
+import atexit
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, List, Any, Optional, Iterator, Tuple, Callable, TypeVar
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+from ..utils.logger import get_logger
+from ..utils.config import get_browser_config
+
+# Initialize logger
+logger = get_logger("browser_pool")
+
+# Whether the missing-psutil warning was already logged
+_psutil_warned = False
+
+T = TypeVar("T")
+
+class _BrowserSlot:
+    """A Playwright driver and browser owned by a single thread."""
+
+    def __init__(self, owner_thread: int):
+        self.owner_thread = owner_thread
+        self.playwright = None
+        self.browser = None
+        self.driver_pid: Optional[int] = None
+        self.pages_served = 0
+        self.closing = False
+
+class BrowserPool:
+    """
+    Pool of long-lived Playwright browsers.
+
+    This class provides:
+    - A bounded set of render threads, each with one persistent Chromium
+      (the Playwright sync API is thread-bound)
+    - A fresh, isolated browser context for every page it hands out
+    - Recycling after a number of pages or when browser memory grows too large
+    - Clean shutdown via `close()`, a context manager, or interpreter exit
+    """
+
+    def __init__(
+        self,
+        headless: bool = True,
+        max_pages_per_browser: Optional[int] = None,
+        max_memory_mb: Optional[int] = None,
+        launch_options: Optional[Dict[str, Any]] = None,
+        max_threads: Optional[int] = None
+    ):
+        """
+        Initialize the browser pool with optional custom settings.
+
+        Browsers are launched lazily, on the first page requested by each render thread.
+
+        Args:
+            headless: Whether to run browsers in headless mode
+            max_pages_per_browser: Pages served before a browser is recycled (overrides config)
+            max_memory_mb: Browser memory (RSS) that triggers a recycle (overrides config, 0 = no limit)
+            launch_options: Extra keyword arguments for `chromium.launch`
+            max_threads: Number of render threads, and so of browsers (overrides config)
+        """
+        # Load browser configuration
+        self.config = get_browser_config()
+
+        # Override configuration with constructor parameters if provided
+        self.headless = headless
+        self.max_pages_per_browser = max_pages_per_browser or self.config.get("max_pages_per_browser", 100)
+        self.max_memory_mb = max_memory_mb if max_memory_mb is not None else self.config.get("max_memory_mb", 1024)
+        self.launch_options = launch_options or {}
+        self.max_threads = max_threads or self.config.get("pool_threads", 4)
+        global _psutil_warned
+        if self.max_memory_mb and psutil is None and not _psutil_warned:
+            _psutil_warned = True
+            logger.warning(f"psutil is not installed, browsers will not be recycled at {self.max_memory_mb} MB. "
+                           "Install with: pip install psutil")
+
+        # Per-thread browser slots
+        self._local = threading.local()
+        self._slots: List[_BrowserSlot] = []
+        self._closed = False
+
+        # Render threads, started on the first render
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # Thread lock for the slot registry and driver start-up
+        self._lock = threading.Lock()
+
+        # Shut down cleanly when the interpreter exits
+        atexit.register(_close_pool_at_exit, weakref.ref(self))
+
+        logger.info(f"Browser pool initialized (recycle after {self.max_pages_per_browser} pages"
+                    f"{f' or {self.max_memory_mb} MB' if self.max_memory_mb else ''})")
+
+    def __enter__(self) -> "BrowserPool":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def render(
+        self,
+        fn: Callable[[Any, Any], T],
+        proxy: Optional[Dict[str, str]] = None,
+        context_options: Optional[Dict[str, Any]] = None,
+        extra_headers: Optional[Dict[str, str]] = None
+    ) -> T:
+        """
+        Call `fn(context, page)` with a fresh page on one of the pool's render threads.
+
+        The calling thread waits for the result. Playwright objects must not
+        leave `fn`, since they belong to the render thread.
+
+        Args:
+            fn: Function that renders the page and returns plain data
+            proxy: Optional Playwright proxy configuration for this context
+            context_options: Extra keyword arguments for `browser.new_context`
+            extra_headers: Optional HTTP headers sent with every request
+
+        Returns:
+            Whatever `fn` returns
+
+        Raises:
+            ImportError: If Playwright is not installed
+            RuntimeError: If the pool has been closed
+        """
+        def run() -> T:
+            with self.new_page(proxy, context_options, extra_headers) as (context, page):
+                return fn(context, page)
+
+        # Already on a render thread (a render calling back into the pool)
+        if getattr(self._local, 'render_thread', False):
+            return run()
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Browser pool is closed")
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_threads,
+                    thread_name_prefix="browser_pool",
+                    initializer=self._init_render_thread
+                )
+            future = self._executor.submit(run)
+        return future.result()
+
+    def _init_render_thread(self) -> None:
+        """Mark the current thread as one of the pool's render threads."""
+        self._local.render_thread = True
+
+    @contextmanager
+    def new_page(
+        self,
+        proxy: Optional[Dict[str, str]] = None,
+        context_options: Optional[Dict[str, Any]] = None,
+        extra_headers: Optional[Dict[str, str]] = None
+    ) -> Iterator[Tuple[Any, Any]]:
+        """
+        Hand out a page in a fresh browser context of this thread's browser.
+
+        The context is closed when the block exits; the browser stays alive.
+        Threads other than the pool's own get a browser of their own, so
+        callers with many or short-lived threads should use `render()`.
+
+        Args:
+            proxy: Optional Playwright proxy configuration for this context
+            context_options: Extra keyword arguments for `browser.new_context`
+            extra_headers: Optional HTTP headers sent with every request
+
+        Yields:
+            Tuple[Any, Any]: The Playwright browser context and page
+
+        Raises:
+            ImportError: If Playwright is not installed
+            RuntimeError: If the pool has been closed
+        """
+        if self._closed:
+            # Release this thread's browser if close() was called from another thread
+            slot = getattr(self._local, 'slot', None)
+            if slot is not None and slot.closing:
+                self._close_slot(slot)
+                slot.closing = False
+            raise RuntimeError("Browser pool is closed")
+
+        slot = self._get_slot()
+
+        options = dict(context_options or {})
+        if proxy:
+            options['proxy'] = proxy
+
+        context = slot.browser.new_context(**options)
+        try:
+            if extra_headers:
+                context.set_extra_http_headers(extra_headers)
+            page = context.new_page()
+            yield context, page
+        finally:
+            try:
+                context.close()
+            except Exception as e:
+                logger.debug(f"Error closing browser context: {e}")
+
+            slot.pages_served += 1
+            self._maybe_recycle(slot)
+
+    def _get_slot(self) -> _BrowserSlot:
+        """Get this thread's browser slot, starting Playwright and Chromium if needed."""
+        slot = getattr(self._local, 'slot', None)
+        if slot is None:
+            slot = _BrowserSlot(threading.get_ident())
+            self._local.slot = slot
+            with self._lock:
+                self._slots.append(slot)
+
+        # Another thread asked the pool to close this slot
+        if slot.closing:
+            self._close_slot(slot)
+            slot.closing = False
+
+        if slot.playwright is None:
+            self._start_driver(slot)
+
+        if slot.browser is None or not slot.browser.is_connected():
+            launch_options = {'headless': self.headless}
+            launch_options.update(self.launch_options)
+            slot.browser = slot.playwright.chromium.launch(**launch_options)
+            slot.pages_served = 0
+            logger.info("Launched pooled browser")
+
+        return slot
+
+    def _start_driver(self, slot: _BrowserSlot) -> None:
+        """Start the Playwright driver for a slot and remember its process id."""
+        # Only import Playwright when needed
+        from playwright.sync_api import sync_playwright
+
+        # Start drivers one at a time so the new child process can be attributed
+        with self._lock:
+            children_before = self._child_pids()
+            slot.playwright = sync_playwright().start()
+            new_children = self._child_pids() - children_before
+            slot.driver_pid = new_children.pop() if len(new_children) == 1 else None
+
+    def _maybe_recycle(self, slot: _BrowserSlot) -> None:
+        """Close the slot's browser if it has served too many pages or uses too much memory."""
+        reason = None
+        if slot.pages_served >= self.max_pages_per_browser:
+            reason = f"served {slot.pages_served} pages"
+        elif self.max_memory_mb:
+            memory_mb = self._browser_memory_mb(slot)
+            if memory_mb is not None and memory_mb > self.max_memory_mb:
+                reason = f"using {memory_mb:.0f} MB"
+
+        if reason:
+            logger.info(f"Recycling pooled browser ({reason})")
+            self._close_browser(slot)
+
+    def _browser_memory_mb(self, slot: _BrowserSlot) -> Optional[float]:
+        """
+        Measure the resident memory of a slot's browser processes.
+
+        Returns:
+            Optional[float]: Memory in MB, or None if it cannot be measured
+        """
+        if slot.driver_pid is None or psutil is None:
+            return None
+
+        try:
+            driver = psutil.Process(slot.driver_pid)
+            total = 0
+            for process in driver.children(recursive=True):
+                try:
+                    total += process.memory_info().rss
+                except psutil.Error:
+                    continue
+            return total / (1024 * 1024)
+        except psutil.Error:
+            return None
+
+    def _child_pids(self) -> set:
+        """Get the ids of this process's direct children (empty if psutil is unavailable)."""
+        if psutil is None:
+            return set()
+        try:
+            return {child.pid for child in psutil.Process().children()}
+        except Exception:
+            return set()
+
+    def _close_browser(self, slot: _BrowserSlot) -> None:
+        """Close a slot's browser, keeping its Playwright driver running."""
+        if slot.browser is not None:
+            try:
+                slot.browser.close()
+            except Exception as e:
+                logger.debug(f"Error closing pooled browser: {e}")
+            slot.browser = None
+        slot.pages_served = 0
+
+    def _close_slot(self, slot: _BrowserSlot) -> None:
+        """Close a slot's browser and stop its Playwright driver."""
+        self._close_browser(slot)
+        if slot.playwright is not None:
+            try:
+                slot.playwright.stop()
+            except Exception as e:
+                logger.debug(f"Error stopping Playwright driver: {e}")
+            slot.playwright = None
+            slot.driver_pid = None
+
+    def close(self) -> None:
+        """
+        Shut down the pool.
+
+        Each render thread closes its own browser (Playwright objects are
+        thread-bound) before the render threads exit. A browser the calling
+        thread got from `new_page()` is closed immediately; browsers of other
+        threads are flagged and closed on that thread's next use, and their
+        driver processes also exit with the interpreter.
+        """
+        with self._lock:
+            if self._closed and not any(slot.browser or slot.playwright for slot in self._slots):
+                return
+            self._closed = True
+            slots = list(self._slots)
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            # One teardown per render thread: each waits for the others, so no thread takes two
+            barrier = threading.Barrier(self.max_threads)
+            teardowns = []
+            try:
+                for _ in range(self.max_threads):
+                    teardowns.append(executor.submit(self._close_render_slot, barrier))
+            except RuntimeError as e:
+                # The interpreter is shutting down and no longer starts tasks
+                logger.debug(f"Could not close render thread browsers: {e}")
+                barrier.abort()
+            for teardown in teardowns:
+                teardown.result()
+            executor.shutdown(wait=True)
+
+        current_thread = threading.get_ident()
+        for slot in slots:
+            if slot.browser is None and slot.playwright is None:
+                continue
+            if slot.owner_thread == current_thread:
+                self._close_slot(slot)
+            else:
+                slot.closing = True
+
+        logger.info("Browser pool closed")
+
+    def _close_render_slot(self, barrier: threading.Barrier) -> None:
+        """Close the calling render thread's browser, then wait for the other render threads."""
+        slot = getattr(self._local, 'slot', None)
+        if slot is not None:
+            self._close_slot(slot)
+        try:
+            barrier.wait()
+        except threading.BrokenBarrierError:
+            pass
+
+def _close_pool_at_exit(pool_ref: "weakref.ref") -> None:
+    """Close a pool at interpreter exit if it is still alive."""
+    pool = pool_ref()
+    if pool is not None:
+        pool.close()
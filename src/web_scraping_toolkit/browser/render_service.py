@@ -0,0 +1,348 @@
+"""
+Render Service for the Web Scraping Toolkit.
+
+This module runs browser rendering in a set of worker processes, each owning
+its own long-lived browser. Render jobs are sent over a queue, so any number
+of scraper threads can render concurrently without launching Chromium
+themselves or touching the thread-bound Playwright sync API.
+"""
+
+import itertools
+import multiprocessing
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Any, Optional
+
+import requests
+
+from ..utils.logger import get_logger
+from ..utils.config import get_browser_config
+from .wait_policy import WaitPolicy, IdleBudgetWait
+
+# Initialize logger
+logger = get_logger("render_service")
+
+# Worker messages
+_MSG_STARTED = "started"
+_MSG_DONE = "done"
+
+# Seconds between checks for dead workers
+_WORKER_CHECK_INTERVAL = 1.0
+
+class RenderError(requests.RequestException):
+    """Raised when a render job fails or its worker dies."""
+
+def _render_worker(
+    worker_index: int,
+    job_queue: "multiprocessing.Queue",
+    result_queue: "multiprocessing.Queue",
+    pool_options: Dict[str, Any]
+) -> None:
+    """
+    Worker process main loop: render jobs with a process-local browser pool.
+
+    Args:
+        worker_index: Index of this worker, reported with every message
+        job_queue: Queue of render jobs (None stops the worker)
+        result_queue: Queue receiving progress and result messages
+        pool_options: Keyword arguments for the worker's BrowserPool
+    """
+    from .browser_pool import BrowserPool
+
+    pool = BrowserPool(**pool_options)
+    try:
+        while True:
+            job = job_queue.get()
+            if job is None:
+                break
+
+            result_queue.put((_MSG_STARTED, job['job_id'], worker_index, None))
+            try:
+                payload = _render_job(pool, job)
+                result_queue.put((_MSG_DONE, job['job_id'], worker_index, payload))
+            except Exception as e:
+                result_queue.put((_MSG_DONE, job['job_id'], worker_index, {'error': f"{type(e).__name__}: {e}"}))
+    finally:
+        pool.close()
+
+def _render_job(pool: Any, job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Render a single job in a fresh browser context.
+
+    Args:
+        pool: The worker's BrowserPool
+        job: The render job
+
+    Returns:
+        Dict[str, Any]: The rendered HTML, final URL, cookies, resource counters and wait condition
+    """
+    with pool.new_page(
+        proxy=job.get('proxy'),
+        context_options=job.get('context_options'),
+        extra_headers=job.get('headers')
+    ) as (context, page):
+        resource_stats = None
+        if job.get('resource_policy') is not None:
+            resource_stats = job['resource_policy'].apply(context)
+
+        wait_condition = (job.get('wait_policy') or IdleBudgetWait()).navigate(page, job['url'])
+        return {
+            'html': page.content(),
+            'url': page.url,
+            'cookies': context.cookies(),
+            'resource_stats': resource_stats,
+            'wait_condition': wait_condition
+        }
+
+class RenderService:
+    """
+    Pool of browser worker processes serving render jobs over IPC.
+
+    This class provides:
+    - A configurable number of worker processes, each with its own browser
+    - Thread-safe `render` / `submit` calls returning HTML, final URL and cookies
+    - Detection and replacement of crashed workers (their job fails with RenderError)
+    - Clean shutdown via `close()` or a context manager
+    """
+
+    def __init__(
+        self,
+        num_workers: Optional[int] = None,
+        headless: bool = True,
+        max_pages_per_browser: Optional[int] = None,
+        max_memory_mb: Optional[int] = None
+    ):
+        """
+        Initialize the render service with optional custom settings.
+
+        Worker processes are started on the first submitted job.
+
+        Args:
+            num_workers: Number of worker processes (overrides config)
+            headless: Whether workers run browsers in headless mode
+            max_pages_per_browser: Pages served before a worker's browser is recycled
+            max_memory_mb: Browser memory (RSS) that triggers a recycle
+        """
+        # Load browser configuration
+        self.config = get_browser_config()
+
+        # Override configuration with constructor parameters if provided
+        self.num_workers = num_workers or self.config.get("render_workers", 2)
+        self.pool_options = {
+            'headless': headless,
+            'max_pages_per_browser': max_pages_per_browser,
+            'max_memory_mb': max_memory_mb
+        }
+
+        # Spawned workers do not inherit the parent's threads or Playwright state
+        self._mp_context = multiprocessing.get_context("spawn")
+        self._job_queue = None
+        self._result_queue = None
+        self._workers: List[Any] = []
+        self._worker_jobs: Dict[int, Optional[int]] = {}
+
+        # Outstanding jobs by id
+        self._futures: Dict[int, Future] = {}
+        self._job_ids = itertools.count(1)
+
+        self._dispatcher: Optional[threading.Thread] = None
+        self._started = False
+        self._closed = False
+
+        # Thread lock for start-up and the job registry
+        self._lock = threading.Lock()
+
+        logger.info(f"Render service initialized with {self.num_workers} workers")
+
+    def __enter__(self) -> "RenderService":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _start(self) -> None:
+        """Start the worker processes and the result dispatcher (lock must be held)."""
+        if self._started:
+            return
+
+        self._job_queue = self._mp_context.Queue()
+        self._result_queue = self._mp_context.Queue()
+        for index in range(self.num_workers):
+            self._workers.append(self._spawn_worker(index))
+
+        self._dispatcher = threading.Thread(target=self._dispatch_results, name="render_dispatcher", daemon=True)
+        self._dispatcher.start()
+        self._started = True
+        logger.info(f"Started {self.num_workers} render workers")
+
+    def _spawn_worker(self, index: int) -> Any:
+        """Start a single worker process."""
+        process = self._mp_context.Process(
+            target=_render_worker,
+            args=(index, self._job_queue, self._result_queue, self.pool_options),
+            name=f"render_worker_{index}",
+            daemon=True
+        )
+        process.start()
+        self._worker_jobs[index] = None
+        return process
+
+    def submit(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        proxy: Optional[Dict[str, str]] = None,
+        context_options: Optional[Dict[str, Any]] = None,
+        wait_policy: Optional[WaitPolicy] = None,
+        resource_policy: Optional[Any] = None
+    ) -> Future:
+        """
+        Queue a render job.
+
+        Args:
+            url: The URL to render
+            headers: Optional HTTP headers sent with every request
+            proxy: Optional Playwright proxy configuration
+            context_options: Extra keyword arguments for `browser.new_context`
+            wait_policy: Policy deciding when the page is ready (defaults to a bounded network-idle wait)
+            resource_policy: Optional ResourceBlockPolicy applied in the worker
+
+        Returns:
+            Future: Resolves to a dict with 'html', 'url', 'cookies', 'resource_stats' and 'wait_condition'
+
+        Raises:
+            RuntimeError: If the service has been closed
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Render service is closed")
+            self._start()
+
+            job_id = next(self._job_ids)
+            future: Future = Future()
+            self._futures[job_id] = future
+
+        self._job_queue.put({
+            'job_id': job_id,
+            'url': url,
+            'headers': headers,
+            'proxy': proxy,
+            'context_options': context_options,
+            'wait_policy': wait_policy,
+            'resource_policy': resource_policy
+        })
+        return future
+
+    def render(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        proxy: Optional[Dict[str, str]] = None,
+        context_options: Optional[Dict[str, Any]] = None,
+        wait_policy: Optional[WaitPolicy] = None,
+        resource_policy: Optional[Any] = None
+    ) -> Dict[str, Any]:
+        """
+        Render a URL in a worker process and wait for the result.
+
+        Args:
+            url: The URL to render
+            headers: Optional HTTP headers sent with every request
+            proxy: Optional Playwright proxy configuration
+            context_options: Extra keyword arguments for `browser.new_context`
+            wait_policy: Policy deciding when the page is ready (defaults to a bounded network-idle wait)
+            resource_policy: Optional ResourceBlockPolicy applied in the worker
+
+        Returns:
+            Dict[str, Any]: The rendered 'html', final 'url', 'cookies', 'resource_stats' and 'wait_condition'
+
+        Raises:
+            RenderError: If the render fails, its worker dies, or no result arrives in time
+        """
+        wait_policy = wait_policy or IdleBudgetWait()
+        future = self.submit(url, headers, proxy, context_options, wait_policy, resource_policy)
+        try:
+            # Allow time for queueing and browser start-up on top of navigation
+            return future.result(timeout=wait_policy.timeout * 2 + 30)
+        except RenderError:
+            raise
+        except Exception as e:
+            raise RenderError(f"Render of {url} did not complete: {e}")
+
+    def _dispatch_results(self) -> None:
+        """Route worker messages to futures and replace workers that died."""
+        next_check = time.monotonic() + _WORKER_CHECK_INTERVAL
+        while True:
+            # Check workers on a deadline, so a crash is noticed even while
+            # the other workers keep the result queue busy
+            now = time.monotonic()
+            if now >= next_check:
+                if self._closed:
+                    return
+                self._check_workers()
+                next_check = now + _WORKER_CHECK_INTERVAL
+            try:
+                message, job_id, worker_index, payload = self._result_queue.get(timeout=max(next_check - now, 0))
+            except queue.Empty:
+                continue
+            except (EOFError, OSError):
+                return
+
+            with self._lock:
+                if message == _MSG_STARTED:
+                    self._worker_jobs[worker_index] = job_id
+                    continue
+                self._worker_jobs[worker_index] = None
+                future = self._futures.pop(job_id, None)
+
+            if future is None:
+                continue
+            if 'error' in payload:
+                future.set_exception(RenderError(payload['error']))
+            else:
+                future.set_result(payload)
+
+    def _check_workers(self) -> None:
+        """Fail the job of any dead worker and start a replacement."""
+        with self._lock:
+            for index, process in enumerate(self._workers):
+                if process.is_alive() or self._closed:
+                    continue
+
+                logger.warning(f"Render worker {index} exited with code {process.exitcode}, restarting")
+                job_id = self._worker_jobs.get(index)
+                future = self._futures.pop(job_id, None) if job_id is not None else None
+                if future is not None:
+                    future.set_exception(RenderError(f"Render worker {index} died while rendering"))
+                self._workers[index] = self._spawn_worker(index)
+
+    def close(self, timeout: float = 10.0) -> None:
+        """
+        Stop all workers and fail any jobs still outstanding.
+
+        Args:
+            timeout: Seconds to wait for each worker to exit before terminating it
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            workers = list(self._workers)
+            futures = list(self._futures.values())
+            self._futures.clear()
+
+        if self._started:
+            for _ in workers:
+                self._job_queue.put(None)
+            for process in workers:
+                process.join(timeout)
+                if process.is_alive():
+                    process.terminate()
+
+        for future in futures:
+            if not future.done():
+                future.set_exception(RenderError("Render service closed"))
+
+        logger.info("Render service closed")
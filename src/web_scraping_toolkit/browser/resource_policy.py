@@ -0,0 +1,162 @@
+"""
+Resource Blocking Policy for the Web Scraping Toolkit.
+
+This module blocks sub-resources that never end up in `page.content()`
+(images, fonts, media, optionally stylesheets) and requests to analytics and
+ad domains, using Playwright request routing. Each render gets counters of
+blocked and allowed requests so the savings can be measured.
+"""
+
+from typing import Dict, Any, Optional, Iterable
+from urllib.parse import urlparse
+
+from ..utils.logger import get_logger
+from ..utils.config import get_browser_config
+
+# Initialize logger
+logger = get_logger("resource_policy")
+
+# Resource types blocked by default (Playwright `request.resource_type` values)
+DEFAULT_BLOCKED_RESOURCE_TYPES = ["image", "font", "media"]
+
+# Analytics, tag-manager and advertising domains blocked by default
+DEFAULT_BLOCKED_DOMAINS = [
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "doubleclick.net",
+    "adservice.google.com",
+    "amazon-adsystem.com",
+    "facebook.net",
+    "connect.facebook.net",
+    "hotjar.com",
+    "scorecardresearch.com",
+    "quantserve.com",
+    "chartbeat.com",
+    "criteo.com",
+    "taboola.com",
+    "outbrain.com",
+    "segment.io",
+    "mixpanel.com",
+    "adnxs.com",
+]
+
+class ResourceBlockPolicy:
+    """
+    Policy deciding which browser requests to abort.
+
+    This class provides:
+    - Blocking by resource type (image, font, media, stylesheet, ...)
+    - Blocking by domain, covering subdomains of each listed domain
+    - `apply()` to install the policy on a Playwright context or page
+    - Per-render counters of blocked and allowed requests
+    """
+
+    def __init__(
+        self,
+        blocked_resource_types: Optional[Iterable[str]] = None,
+        blocked_domains: Optional[Iterable[str]] = None,
+        enabled: Optional[bool] = None
+    ):
+        """
+        Initialize the resource blocking policy with optional custom settings.
+
+        Args:
+            blocked_resource_types: Resource types to abort (overrides config)
+            blocked_domains: Domains whose requests are aborted (overrides config)
+            enabled: Whether blocking is enabled (overrides config)
+        """
+        # Load browser configuration
+        config = get_browser_config()
+
+        # Override configuration with constructor parameters if provided
+        self.enabled = enabled if enabled is not None else config.get("block_enabled", True)
+        if blocked_resource_types is None:
+            blocked_resource_types = config.get("block_resource_types") or DEFAULT_BLOCKED_RESOURCE_TYPES
+        if blocked_domains is None:
+            blocked_domains = DEFAULT_BLOCKED_DOMAINS + config.get("block_domains", [])
+
+        self.blocked_resource_types = {t.strip().lower() for t in blocked_resource_types if t.strip()}
+        self.blocked_domains = {d.strip().lower().lstrip(".") for d in blocked_domains if d.strip()}
+
+    def should_block(self, resource_type: str, url: str) -> Optional[str]:
+        """
+        Decide whether a request should be aborted.
+
+        Args:
+            resource_type: The Playwright resource type of the request
+            url: The request URL
+
+        Returns:
+            Optional[str]: The reason for blocking ('type' or 'domain'), or None to allow
+        """
+        if not self.enabled:
+            return None
+
+        if resource_type in self.blocked_resource_types:
+            return "type"
+
+        host = (urlparse(url).hostname or "").lower()
+        while host:
+            if host in self.blocked_domains:
+                return "domain"
+            host = host.partition(".")[2]
+
+        return None
+
+    def apply(self, target: Any) -> Dict[str, Any]:
+        """
+        Install the policy on a Playwright browser context or page.
+
+        Must be called before navigation. The returned counters are updated
+        live while the page loads.
+
+        Args:
+            target: A Playwright BrowserContext or Page
+
+        Returns:
+            Dict[str, Any]: Counters with 'allowed', 'blocked', and blocked counts by resource type
+        """
+        stats: Dict[str, Any] = {
+            'allowed': 0,
+            'blocked': 0,
+            'blocked_by_type': {},
+            'blocked_by_domain': 0
+        }
+
+        if not self.enabled:
+            return stats
+
+        def handle_route(route: Any, request: Any) -> None:
+            resource_type = request.resource_type
+            reason = self.should_block(resource_type, request.url)
+            if reason is None:
+                stats['allowed'] += 1
+                route.continue_()
+                return
+
+            stats['blocked'] += 1
+            if reason == "domain":
+                stats['blocked_by_domain'] += 1
+            else:
+                stats['blocked_by_type'][resource_type] = stats['blocked_by_type'].get(resource_type, 0) + 1
+            route.abort()
+
+        target.route("**/*", handle_route)
+        return stats
+
+def summarize_stats(stats: Optional[Dict[str, Any]]) -> str:
+    """
+    Format resource counters for logging.
+
+    Args:
+        stats: Counters returned by `ResourceBlockPolicy.apply`
+
+    Returns:
+        str: A short human-readable summary
+    """
+    if not stats:
+        return "no resource stats"
+    total = stats['allowed'] + stats['blocked']
+    return f"blocked {stats['blocked']}/{total} requests ({stats['blocked_by_domain']} by domain)"
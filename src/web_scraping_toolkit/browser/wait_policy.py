@@ -0,0 +1,276 @@
+"""
+Wait Policies for the Web Scraping Toolkit.
+
+This module decides when a rendered page is ready to be read. Instead of a
+single hard-coded `networkidle` wait, a policy can wait for a load state, for
+a selector to appear, for the page text to stop changing, or for network idle
+within a fixed budget. Every wait is bounded and reports the condition that
+ended it, so pages with long-polling or analytics beacons never stall a render.
+
+Policies are plain picklable objects so they can be sent to render workers.
+"""
+
+import time
+from typing import Dict, Any, Optional, Union
+
+from ..utils.config import get_browser_config
+from ..utils.domain_rules import get_host, match_domain_rule
+
+# Condition reported when a wait ran out of time
+CONDITION_TIMEOUT = "timeout"
+
+def _timeout_error() -> type:
+    """Return the Playwright timeout exception class."""
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+    return PlaywrightTimeoutError
+
+def _ms(seconds: float) -> int:
+    """Convert seconds to a Playwright timeout, where 0 would mean "no timeout"."""
+    return max(1, int(seconds * 1000))
+
+class WaitPolicy:
+    """
+    Base class for wait policies.
+
+    A policy navigates with `goto(wait_until=self.navigation_state)` and then
+    runs its own wait with whatever is left of `timeout`. Navigation errors
+    propagate; an expired wait returns "timeout" and the page is read as is.
+    """
+
+    # Load state that ends `page.goto`
+    navigation_state = "domcontentloaded"
+
+    def __init__(self, timeout: float = 30.0):
+        """
+        Initialize the wait policy.
+
+        Args:
+            timeout: Total seconds allowed for navigation plus waiting
+        """
+        self.timeout = timeout
+
+    def navigate(self, page: Any, url: str) -> str:
+        """
+        Navigate to a URL and wait until the page is ready.
+
+        Args:
+            page: A Playwright page
+            url: The URL to open
+
+        Returns:
+            str: The condition that ended the wait
+        """
+        deadline = time.monotonic() + self.timeout
+        page.goto(url, wait_until=self.navigation_state, timeout=_ms(self.timeout))
+        return self.wait(page, max(0.0, deadline - time.monotonic()))
+
+    def wait(self, page: Any, timeout: Optional[float] = None) -> str:
+        """
+        Wait on an already loaded page, e.g. after solving a CAPTCHA.
+
+        Args:
+            page: A Playwright page
+            timeout: Seconds to wait at most (defaults to the policy timeout)
+
+        Returns:
+            str: The condition that ended the wait
+        """
+        return self.navigation_state
+
+    def __repr__(self) -> str:
+        options = ", ".join(f"{key}={value!r}" for key, value in vars(self).items())
+        return f"{type(self).__name__}({options})"
+
+class LoadStateWait(WaitPolicy):
+    """Wait for a Playwright load state: 'domcontentloaded', 'load' or 'networkidle'."""
+
+    def __init__(self, state: str = "load", timeout: float = 30.0):
+        """
+        Initialize the load-state wait.
+
+        Args:
+            state: The load state to wait for
+            timeout: Total seconds allowed for navigation plus waiting
+        """
+        super().__init__(timeout)
+        self.state = state
+
+    def wait(self, page: Any, timeout: Optional[float] = None) -> str:
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            page.wait_for_load_state(self.state, timeout=_ms(timeout))
+        except _timeout_error():
+            return CONDITION_TIMEOUT
+        return self.state
+
+class SelectorWait(WaitPolicy):
+    """Wait after DOMContentLoaded until a CSS selector matches."""
+
+    def __init__(self, selector: str, state: str = "attached", timeout: float = 15.0):
+        """
+        Initialize the selector wait.
+
+        Args:
+            selector: The CSS selector of the content to wait for
+            state: Element state to wait for ('attached' or 'visible')
+            timeout: Total seconds allowed for navigation plus waiting
+        """
+        super().__init__(timeout)
+        self.selector = selector
+        self.state = state
+
+    def wait(self, page: Any, timeout: Optional[float] = None) -> str:
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            page.wait_for_selector(self.selector, state=self.state, timeout=_ms(timeout))
+        except _timeout_error():
+            return CONDITION_TIMEOUT
+        return "selector"
+
+class TextStableWait(WaitPolicy):
+    """Wait after DOMContentLoaded until the length of the page text stops changing."""
+
+    def __init__(
+        self,
+        stable_for: float = 1.0,
+        interval: float = 0.25,
+        min_length: int = 0,
+        timeout: float = 15.0
+    ):
+        """
+        Initialize the text-stabilisation wait.
+
+        Args:
+            stable_for: Seconds the text length must stay unchanged
+            interval: Seconds between measurements
+            min_length: Text length required before the page counts as stable
+            timeout: Total seconds allowed for navigation plus waiting
+        """
+        super().__init__(timeout)
+        self.stable_for = stable_for
+        self.interval = interval
+        self.min_length = min_length
+
+    def wait(self, page: Any, timeout: Optional[float] = None) -> str:
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        last_length = -1
+        stable_since = time.monotonic()
+
+        while True:
+            length = page.evaluate("() => document.body ? document.body.innerText.length : 0")
+            now = time.monotonic()
+            if length != last_length:
+                last_length = length
+                stable_since = now
+            elif length >= self.min_length and now - stable_since >= self.stable_for:
+                return "text_stable"
+
+            if now >= deadline:
+                return CONDITION_TIMEOUT
+            # wait_for_timeout keeps Playwright's event loop (and request routing) running
+            page.wait_for_timeout(_ms(min(self.interval, deadline - now)))
+
+class IdleBudgetWait(WaitPolicy):
+    """Wait after DOMContentLoaded for network idle, but never longer than a fixed budget."""
+
+    def __init__(self, budget: float = 5.0, timeout: float = 30.0):
+        """
+        Initialize the idle-budget wait.
+
+        Args:
+            budget: Maximum seconds to wait for network idle once the DOM is loaded
+            timeout: Total seconds allowed for navigation plus waiting
+        """
+        super().__init__(timeout)
+        self.budget = budget
+
+    def wait(self, page: Any, timeout: Optional[float] = None) -> str:
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            page.wait_for_load_state("networkidle", timeout=_ms(min(self.budget, timeout)))
+        except _timeout_error():
+            return "idle_budget"
+        return "networkidle"
+
+def wait_policy_from_spec(spec: Union[str, Dict[str, Any], WaitPolicy]) -> WaitPolicy:
+    """
+    Build a wait policy from a configuration value.
+
+    Accepted strategies are 'domcontentloaded', 'load', 'networkidle',
+    'selector', 'text_stable' and 'idle_budget'. Remaining keys are passed to
+    the policy, e.g. {"strategy": "selector", "selector": "article", "timeout": 10}.
+
+    Args:
+        spec: A strategy name, a dict with a 'strategy' key, or a ready policy
+
+    Returns:
+        WaitPolicy: The wait policy
+
+    Raises:
+        ValueError: If the strategy is unknown
+    """
+    if isinstance(spec, WaitPolicy):
+        return spec
+    if isinstance(spec, str):
+        spec = {"strategy": spec}
+
+    options = dict(spec)
+    strategy = options.pop("strategy", "idle_budget")
+
+    if strategy in ("domcontentloaded", "load", "networkidle"):
+        return LoadStateWait(state=strategy, **options)
+    if strategy == "selector":
+        return SelectorWait(**options)
+    if strategy == "text_stable":
+        return TextStableWait(**options)
+    if strategy == "idle_budget":
+        return IdleBudgetWait(**options)
+    raise ValueError(f"Unknown wait strategy: {strategy}")
+
+class DomainWaitPolicies:
+    """
+    Wait policies resolved per domain.
+
+    This class provides:
+    - A default policy (bounded network idle unless configured otherwise)
+    - Per-domain or glob-pattern overrides (e.g. "example.com", "*.gov")
+    - Policies loaded from BROWSER_WAIT_DEFAULT / BROWSER_WAIT_RULES
+    """
+
+    def __init__(
+        self,
+        default: Optional[Union[str, Dict[str, Any], WaitPolicy]] = None,
+        rules: Optional[Dict[str, Union[str, Dict[str, Any], WaitPolicy]]] = None
+    ):
+        """
+        Initialize the per-domain wait policies with optional custom settings.
+
+        Args:
+            default: Policy used when no rule matches (overrides config)
+            rules: Mapping of domain or glob pattern to a policy or spec (overrides config)
+        """
+        # Load browser configuration
+        config = get_browser_config()
+
+        # Override configuration with constructor parameters if provided
+        if default is None:
+            default = config.get("wait_default") or IdleBudgetWait()
+        if rules is None:
+            rules = config.get("wait_rules", {})
+
+        self.default = wait_policy_from_spec(default)
+        self.rules = {pattern: wait_policy_from_spec(spec) for pattern, spec in rules.items()}
+
+    def for_url(self, url: str) -> WaitPolicy:
+        """
+        Get the wait policy for a URL.
+
+        Args:
+            url: The URL about to be rendered
+
+        Returns:
+            WaitPolicy: The most specific matching policy, or the default
+        """
+        match = match_domain_rule(get_host(url), self.rules)
+        return self.rules[match] if match is not None else self.default
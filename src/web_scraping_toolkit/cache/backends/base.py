@@ -0,0 +1,137 @@
+"""
+Cache Backend Interface for the Web Scraping Toolkit.
+
+This module defines the operations `CacheMechanism` needs from a storage
+backend. Backends work with hashed cache keys and two kinds of records:
+
+- entries: dicts with 'id', 'data', 'timestamp', 'date' and an optional 'ttl'
+- status records: dicts with 'id' and 'processed_stages'
+
+Deleting an entry also deletes its status record. Expiry policy stays in
+`CacheMechanism`; backends only answer age queries.
+
+Persistent backends may be shared by several processes using the same cache
+directory; `poll_changes` reports what the other processes wrote.
+
+Compressed entry data carries its payload as raw bytes under `BODY_FIELD`
+(see `compressed_backend`). Backends that can store binary keep those bytes
+out of the JSON; `split_body` separates them and `join_body` puts them back.
+"""
+
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Tuple
+
+# (key, item id, timestamp, ttl or None)
+EntryMeta = Tuple[str, Optional[str], float, Optional[float]]
+
+# Field of a data dict holding raw bytes
+BODY_FIELD = "payload"
+
+def split_body(data: Any) -> Tuple[Any, Optional[bytes]]:
+    """
+    Separate the raw bytes an entry's data carries.
+
+    Args:
+        data: Entry data
+
+    Returns:
+        Tuple of (data without the bytes, the bytes or None if it has none)
+    """
+    if isinstance(data, dict) and isinstance(data.get(BODY_FIELD), bytes):
+        data = dict(data)
+        return data, data.pop(BODY_FIELD)
+    return data, None
+
+def join_body(data: Any, body: Optional[bytes]) -> Any:
+    """Put bytes separated by `split_body` back into an entry's data."""
+    if body is None:
+        return data
+    return dict(data, **{BODY_FIELD: bytes(body)})
+
+class CacheBackend:
+    """
+    Base class for cache storage backends.
+
+    Subclasses implement the storage operations; `expired_keys` and
+    `keys_older_than` fall back to `scan` and may be overridden with
+    something faster.
+    """
+
+    # Short name used in configuration (CACHE_BACKEND)
+    name = ""
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cache entry, or None if absent."""
+        raise NotImplementedError
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """Store a cache entry, replacing any existing one."""
+        raise NotImplementedError
+
+    def put_many(self, entries: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """Store several cache entries (used for bulk imports)."""
+        for key, entry in entries:
+            self.put(key, entry)
+
+    def delete(self, keys: Iterable[str]) -> int:
+        """
+        Delete entries and their processing status.
+
+        Returns:
+            int: Number of entries removed
+        """
+        raise NotImplementedError
+
+    def scan(self) -> Iterator[EntryMeta]:
+        """
+        Iterate over entry metadata without loading bodies.
+
+        Yields:
+            Tuple of (key, item id, timestamp, ttl or None)
+        """
+        raise NotImplementedError
+
+    def expired_keys(self, cutoff: float, default_ttl: float) -> List[str]:
+        """Get keys of entries whose lifetime ended before `cutoff`."""
+        return [key for key, _, timestamp, ttl in self.scan()
+                if cutoff - timestamp > (default_ttl if ttl is None else ttl)]
+
+    def keys_older_than(self, cutoff: float) -> List[str]:
+        """Get keys of entries stored before `cutoff`."""
+        return [key for key, _, timestamp, _ in self.scan() if timestamp < cutoff]
+
+    def get_status(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the processing status record of an entry, or None if absent."""
+        raise NotImplementedError
+
+    def put_status(self, key: str, status: Dict[str, Any]) -> None:
+        """Store the processing status record of an entry."""
+        raise NotImplementedError
+
+    def put_status_many(self, statuses: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """Store several processing status records (used for bulk imports)."""
+        for key, status in statuses:
+            self.put_status(key, status)
+
+    def count(self) -> int:
+        """Get the number of cached entries."""
+        raise NotImplementedError
+
+    def poll_changes(self) -> Tuple[List[EntryMeta], Optional[List[str]]]:
+        """
+        Get the entries other processes wrote or deleted since the last call.
+
+        Writes made through this backend instance are not reported. Backends
+        that are not shared between processes report nothing.
+
+        Returns:
+            Tuple of (metadata of written entries, deleted keys); deleted keys
+            are None if the backend cannot tell which keys were deleted
+        """
+        return [], []
+
+    def clear(self) -> int:
+        """Remove all entries and status records, returning the number of entries removed."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release resources held by the backend."""
@@ -0,0 +1,353 @@
+"""
+Compressed Cache Backend for the Web Scraping Toolkit.
+
+This module compresses the `data` of cache entries before they reach a
+persistent backend, and decompresses it on the way back, so callers never
+see the difference. Pages from one site share most of their markup, so with
+zstd a dictionary can be trained per domain from the first pages cached for
+it; later pages then compress to a fraction of what they would on their own.
+Dictionaries are saved in the cache directory, so other processes and later
+runs can read entries compressed with them.
+
+Compressed data is a record whose payload is raw bytes:
+
+    {"__compressed__": "zstd", "dict_id": 123, "size": 51234, "payload": b"(\xb5/\xfd..."}
+
+The SQLite backend keeps the payload in a BLOB column and the filesystem
+backend in a binary file next to the entry; the JSON backend stores it as
+base64 text, which is also how earlier versions stored it everywhere.
+
+zstd requires the optional `zstandard` package; without it zlib is used.
+"""
+
+import os
+import json
+import zlib
+import base64
+import threading
+from urllib.parse import urlsplit
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Tuple
+
+from ...utils.logger import get_logger
+from .base import CacheBackend, EntryMeta, BODY_FIELD
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Initialize logger
+logger = get_logger("compressed_backend")
+
+MARKER = "__compressed__"
+
+# Size of trained dictionaries
+DICT_SIZE = 64 * 1024
+
+# Bytes of each page kept as a dictionary training sample
+MAX_SAMPLE_BYTES = 128 * 1024
+
+class PayloadCodec:
+    """
+    Compresses cache data, optionally with dictionaries trained per domain.
+
+    Counts raw and stored bytes of the data it encodes, in total and per domain.
+    A codec serves one cache (namespace), and the counts only cover the data
+    encoded since it was created.
+    """
+
+    def __init__(
+        self,
+        codec: str = "zlib",
+        level: int = 3,
+        min_bytes: int = 512,
+        dictionary_dir: Optional[str] = None,
+        dict_samples: int = 0
+    ):
+        """
+        Initialize the codec and load saved dictionaries.
+
+        Args:
+            codec: 'zstd', 'zlib' or 'none' (store data as is, only decode data compressed earlier);
+                'zstd' falls back to 'zlib' if zstandard is not installed
+            level: Compression level
+            min_bytes: Data smaller than this (serialized) is stored uncompressed
+            dictionary_dir: Directory where trained dictionaries are kept (None = no dictionaries)
+            dict_samples: Pages per domain to train a dictionary from (0 = compress without
+                dictionaries; zstd only). Entries compressed with a dictionary can be read either way
+        """
+        if codec == "zstd" and zstandard is None:
+            logger.warning("zstandard is not installed, compressing cache data with zlib. "
+                           "Install with: pip install zstandard")
+            codec = "zlib"
+        if codec not in ("zstd", "zlib", "none"):
+            raise ValueError(f"Unknown cache compression: {codec} (expected zstd, zlib or none)")
+        self.codec = codec
+        self.level = level
+        self.min_bytes = min_bytes
+        self.dictionary_dir = dictionary_dir
+        self.dict_samples = dict_samples if codec == "zstd" and dictionary_dir else 0
+
+        self._lock = threading.Lock()
+        # Per-thread zstd (de)compressors by dictionary id (0 = none); they are not thread-safe
+        self._local = threading.local()
+        self._dicts: Dict[int, Any] = {}
+        self._domain_dicts: Dict[str, int] = {}
+        # Training samples of domains without a dictionary yet
+        self._samples: Dict[str, List[bytes]] = {}
+
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+        if self.dict_samples:
+            os.makedirs(self.dictionary_dir, exist_ok=True)
+            for filename in sorted(os.listdir(self.dictionary_dir)):
+                if filename.endswith(".zdict"):
+                    domain, dict_id = self._load_dictionary(filename)
+                    if dict_id:
+                        self._domain_dicts[domain] = dict_id
+
+    def _load_dictionary(self, filename: str) -> Tuple[str, int]:
+        """Load a `<domain>.<dict id>.zdict` file, returning (domain, dict id or 0)."""
+        domain, dict_id = filename[:-len(".zdict")].rsplit(".", 1)
+        try:
+            with open(os.path.join(self.dictionary_dir, filename), 'rb') as f:
+                dictionary = zstandard.ZstdCompressionDict(f.read())
+        except Exception as e:
+            logger.error(f"Error loading compression dictionary {filename}: {e}")
+            return domain, 0
+        with self._lock:
+            self._dicts[int(dict_id)] = dictionary
+        return domain, int(dict_id)
+
+    def _dictionary(self, dict_id: int) -> Any:
+        """Get a dictionary by id, loading it if another process trained it."""
+        dictionary = self._dicts.get(dict_id)
+        if dictionary is None and self.dictionary_dir and os.path.isdir(self.dictionary_dir):
+            suffix = f".{dict_id}.zdict"
+            for filename in os.listdir(self.dictionary_dir):
+                if filename.endswith(suffix):
+                    self._load_dictionary(filename)
+            dictionary = self._dicts.get(dict_id)
+        return dictionary
+
+    def _zstd(self, kind: str, dict_id: int) -> Any:
+        """Get the calling thread's zstd compressor or decompressor for a dictionary."""
+        cache = getattr(self._local, kind, None)
+        if cache is None:
+            cache = {}
+            setattr(self._local, kind, cache)
+        worker = cache.get(dict_id)
+        if worker is None:
+            dictionary = self._dictionary(dict_id) if dict_id else None
+            if dict_id and dictionary is None:
+                raise ValueError(f"Compression dictionary {dict_id} not found")
+            if kind == "compressor":
+                worker = zstandard.ZstdCompressor(level=self.level, dict_data=dictionary)
+            else:
+                worker = zstandard.ZstdDecompressor(dict_data=dictionary)
+            cache[dict_id] = worker
+        return worker
+
+    @staticmethod
+    def domain_of(item_id: Optional[str]) -> str:
+        """Get the host of a URL item id, or '' for other ids."""
+        if item_id and item_id.startswith(('http://', 'https://')):
+            return urlsplit(item_id.split(" |", 1)[0]).hostname or ""
+        return ""
+
+    def _train(self, domain: str, raw: bytes) -> None:
+        """Collect a training sample and train the domain's dictionary once there are enough."""
+        with self._lock:
+            if domain in self._domain_dicts:
+                return
+            samples = self._samples.setdefault(domain, [])
+            samples.append(raw[:MAX_SAMPLE_BYTES])
+            if len(samples) < self.dict_samples:
+                return
+            del self._samples[domain]
+            # Don't collect again, whether or not training succeeds
+            self._domain_dicts[domain] = 0
+
+        try:
+            dictionary = zstandard.train_dictionary(DICT_SIZE, samples, level=self.level)
+            dict_id = dictionary.dict_id()
+            # Saved before use, so every entry's dictionary can be found by other processes
+            path = os.path.join(self.dictionary_dir, f"{domain}.{dict_id}.zdict")
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(dictionary.as_bytes())
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not train a compression dictionary for {domain}: {e}")
+            return
+        with self._lock:
+            self._dicts[dict_id] = dictionary
+            self._domain_dicts[domain] = dict_id
+        logger.info(f"Trained a {len(dictionary.as_bytes())} byte compression dictionary for {domain}")
+
+    def _count(self, domain: str, raw_bytes: int, stored_bytes: int) -> None:
+        with self._lock:
+            for name in ("", domain):
+                counts = self._stats.setdefault(name, {'entries': 0, 'raw_bytes': 0, 'stored_bytes': 0})
+                counts['entries'] += 1
+                counts['raw_bytes'] += raw_bytes
+                counts['stored_bytes'] += stored_bytes
+
+    def encode(self, item_id: Optional[str], data: Any) -> Any:
+        """
+        Compress data for storage.
+
+        Args:
+            item_id: The item id the data belongs to (selects the domain dictionary)
+            data: JSON-serializable data
+
+        Returns:
+            Any: A compressed record, or the data itself if it is too small to bother
+        """
+        if self.codec == "none":
+            return data
+        domain = self.domain_of(item_id)
+        raw = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        if len(raw) < self.min_bytes:
+            self._count(domain, len(raw), len(raw))
+            return data
+
+        dict_id = 0
+        if self.codec == "zstd":
+            if self.dict_samples and domain:
+                dict_id = self._domain_dicts.get(domain, 0)
+                if domain not in self._domain_dicts:
+                    self._train(domain, raw)
+            compressed = self._zstd("compressor", dict_id).compress(raw)
+        else:
+            compressed = zlib.compress(raw, self.level)
+
+        self._count(domain, len(raw), len(compressed))
+        return {MARKER: self.codec, 'dict_id': dict_id, 'size': len(raw), BODY_FIELD: compressed}
+
+    def decode(self, data: Any) -> Any:
+        """
+        Restore data stored by `encode`; other data is returned unchanged.
+
+        Raises:
+            ValueError: If the data cannot be decompressed (codec unavailable, dictionary missing)
+        """
+        if not isinstance(data, dict) or MARKER not in data:
+            return data
+        compressed = data[BODY_FIELD]
+        if isinstance(compressed, str):
+            # JSON backend, or written by a version that stored base64 everywhere
+            compressed = base64.b64decode(compressed)
+        if data[MARKER] == "zlib":
+            raw = zlib.decompress(compressed)
+        elif data[MARKER] == "zstd" and zstandard is not None:
+            raw = self._zstd("decompressor", data.get('dict_id') or 0).decompress(
+                compressed, max_output_size=data.get('size', 0)
+            )
+        else:
+            raise ValueError(f"Cannot decompress {data[MARKER]} cache data")
+        return json.loads(raw)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get byte counts of the data encoded since this codec was created.
+
+        Returns:
+            Dict[str, Any]: codec, entries, raw_bytes, stored_bytes and ratio (stored/raw)
+            in total, plus the same counts per domain under 'domains'
+        """
+        def summary(counts: Dict[str, int]) -> Dict[str, Any]:
+            raw_bytes = counts['raw_bytes']
+            return dict(counts, ratio=counts['stored_bytes'] / raw_bytes if raw_bytes else 1.0)
+
+        with self._lock:
+            total = summary(self._stats.get("", {'entries': 0, 'raw_bytes': 0, 'stored_bytes': 0}))
+            domains = {domain: summary(counts) for domain, counts in self._stats.items() if domain}
+            dictionaries = sum(1 for dict_id in self._domain_dicts.values() if dict_id)
+        return dict(total, codec=self.codec, dictionaries=dictionaries, domains=domains)
+
+class CompressedCacheBackend(CacheBackend):
+    """
+    Compresses entry data on its way to a backend.
+
+    Status records and metadata pass through unchanged.
+    """
+
+    def __init__(self, backend: CacheBackend, codec: PayloadCodec):
+        """
+        Wrap a backend.
+
+        Args:
+            backend: The backend compressed entries are stored in
+            codec: The codec used to compress entry data
+        """
+        self.backend = backend
+        self.name = backend.name
+        self.codec = codec
+
+    def _encode(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        return dict(entry, data=self.codec.encode(entry.get('id'), entry.get('data')))
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cache entry with its data decompressed (None if it can't be)."""
+        entry = self.backend.get(key)
+        if entry is None:
+            return None
+        try:
+            entry['data'] = self.codec.decode(entry.get('data'))
+        except Exception as e:
+            logger.error(f"Error decompressing cache entry {key}: {e}")
+            return None
+        return entry
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """Store a cache entry with its data compressed."""
+        self.backend.put(key, self._encode(entry))
+
+    def put_many(self, entries: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """Store several cache entries with their data compressed."""
+        self.backend.put_many([(key, self._encode(entry)) for key, entry in entries])
+
+    def delete(self, keys: Iterable[str]) -> int:
+        """Delete entries and their processing status."""
+        return self.backend.delete(keys)
+
+    def scan(self) -> Iterator[EntryMeta]:
+        """Iterate over entry metadata."""
+        return self.backend.scan()
+
+    def expired_keys(self, cutoff: float, default_ttl: float) -> List[str]:
+        """Get keys of entries whose lifetime ended before `cutoff`."""
+        return self.backend.expired_keys(cutoff, default_ttl)
+
+    def keys_older_than(self, cutoff: float) -> List[str]:
+        """Get keys of entries stored before `cutoff`."""
+        return self.backend.keys_older_than(cutoff)
+
+    def get_status(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the processing status record of an entry."""
+        return self.backend.get_status(key)
+
+    def put_status(self, key: str, status: Dict[str, Any]) -> None:
+        """Store the processing status record of an entry."""
+        self.backend.put_status(key, status)
+
+    def put_status_many(self, statuses: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """Store several processing status records."""
+        self.backend.put_status_many(statuses)
+
+    def count(self) -> int:
+        """Get the number of cached entries."""
+        return self.backend.count()
+
+    def poll_changes(self) -> Tuple[List[EntryMeta], Optional[List[str]]]:
+        """Get the entries other processes wrote or deleted since the last call."""
+        return self.backend.poll_changes()
+
+    def clear(self) -> int:
+        """Remove all entries and status records."""
+        return self.backend.clear()
+
+    def close(self) -> None:
+        """Close the wrapped backend."""
+        self.backend.close()
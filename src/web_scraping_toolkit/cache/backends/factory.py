@@ -0,0 +1,81 @@
+"""
+Cache Backend Selection for the Web Scraping Toolkit.
+
+This module maps backend names (the CACHE_BACKEND setting) to backend
+classes, and imports existing `items.json`/`status.json` files the first time
+a persistent backend is used in a cache directory. The import can also be
+run by hand:
+
+    python -m web_scraping_toolkit.cache.backends.factory <cache_path> --backend sqlite
+"""
+
+import os
+import sys
+import argparse
+from typing import Callable, Dict, List, Optional, Type
+
+from ..cache_key import CacheKeyBuilder
+from .base import CacheBackend
+from .json_backend import JSONCacheBackend, migrate_json_cache
+from .memory_backend import MemoryCacheBackend
+from .filesystem_backend import FilesystemCacheBackend
+from .sqlite_backend import SQLiteCacheBackend
+
+BACKENDS: Dict[str, Type[CacheBackend]] = {
+    backend.name: backend
+    for backend in (JSONCacheBackend, MemoryCacheBackend, FilesystemCacheBackend, SQLiteCacheBackend)
+}
+
+def create_backend(
+    name: str,
+    cache_path: str,
+    migrate: bool = True,
+    durable: bool = False,
+    key_for: Optional[Callable[[str], str]] = None
+) -> CacheBackend:
+    """
+    Open a cache backend.
+
+    Args:
+        name: Backend name ('json', 'memory', 'filesystem' or 'sqlite')
+        cache_path: Directory of this cache
+        migrate: Whether to import JSON files into an empty filesystem or SQLite backend
+        durable: Whether writes are synced to disk before they return
+        key_for: Function giving the storage key of an item id, used to re-key migrated entries
+
+    Returns:
+        CacheBackend: The open backend
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    backend_class = BACKENDS.get(name.lower())
+    if backend_class is None:
+        raise ValueError(f"Unknown cache backend: {name} (expected one of {', '.join(BACKENDS)})")
+
+    backend = backend_class(cache_path, durable=durable)
+    if (migrate and backend_class not in (JSONCacheBackend, MemoryCacheBackend)
+            and os.path.exists(os.path.join(cache_path, "items.json")) and backend.count() == 0):
+        migrate_json_cache(cache_path, backend, key_for)
+    return backend
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Import a JSON cache directory into another backend")
+    parser.add_argument("cache_path", help="Cache directory (cache_dir/cache_name) holding items.json")
+    parser.add_argument("--backend", default="sqlite", choices=["filesystem", "sqlite"], help="Target backend")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(os.path.join(args.cache_path, "items.json")):
+        print(f"No items.json found in {args.cache_path}")
+        return 1
+
+    backend = create_backend(args.backend, args.cache_path, migrate=False)
+    try:
+        count = migrate_json_cache(args.cache_path, backend, CacheKeyBuilder().storage_key)
+    finally:
+        backend.close()
+    print(f"Migrated {count} items to the {args.backend} backend in {args.cache_path}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
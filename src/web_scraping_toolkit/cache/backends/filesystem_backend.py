@@ -0,0 +1,363 @@
+"""
+Filesystem Cache Backend for the Web Scraping Toolkit.
+
+This module stores each cache entry in its own JSON file, spread over shard
+directories named after the first characters of the (hex) cache key. The
+binary payload of compressed data goes into a body file next to the entry:
+
+    <cache_path>/entries/ab/ab12....json
+    <cache_path>/entries/ab/ab12....bin
+    <cache_path>/status/ab/ab12....json
+    <cache_path>/index.jsonl
+    <cache_path>/index.lock
+
+Only a small metadata index (item id, timestamp, ttl) is kept in memory, so
+memory use does not grow with the size of cached bodies. Reading an entry
+touches one file, and files are written to a temporary name and renamed into
+place, so a crash never leaves a half-written entry. The index is persisted
+as an append-only log that is compacted when the backend is opened, and
+again whenever superseded records outnumber the live ones.
+
+Several processes may share a cache directory: index updates hold an
+advisory lock on `index.lock`, and each process tails the index log to pick
+up entries written by the others (or replays it if another process compacted
+it). Entry files are written before the lock is taken, so writers only
+serialize on the index append.
+"""
+
+import os
+import json
+import shutil
+import threading
+from typing import Dict, Any, Optional, Iterable, Iterator, List, Tuple
+
+from ...utils.logger import get_logger
+from ...utils.locks import FileLock
+from .base import CacheBackend, EntryMeta, split_body, join_body
+
+# Initialize logger
+logger = get_logger("filesystem_backend")
+
+INDEX_FILENAME = "index.jsonl"
+LOCK_FILENAME = "index.lock"
+
+# Superseded index records tolerated before the log is compacted at runtime
+COMPACT_MIN_RECORDS = 10000
+
+# Entry field marking an entry whose data payload is in its body file
+BODY_MARK = "body_file"
+
+# (item id, timestamp, ttl)
+_Meta = Tuple[Optional[str], float, Optional[float]]
+
+class FilesystemCacheBackend(CacheBackend):
+    """
+    Stores each cache entry and status record in its own file.
+    """
+
+    name = "filesystem"
+
+    def __init__(self, cache_path: str, durable: bool = False, shard_chars: int = 2):
+        """
+        Initialize the backend and load the metadata index.
+
+        Args:
+            cache_path: Directory holding the entry and status trees
+            durable: Whether to fsync files and the index log before a write returns
+            shard_chars: Number of leading key characters used for shard directories
+        """
+        self.durable = durable
+        self.entries_dir = os.path.join(cache_path, "entries")
+        self.status_dir = os.path.join(cache_path, "status")
+        self.index_file = os.path.join(cache_path, INDEX_FILENAME)
+        self.shard_chars = shard_chars
+        self._lock = threading.RLock()
+        # Serializes writers across processes sharing the directory
+        self._file_lock = FileLock(os.path.join(cache_path, LOCK_FILENAME))
+        os.makedirs(self.entries_dir, exist_ok=True)
+        os.makedirs(self.status_dir, exist_ok=True)
+
+        # key -> (item id, timestamp, ttl)
+        self._index: Dict[str, _Meta] = {}
+        # Entries written (meta) or deleted (None) by other processes, not yet polled
+        self._changes: Dict[str, Optional[_Meta]] = {}
+        self._index_log = None
+        # Records in the index log, live or superseded
+        self._log_records = 0
+        with self._file_lock.hold():
+            self._load_index()
+            self._open_log()
+
+    def _path(self, root: str, key: str, suffix: str = ".json") -> str:
+        """Get the file path of a key under an entry or status tree."""
+        return os.path.join(root, key[:self.shard_chars], f"{key}{suffix}")
+
+    def _entry_files(self) -> Iterator[str]:
+        """Iterate over the paths of all entry files."""
+        for shard in os.listdir(self.entries_dir):
+            shard_dir = os.path.join(self.entries_dir, shard)
+            if not os.path.isdir(shard_dir):
+                continue
+            for filename in os.listdir(shard_dir):
+                if filename.endswith(".json"):
+                    yield os.path.join(shard_dir, filename)
+
+    def _load_index(self) -> None:
+        """Replay the index log, or rebuild it from the entry files, then compact it (file lock held)."""
+        if os.path.exists(self.index_file):
+            self._replay(0)
+        else:
+            for path in self._entry_files():
+                item = self._read(path)
+                if item is not None:
+                    key = os.path.basename(path)[:-len(".json")]
+                    self._index[key] = (item.get('id'), item.get('timestamp', 0), item.get('ttl'))
+            if self._index:
+                logger.info(f"Rebuilt filesystem cache index with {len(self._index)} entries")
+
+        self._write_index()
+
+    def _write_index(self) -> None:
+        """Rewrite the index log with one record per live entry (file lock held)."""
+        self._write_atomic(self.index_file, "".join(
+            self._index_line(key, *meta) for key, meta in self._index.items()
+        ))
+        self._log_records = len(self._index)
+
+    def _maybe_compact(self) -> None:
+        """Compact the index log once superseded records outnumber live ones (both locks held, caught up)."""
+        superseded = self._log_records - len(self._index)
+        if superseded < COMPACT_MIN_RECORDS or superseded < len(self._index):
+            return
+        # The new log file tells other processes to replay it from the start
+        self._write_index()
+        self._open_log()
+
+    def _open_log(self) -> None:
+        """(Re)open the index log for appending and note how much of it was replayed (file lock held)."""
+        if self._index_log is not None:
+            self._index_log.close()
+        self._index_log = open(self.index_file, 'a', encoding='utf-8')
+        stat = os.fstat(self._index_log.fileno())
+        self._log_inode = stat.st_ino
+        self._log_offset = stat.st_size
+
+    def _replay(self, offset: int) -> Tuple[int, List[Tuple[str, Optional[_Meta]]]]:
+        """
+        Apply index log records from a byte offset to the in-memory index.
+
+        Args:
+            offset: Position to start reading from
+
+        Returns:
+            Tuple of (offset after the last complete record, applied (key, meta or None) changes)
+        """
+        applied = []
+        with open(self.index_file, 'rb') as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Torn last line after a crash
+                    break
+                offset += len(line)
+                self._log_records += 1
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                key = record['key']
+                if record.get('deleted'):
+                    self._index.pop(key, None)
+                    applied.append((key, None))
+                else:
+                    meta = (record.get('id'), record.get('timestamp', 0), record.get('ttl'))
+                    self._index[key] = meta
+                    applied.append((key, meta))
+        return offset, applied
+
+    def _catch_up(self) -> None:
+        """Apply index records appended by other processes since the last call (both locks held)."""
+        try:
+            inode = os.stat(self.index_file).st_ino
+        except FileNotFoundError:
+            inode = None
+        if inode != self._log_inode:
+            # Another process compacted or cleared the log: replay it from the start
+            previous, self._index = self._index, {}
+            self._log_records = 0
+            if inode is not None:
+                self._replay(0)
+            for key in previous.keys() - self._index.keys():
+                self._changes[key] = None
+            for key, meta in self._index.items():
+                if previous.get(key) != meta:
+                    self._changes[key] = meta
+            self._open_log()
+        elif os.path.getsize(self.index_file) > self._log_offset:
+            self._log_offset, applied = self._replay(self._log_offset)
+            self._changes.update(applied)
+
+    @staticmethod
+    def _index_line(key: str, item_id: Optional[str], timestamp: float, ttl: Optional[float]) -> str:
+        """Format an index log record."""
+        return json.dumps({'key': key, 'id': item_id, 'timestamp': timestamp, 'ttl': ttl}, ensure_ascii=False) + "\n"
+
+    def _append_index(self, line: str) -> None:
+        """Append records to the index log (both locks held, caught up)."""
+        if os.fstat(self._index_log.fileno()).st_size > self._log_offset:
+            # A writer died mid-record; end the torn line so ours parses
+            line = "\n" + line
+        self._index_log.write(line)
+        self._index_log.flush()
+        self._log_records += line.count("\n")
+        if self.durable:
+            os.fsync(self._index_log.fileno())
+        self._log_offset = os.fstat(self._index_log.fileno()).st_size
+
+    @staticmethod
+    def _read(path: str) -> Optional[Dict[str, Any]]:
+        """Read a JSON file, returning None if it is missing or unreadable."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Error reading {path}: {e}")
+            return None
+
+    def _write_atomic(self, path: str, content: Any) -> None:
+        """Write text or bytes to a file through a temporary file renamed into place."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        mode, encoding = ('wb', None) if isinstance(content, bytes) else ('w', 'utf-8')
+        try:
+            with open(tmp_path, mode, encoding=encoding) as f:
+                f.write(content)
+                if self.durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        """Remove a file, returning whether it existed."""
+        try:
+            os.remove(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cache entry, or None if absent."""
+        entry = self._read(self._path(self.entries_dir, key))
+        if entry is not None and entry.pop(BODY_MARK, False):
+            path = self._path(self.entries_dir, key, ".bin")
+            try:
+                with open(path, 'rb') as f:
+                    entry['data'] = join_body(entry.get('data'), f.read())
+            except OSError as e:
+                logger.error(f"Error reading {path}: {e}")
+                return None
+        return entry
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """Store a cache entry."""
+        self.put_many([(key, entry)])
+
+    def put_many(self, entries: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """Store several cache entries, appending their index records in one write."""
+        entries = list(entries)
+        if not entries:
+            return
+        # Entry files are renamed into place atomically, so they need no lock
+        for key, entry in entries:
+            data, body = split_body(entry.get('data'))
+            if body is not None:
+                # The body goes first, so a reader never finds an entry without it
+                self._write_atomic(self._path(self.entries_dir, key, ".bin"), body)
+                entry = dict(entry, data=data, **{BODY_MARK: True})
+            else:
+                self._remove(self._path(self.entries_dir, key, ".bin"))
+            self._write_atomic(self._path(self.entries_dir, key), json.dumps(entry, ensure_ascii=False))
+
+        with self._lock, self._file_lock.hold():
+            self._catch_up()
+            lines = []
+            for key, entry in entries:
+                meta = (entry.get('id'), entry.get('timestamp', 0), entry.get('ttl'))
+                self._index[key] = meta
+                lines.append(self._index_line(key, *meta))
+            self._append_index("".join(lines))
+            self._maybe_compact()
+
+    def delete(self, keys: Iterable[str]) -> int:
+        """Delete entries and their processing status."""
+        with self._lock, self._file_lock.hold():
+            self._catch_up()
+            removed = 0
+            for key in keys:
+                if self._remove(self._path(self.entries_dir, key)):
+                    removed += 1
+                self._remove(self._path(self.entries_dir, key, ".bin"))
+                self._remove(self._path(self.status_dir, key))
+                if self._index.pop(key, None) is not None:
+                    self._append_index(json.dumps({'key': key, 'deleted': True}) + "\n")
+            self._maybe_compact()
+            return removed
+
+    def scan(self) -> Iterator[EntryMeta]:
+        """Iterate over entry metadata from the in-memory index."""
+        with self._lock, self._file_lock.hold():
+            self._catch_up()
+            rows = [(key, item_id, timestamp, ttl) for key, (item_id, timestamp, ttl) in self._index.items()]
+        return iter(rows)
+
+    def get_status(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the processing status record of an entry, or None if absent."""
+        return self._read(self._path(self.status_dir, key))
+
+    def put_status(self, key: str, status: Dict[str, Any]) -> None:
+        """Store the processing status record of an entry."""
+        self._write_atomic(self._path(self.status_dir, key), json.dumps(status, ensure_ascii=False))
+
+    def count(self) -> int:
+        """Get the number of cached entries."""
+        with self._lock, self._file_lock.hold():
+            self._catch_up()
+            return len(self._index)
+
+    def poll_changes(self) -> Tuple[List[EntryMeta], Optional[List[str]]]:
+        """Get the entries other processes wrote or deleted since the last call."""
+        with self._lock, self._file_lock.hold():
+            self._catch_up()
+            changes, self._changes = self._changes, {}
+        written = [(key, *meta) for key, meta in changes.items() if meta is not None]
+        deleted = [key for key, meta in changes.items() if meta is None]
+        return written, deleted
+
+    def clear(self) -> int:
+        """Remove all entries and status records, returning the number of entries removed."""
+        with self._lock, self._file_lock.hold():
+            self._catch_up()
+            removed = len(self._index)
+            for root in (self.entries_dir, self.status_dir):
+                shutil.rmtree(root, ignore_errors=True)
+                os.makedirs(root, exist_ok=True)
+            self._index = {}
+            self._changes = {}
+            # A new (empty) log file tells other processes to replay from scratch
+            self._write_atomic(self.index_file, "")
+            self._log_records = 0
+            self._open_log()
+            return removed
+
+    def close(self) -> None:
+        """Close the index log and lock file."""
+        with self._lock:
+            self._index_log.close()
+            self._file_lock.close()
@@ -0,0 +1,255 @@
+"""
+JSON Cache Backend for the Web Scraping Toolkit.
+
+This module keeps cache entries and processing status in memory and persists
+them to `items.json` and `status.json` in the cache directory. Every write
+rewrites the affected file, which is simple but grows expensive with large
+caches; the filesystem and SQLite backends scale better.
+
+Processes sharing the directory take turns through an advisory lock on
+`items.lock`, and reload the files before changing them if another process
+rewrote them, so no process overwrites the others' entries.
+"""
+
+import os
+import json
+import base64
+import threading
+from typing import Callable, Dict, Any, Optional, Iterable, Iterator, List, Tuple
+
+from ...utils.logger import get_logger
+from ...utils.locks import FileLock
+from .base import CacheBackend, EntryMeta, BODY_FIELD, split_body
+
+# Initialize logger
+logger = get_logger("json_backend")
+
+class JSONCacheBackend(CacheBackend):
+    """
+    Stores cache entries and processing status in two JSON files.
+
+    The whole cache is held in memory and loaded at start-up. Binary payloads
+    of compressed data are stored as base64 text.
+    """
+
+    name = "json"
+
+    def __init__(self, cache_path: str, durable: bool = False):
+        """
+        Initialize the backend and load existing files.
+
+        Args:
+            cache_path: Directory holding items.json and status.json
+            durable: Whether to fsync each write before returning
+        """
+        self.durable = durable
+        self.items_file = os.path.join(cache_path, "items.json")
+        self.status_file = os.path.join(cache_path, "status.json")
+        self._file_lock = FileLock(os.path.join(cache_path, "items.lock"))
+
+        # Identity of each file as last loaded or saved by this process
+        self._signatures: Dict[str, Optional[Tuple[int, int, int]]] = {}
+
+        # In-memory cache
+        self.items: Dict[str, Dict[str, Any]] = self._load(self.items_file)
+        self.statuses: Dict[str, Dict[str, Any]] = self._load(self.status_file)
+        self._lock = threading.RLock()
+
+        # Entries written (meta) or deleted (None) by other processes, not yet polled
+        self._changes: Dict[str, Optional[EntryMeta]] = {}
+
+        if self.items:
+            logger.info(f"Loaded {len(self.items)} cached items from {self.items_file}")
+
+    @staticmethod
+    def _signature(path: str) -> Optional[Tuple[int, int, int]]:
+        """Get (inode, mtime, size) of a file, or None if it is missing."""
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _load(self, path: str) -> Dict[str, Any]:
+        """Load a JSON file, returning an empty dict if it is missing or unreadable."""
+        self._signatures[path] = self._signature(path)
+        if self._signatures[path] is None:
+            return {}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.error(f"Error loading {path}: {e}")
+            return {}
+
+    def _save(self, path: str, data: Dict[str, Any]) -> None:
+        """Write a dict to a JSON file through a temporary file renamed into place."""
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+                if self.durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+            self._signatures[path] = self._signature(path)
+        except Exception as e:
+            logger.error(f"Error saving {path}: {e}")
+
+    @staticmethod
+    def _meta(key: str, item: Dict[str, Any]) -> EntryMeta:
+        return key, item.get('id'), item.get('timestamp', 0), item.get('ttl')
+
+    def _refresh(self) -> None:
+        """Reload files another process rewrote since this process last loaded or saved them (lock held)."""
+        if self._signature(self.items_file) != self._signatures.get(self.items_file):
+            previous, self.items = self.items, self._load(self.items_file)
+            for key in previous.keys() - self.items.keys():
+                self._changes[key] = None
+            for key, item in self.items.items():
+                if previous.get(key) != item:
+                    self._changes[key] = self._meta(key, item)
+        if self._signature(self.status_file) != self._signatures.get(self.status_file):
+            self.statuses = self._load(self.status_file)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cache entry, or None if absent."""
+        with self._lock:
+            item = self.items.get(key)
+            return dict(item) if item is not None else None
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """Store a cache entry."""
+        with self._lock, self._file_lock.hold():
+            self._refresh()
+            data, body = split_body(entry.get('data'))
+            if body is not None:
+                data[BODY_FIELD] = base64.b64encode(body).decode('ascii')
+            self.items[key] = dict(entry, data=data)
+            self._save(self.items_file, self.items)
+
+    def delete(self, keys: Iterable[str]) -> int:
+        """
+        Delete entries and their processing status.
+
+        Returns:
+            int: Number of entries removed
+        """
+        with self._lock, self._file_lock.hold():
+            self._refresh()
+            removed = 0
+            status_changed = False
+            for key in keys:
+                if self.items.pop(key, None) is not None:
+                    removed += 1
+                if self.statuses.pop(key, None) is not None:
+                    status_changed = True
+            if removed:
+                self._save(self.items_file, self.items)
+            if status_changed:
+                self._save(self.status_file, self.statuses)
+            return removed
+
+    def scan(self) -> Iterator[EntryMeta]:
+        """Iterate over entry metadata."""
+        with self._lock:
+            self._refresh()
+            rows = [self._meta(key, item) for key, item in self.items.items()]
+        return iter(rows)
+
+    def get_status(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the processing status record of an entry, or None if absent."""
+        with self._lock:
+            status = self.statuses.get(key)
+            if status is None:
+                return None
+            return {'id': status.get('id'), 'processed_stages': dict(status.get('processed_stages', {}))}
+
+    def put_status(self, key: str, status: Dict[str, Any]) -> None:
+        """Store the processing status record of an entry."""
+        with self._lock, self._file_lock.hold():
+            self._refresh()
+            self.statuses[key] = status
+            self._save(self.status_file, self.statuses)
+
+    def count(self) -> int:
+        """Get the number of cached entries."""
+        with self._lock:
+            self._refresh()
+            return len(self.items)
+
+    def poll_changes(self) -> Tuple[List[EntryMeta], Optional[List[str]]]:
+        """Reload files other processes rewrote and report the entries that changed."""
+        with self._lock:
+            self._refresh()
+            changes, self._changes = self._changes, {}
+        written = [meta for meta in changes.values() if meta is not None]
+        deleted = [key for key, meta in changes.items() if meta is None]
+        return written, deleted
+
+    def clear(self) -> int:
+        """Remove all entries and status records, returning the number of entries removed."""
+        with self._lock, self._file_lock.hold():
+            self._refresh()
+            removed = len(self.items)
+            self.items = {}
+            self.statuses = {}
+            self._save(self.items_file, self.items)
+            self._save(self.status_file, self.statuses)
+            return removed
+
+    def close(self) -> None:
+        """Close the lock file."""
+        self._file_lock.close()
+
+def _rekey(records: Dict[str, Dict[str, Any]], key_for: Callable[[str], str]) -> Dict[str, Dict[str, Any]]:
+    """Key records by the storage key of their item id, keeping the newest record per key."""
+    rekeyed: Dict[str, Dict[str, Any]] = {}
+    for key, record in records.items():
+        item_id = record.get('id') if isinstance(record, dict) else None
+        new_key = key_for(item_id) if isinstance(item_id, str) else key
+        current = rekeyed.get(new_key)
+        if current is None or record.get('timestamp', 0) >= current.get('timestamp', 0):
+            rekeyed[new_key] = record
+    return rekeyed
+
+def migrate_json_cache(
+    cache_path: str,
+    backend: CacheBackend,
+    key_for: Optional[Callable[[str], str]] = None
+) -> int:
+    """
+    Import items.json and status.json into another backend.
+
+    Afterwards the JSON files are renamed with a `.migrated` suffix so they
+    are not imported again.
+
+    Args:
+        cache_path: Directory holding the JSON files
+        backend: The open backend to import into
+        key_for: Function giving the current storage key of a record's item id; records
+            written under an older key scheme are re-keyed with it (None = keys kept as they are)
+
+    Returns:
+        int: Number of entries imported
+    """
+    imported = 0
+    for filename, writer in (("items.json", backend.put_many), ("status.json", backend.put_status_many)):
+        path = os.path.join(cache_path, filename)
+        if not os.path.exists(path):
+            continue
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                records = json.load(f)
+        except Exception as e:
+            logger.error(f"Error reading {path}, not migrated: {e}")
+            continue
+        if key_for is not None:
+            records = _rekey(records, key_for)
+        writer(records.items())
+        if filename == "items.json":
+            imported = len(records)
+        os.replace(path, path + ".migrated")
+
+    logger.info(f"Migrated {imported} cached items from JSON files in {cache_path} to the {backend.name} backend")
+    return imported
@@ -0,0 +1,86 @@
+"""
+In-Memory Cache Backend for the Web Scraping Toolkit.
+
+This module keeps cache entries and processing status in process memory
+only. Nothing is written to disk, which suits tests and short jobs.
+"""
+
+import threading
+from typing import Dict, Any, Optional, Iterable, Iterator
+
+from .base import CacheBackend, EntryMeta
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Stores cache entries and processing status in dicts.
+
+    The contents are lost when the process exits.
+    """
+
+    name = "memory"
+
+    def __init__(self, cache_path: Optional[str] = None, durable: bool = False):
+        """
+        Initialize an empty backend.
+
+        Args:
+            cache_path: Ignored; accepted so all backends share one constructor signature
+            durable: Ignored, for the same reason
+        """
+        self.items: Dict[str, Dict[str, Any]] = {}
+        self.statuses: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cache entry, or None if absent."""
+        with self._lock:
+            item = self.items.get(key)
+            return dict(item) if item is not None else None
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """Store a cache entry."""
+        with self._lock:
+            self.items[key] = dict(entry)
+
+    def delete(self, keys: Iterable[str]) -> int:
+        """Delete entries and their processing status."""
+        with self._lock:
+            removed = 0
+            for key in keys:
+                if self.items.pop(key, None) is not None:
+                    removed += 1
+                self.statuses.pop(key, None)
+            return removed
+
+    def scan(self) -> Iterator[EntryMeta]:
+        """Iterate over entry metadata."""
+        with self._lock:
+            rows = [(key, item.get('id'), item.get('timestamp', 0), item.get('ttl'))
+                    for key, item in self.items.items()]
+        return iter(rows)
+
+    def get_status(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the processing status record of an entry, or None if absent."""
+        with self._lock:
+            status = self.statuses.get(key)
+            if status is None:
+                return None
+            return {'id': status.get('id'), 'processed_stages': dict(status.get('processed_stages', {}))}
+
+    def put_status(self, key: str, status: Dict[str, Any]) -> None:
+        """Store the processing status record of an entry."""
+        with self._lock:
+            self.statuses[key] = {'id': status.get('id'), 'processed_stages': dict(status.get('processed_stages', {}))}
+
+    def count(self) -> int:
+        """Get the number of cached entries."""
+        with self._lock:
+            return len(self.items)
+
+    def clear(self) -> int:
+        """Remove all entries and status records, returning the number of entries removed."""
+        with self._lock:
+            removed = len(self.items)
+            self.items = {}
+            self.statuses = {}
+            return removed
@@ -0,0 +1,276 @@
+"""
+SQLite Cache Backend for the Web Scraping Toolkit.
+
+This module keeps cache entries and processing status in a SQLite database
+(`cache.db` in the cache directory) running in WAL mode, so each write touches
+a single row and survives crashes, instead of rewriting whole JSON files.
+Reads use one connection per thread, so they run concurrently with each
+other and with the (serialized) writes.
+
+Several processes may share the database. Every write and delete also
+appends the key, tagged with the writing backend's id, to a bounded `changes`
+log, from which each process picks up the entries the others wrote.
+"""
+
+import os
+import json
+import sqlite3
+import threading
+import uuid
+import weakref
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Set, Tuple
+
+from ...utils.logger import get_logger
+from .base import CacheBackend, EntryMeta, split_body, join_body
+
+# Initialize logger
+logger = get_logger("sqlite_backend")
+
+DB_FILENAME = "cache.db"
+
+# Change records kept for other processes to poll
+CHANGE_LOG_SIZE = 100000
+
+# Seconds a write waits for another process's transaction
+BUSY_TIMEOUT = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    key TEXT PRIMARY KEY,
+    id TEXT,
+    data TEXT,
+    timestamp REAL NOT NULL,
+    ttl REAL,
+    date TEXT,
+    body BLOB
+);
+CREATE INDEX IF NOT EXISTS items_timestamp ON items (timestamp);
+CREATE TABLE IF NOT EXISTS status (
+    key TEXT PRIMARY KEY,
+    id TEXT,
+    stages TEXT NOT NULL
+);
+-- key is NULL when the whole cache was cleared
+CREATE TABLE IF NOT EXISTS changes (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    key TEXT,
+    writer TEXT
+);
+"""
+
+def _close_reader(readers: Set[sqlite3.Connection], lock: threading.RLock, conn: sqlite3.Connection) -> None:
+    """Close the read connection of a thread that ended, unless the backend already closed it."""
+    with lock:
+        if conn in readers:
+            readers.discard(conn)
+            conn.close()
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    Stores cache entries and processing status in SQLite.
+
+    Entry data and processing stages are stored as JSON text; the binary
+    payload of compressed data goes into the `body` BLOB column.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, cache_path: str, durable: bool = False):
+        """
+        Open (or create) the database.
+
+        Args:
+            cache_path: Directory holding the database
+            durable: Whether each commit is synced to disk (synchronous=FULL); otherwise
+                a power loss may roll back the last commits, but never corrupts the database
+        """
+        self.db_path = os.path.join(cache_path, DB_FILENAME)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"PRAGMA synchronous={'FULL' if durable else 'NORMAL'}")
+        self._conn.executescript(_SCHEMA)
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(items)")]
+        if 'body' not in columns:
+            # Database created before payloads were stored as BLOBs
+            try:
+                with self._conn:
+                    self._conn.execute("ALTER TABLE items ADD COLUMN body BLOB")
+            except sqlite3.OperationalError as e:
+                # Another process added it first
+                if "duplicate column" not in str(e):
+                    raise
+
+        # Per-thread read connections, each closed when its thread ends
+        self._local = threading.local()
+        self._readers: Set[sqlite3.Connection] = set()
+
+        # Tags this backend's change records so poll_changes skips them
+        self._writer_id = uuid.uuid4().hex
+
+        # Last change record seen by poll_changes
+        self._poll_lock = threading.Lock()
+        self._seen_change = self._conn.execute("SELECT COALESCE(MAX(seq), 0) FROM changes").fetchone()[0]
+
+    def _reader(self) -> sqlite3.Connection:
+        """Get the calling thread's read connection."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT, check_same_thread=False)
+            self._local.conn = conn
+            with self._lock:
+                self._readers.add(conn)
+            weakref.finalize(threading.current_thread(), _close_reader, self._readers, self._lock, conn)
+        return conn
+
+    def _log_changes(self, keys: List[Optional[str]]) -> None:
+        """Append keys to the change log, dropping the oldest records (write transaction open)."""
+        self._conn.executemany(
+            "INSERT INTO changes (key, writer) VALUES (?, ?)", [(key, self._writer_id) for key in keys]
+        )
+        self._conn.execute(
+            "DELETE FROM changes WHERE seq <= (SELECT MAX(seq) FROM changes) - ?", (CHANGE_LOG_SIZE,)
+        )
+
+    @staticmethod
+    def _entry(row: Tuple) -> Dict[str, Any]:
+        """Build an entry dict from an items row (id, data, timestamp, ttl, date, body)."""
+        item_id, data, timestamp, ttl, date, body = row
+        entry = {'id': item_id, 'data': join_body(json.loads(data), body), 'timestamp': timestamp, 'date': date}
+        if ttl is not None:
+            entry['ttl'] = ttl
+        return entry
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cache entry, or None if absent."""
+        row = self._reader().execute(
+            "SELECT id, data, timestamp, ttl, date, body FROM items WHERE key = ?", (key,)
+        ).fetchone()
+        return self._entry(row) if row else None
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """Store a cache entry."""
+        self.put_many([(key, entry)])
+
+    def put_many(self, entries: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """Store several cache entries in one transaction."""
+        rows = []
+        for key, entry in entries:
+            data, body = split_body(entry.get('data'))
+            rows.append((key, entry.get('id'), json.dumps(data, ensure_ascii=False),
+                         entry.get('timestamp', 0), entry.get('ttl'), entry.get('date'), body))
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO items (key, id, data, timestamp, ttl, date, body) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self._log_changes([row[0] for row in rows])
+
+    def delete(self, keys: Iterable[str]) -> int:
+        """
+        Delete entries and their processing status.
+
+        Returns:
+            int: Number of entries removed
+        """
+        keys = [(key,) for key in keys]
+        if not keys:
+            return 0
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany("DELETE FROM items WHERE key = ?", keys)
+            removed = self._conn.total_changes - before
+            self._conn.executemany("DELETE FROM status WHERE key = ?", keys)
+            self._log_changes([key for key, in keys])
+        return removed
+
+    def scan(self) -> Iterator[EntryMeta]:
+        """Iterate over entry metadata without loading bodies."""
+        rows = self._reader().execute("SELECT key, id, timestamp, ttl FROM items").fetchall()
+        return iter(rows)
+
+    def expired_keys(self, cutoff: float, default_ttl: float) -> List[str]:
+        """Get keys of entries whose lifetime ended before `cutoff`."""
+        rows = self._reader().execute(
+            "SELECT key FROM items WHERE ? - timestamp > COALESCE(ttl, ?)", (cutoff, default_ttl)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def keys_older_than(self, cutoff: float) -> List[str]:
+        """Get keys of entries stored before `cutoff`."""
+        rows = self._reader().execute("SELECT key FROM items WHERE timestamp < ?", (cutoff,)).fetchall()
+        return [row[0] for row in rows]
+
+    def get_status(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the processing status record of an entry, or None if absent."""
+        row = self._reader().execute("SELECT id, stages FROM status WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        return {'id': row[0], 'processed_stages': json.loads(row[1])}
+
+    def put_status(self, key: str, status: Dict[str, Any]) -> None:
+        """Store the processing status record of an entry."""
+        self.put_status_many([(key, status)])
+
+    def put_status_many(self, statuses: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """Store several processing status records in one transaction."""
+        rows = [
+            (key, status.get('id'), json.dumps(status.get('processed_stages', {}), ensure_ascii=False))
+            for key, status in statuses
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO status (key, id, stages) VALUES (?, ?, ?)", rows)
+
+    def count(self) -> int:
+        """Get the number of cached entries."""
+        return self._reader().execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+    def poll_changes(self) -> Tuple[List[EntryMeta], Optional[List[str]]]:
+        """
+        Get the entries other processes wrote or deleted since the last call.
+
+        If another process cleared the cache, or more changes happened than the
+        log keeps, every entry is reported as written and deleted keys are None.
+        """
+        conn = self._reader()
+        with self._poll_lock:
+            changes = conn.execute(
+                "SELECT c.seq, c.writer, c.key, i.id, i.timestamp, i.ttl FROM changes c "
+                "LEFT JOIN items i ON i.key = c.key WHERE c.seq > ? ORDER BY c.seq",
+                (self._seen_change,)
+            ).fetchall()
+            if not changes:
+                return [], []
+            complete = changes[0][0] == self._seen_change + 1
+            self._seen_change = changes[-1][0]
+        # Skip the records this backend wrote itself
+        changes = [change[2:] for change in changes if change[1] != self._writer_id]
+        if complete and not changes:
+            return [], []
+        if not complete or any(key is None for key, _, _, _ in changes):
+            return conn.execute("SELECT key, id, timestamp, ttl FROM items").fetchall(), None
+
+        # The join gives each key's current state, whatever happened in between
+        current: Dict[str, Optional[EntryMeta]] = {}
+        for key, item_id, timestamp, ttl in changes:
+            current[key] = (key, item_id, timestamp, ttl) if timestamp is not None else None
+        written = [meta for meta in current.values() if meta is not None]
+        deleted = [key for key, meta in current.items() if meta is None]
+        return written, deleted
+
+    def clear(self) -> int:
+        """Remove all entries and status records, returning the number of entries removed."""
+        with self._lock, self._conn:
+            removed = self._conn.execute("DELETE FROM items").rowcount
+            self._conn.execute("DELETE FROM status")
+            self._conn.execute("DELETE FROM changes")
+            self._log_changes([None])
+        return removed
+
+    def close(self) -> None:
+        """Close the database connections."""
+        with self._lock:
+            for conn in self._readers:
+                conn.close()
+            self._readers.clear()
+            self._conn.close()
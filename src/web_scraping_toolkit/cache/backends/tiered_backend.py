@@ -0,0 +1,218 @@
+"""
+Tiered Cache Backend for the Web Scraping Toolkit.
+
+This module puts a bounded in-memory LRU tier in front of a persistent
+backend. Recently used entries are served from memory; writes go through to
+the persistent backend, and the least recently used entries are evicted from
+memory once the entry count or total size limit is exceeded, so memory use
+stays bounded however large the crawl gets.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Iterable, Iterator, List, Tuple
+
+from .base import CacheBackend, EntryMeta
+
+def estimate_size(value: Any) -> int:
+    """
+    Estimate the memory footprint of a cache entry in bytes.
+
+    Strings and bytes count by length, containers by their contents; other
+    values count as a small constant.
+
+    Args:
+        value: The value to measure
+
+    Returns:
+        int: Approximate size in bytes
+    """
+    if isinstance(value, (str, bytes, bytearray)):
+        return len(value) + 48
+    if isinstance(value, dict):
+        return 64 + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set)):
+        return 56 + sum(estimate_size(v) for v in value)
+    return 24
+
+class LRUHotTier:
+    """
+    Byte- and count-bounded LRU map of cache entries, with hit/miss/eviction counters.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        """
+        Initialize an empty tier.
+
+        Args:
+            max_entries: Maximum number of entries held (0 = no count limit)
+            max_bytes: Maximum estimated size of all entries (0 = no size limit)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[Dict[str, Any], int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get an entry and mark it most recently used, or None on a miss."""
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(cached[0])
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """Add or replace an entry, evicting least recently used entries over the limits."""
+        size = estimate_size(entry)
+        with self._lock:
+            self._discard(key)
+            if self.max_bytes and size > self.max_bytes:
+                # Larger than the whole tier; served from the persistent tier only
+                return
+            self._entries[key] = (dict(entry), size)
+            self.size_bytes += size
+            while self._entries and (
+                (self.max_entries and len(self._entries) > self.max_entries)
+                or (self.max_bytes and self.size_bytes > self.max_bytes)
+            ):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.size_bytes -= evicted_size
+                self.evictions += 1
+
+    def _discard(self, key: str) -> None:
+        """Remove an entry without counting an eviction (lock held)."""
+        cached = self._entries.pop(key, None)
+        if cached is not None:
+            self.size_bytes -= cached[1]
+
+    def invalidate(self, keys: Iterable[str]) -> None:
+        """Remove entries that were deleted from the persistent tier."""
+        with self._lock:
+            for key in keys:
+                self._discard(key)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get hot-tier counters.
+
+        Returns:
+            Dict[str, Any]: entries, bytes, hits, misses, hit_rate and evictions
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self.size_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions
+            }
+
+class TieredCacheBackend(CacheBackend):
+    """
+    Serves entries from an `LRUHotTier` before falling back to a persistent backend.
+
+    Entries are written through to the persistent backend, so evicting one
+    from memory never loses data. Status records and metadata queries go
+    straight to the persistent backend.
+    """
+
+    def __init__(self, backend: CacheBackend, max_entries: int, max_bytes: int):
+        """
+        Wrap a backend.
+
+        Args:
+            backend: The persistent backend
+            max_entries: Maximum number of entries held in memory (0 = no count limit)
+            max_bytes: Maximum estimated size of entries held in memory (0 = no size limit)
+        """
+        self.backend = backend
+        self.name = backend.name
+        self.hot = LRUHotTier(max_entries, max_bytes)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cache entry from memory, or from the persistent backend (and promote it)."""
+        entry = self.hot.get(key)
+        if entry is None:
+            entry = self.backend.get(key)
+            if entry is not None:
+                self.hot.put(key, entry)
+        return entry
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """Store a cache entry in both tiers."""
+        self.backend.put(key, entry)
+        self.hot.put(key, entry)
+
+    def put_many(self, entries: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """Store several cache entries in the persistent backend."""
+        entries = list(entries)
+        self.hot.invalidate(key for key, _ in entries)
+        self.backend.put_many(entries)
+
+    def delete(self, keys: Iterable[str]) -> int:
+        """Delete entries from both tiers."""
+        keys = list(keys)
+        self.hot.invalidate(keys)
+        return self.backend.delete(keys)
+
+    def scan(self) -> Iterator[EntryMeta]:
+        """Iterate over entry metadata of the persistent backend."""
+        return self.backend.scan()
+
+    def expired_keys(self, cutoff: float, default_ttl: float) -> List[str]:
+        """Get keys of entries whose lifetime ended before `cutoff`."""
+        return self.backend.expired_keys(cutoff, default_ttl)
+
+    def keys_older_than(self, cutoff: float) -> List[str]:
+        """Get keys of entries stored before `cutoff`."""
+        return self.backend.keys_older_than(cutoff)
+
+    def get_status(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the processing status record of an entry."""
+        return self.backend.get_status(key)
+
+    def put_status(self, key: str, status: Dict[str, Any]) -> None:
+        """Store the processing status record of an entry."""
+        self.backend.put_status(key, status)
+
+    def put_status_many(self, statuses: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """Store several processing status records."""
+        self.backend.put_status_many(statuses)
+
+    def count(self) -> int:
+        """Get the number of cached entries."""
+        return self.backend.count()
+
+    def poll_changes(self) -> Tuple[List[EntryMeta], Optional[List[str]]]:
+        """Get the changes of the persistent backend, dropping changed entries from memory."""
+        written, deleted = self.backend.poll_changes()
+        if deleted is None:
+            self.hot.clear()
+        else:
+            self.hot.invalidate(deleted)
+        self.hot.invalidate(key for key, _, _, _ in written)
+        return written, deleted
+
+    def clear(self) -> int:
+        """Remove all entries from both tiers."""
+        self.hot.clear()
+        return self.backend.clear()
+
+    def close(self) -> None:
+        """Close the persistent backend."""
+        self.backend.close()
@@ -0,0 +1,211 @@
+"""
+Write-Behind Cache Backend for the Web Scraping Toolkit.
+
+This module buffers entry and status writes in memory and persists them to
+the wrapped backend in batches from a background thread, once enough writes
+are pending or after a time limit. Writers only update the in-memory buffer,
+so cache writes on the scraping hot path no longer wait for the disk. Writes
+still in the buffer when the process crashes are lost; `flush()` persists
+them on demand.
+"""
+
+import time
+import threading
+from typing import Dict, Any, Optional, Iterable, Iterator, List, Tuple
+
+from ...utils.logger import get_logger
+from .base import CacheBackend, EntryMeta
+
+# Initialize logger
+logger = get_logger("write_behind")
+
+class WriteBehindBackend(CacheBackend):
+    """
+    Buffers writes to a backend and flushes them in batches.
+
+    Reads see buffered writes. Deletes and bulk queries first settle the
+    buffer, so their results always match the persistent backend.
+    """
+
+    def __init__(self, backend: CacheBackend, max_pending: int = 100, flush_interval: float = 1.0):
+        """
+        Wrap a backend.
+
+        Args:
+            backend: The backend writes are persisted to
+            max_pending: Number of buffered writes that triggers a flush
+            flush_interval: Maximum seconds a write stays buffered
+        """
+        self.backend = backend
+        self.name = backend.name
+        self.max_pending = max_pending
+        self.flush_interval = flush_interval
+
+        # Buffered writes, replaced when the same key is written again
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._statuses: Dict[str, Dict[str, Any]] = {}
+        # Writes taken from the buffer by a flush that is still in progress
+        self._flushing_entries: Dict[str, Dict[str, Any]] = {}
+        self._flushing_statuses: Dict[str, Dict[str, Any]] = {}
+        self._pending_lock = threading.Lock()
+        self._wakeup = threading.Condition(self._pending_lock)
+
+        # Held while writing to the backend, so flushes and deletes don't interleave
+        self._io_lock = threading.RLock()
+
+        self._closed = False
+        self._flusher = threading.Thread(target=self._run_flusher, name="cache-write-behind", daemon=True)
+        self._flusher.start()
+
+    def _pending_count(self) -> int:
+        return len(self._entries) + len(self._statuses)
+
+    def _run_flusher(self) -> None:
+        """Flush the buffer when it fills up or its oldest write reaches the time limit."""
+        while True:
+            with self._wakeup:
+                while not self._closed and not self._pending_count():
+                    self._wakeup.wait()
+                if self._closed:
+                    return
+                # Wait for more writes up to the time limit, unless the buffer fills up first
+                deadline = time.monotonic() + self.flush_interval
+                while not self._closed and self._pending_count() < self.max_pending:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._wakeup.wait(remaining)
+                if self._closed:
+                    return
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Error flushing cache writes: {e}")
+
+    def flush(self) -> int:
+        """
+        Persist all buffered writes.
+
+        If the backend fails, the writes go back into the buffer (unless the key
+        was written again in the meantime) and are retried by the next flush.
+
+        Returns:
+            int: Number of writes persisted
+
+        Raises:
+            Exception: Whatever the backend raised
+        """
+        with self._io_lock:
+            with self._pending_lock:
+                entries, self._entries = self._entries, {}
+                statuses, self._statuses = self._statuses, {}
+                self._flushing_entries, self._flushing_statuses = entries, statuses
+            try:
+                if entries:
+                    self.backend.put_many(entries.items())
+                if statuses:
+                    self.backend.put_status_many(statuses.items())
+            except BaseException:
+                with self._pending_lock:
+                    for key, entry in entries.items():
+                        self._entries.setdefault(key, entry)
+                    for key, status in statuses.items():
+                        self._statuses.setdefault(key, status)
+                raise
+            finally:
+                with self._pending_lock:
+                    self._flushing_entries, self._flushing_statuses = {}, {}
+            return len(entries) + len(statuses)
+
+    def _buffer(self, target: Dict[str, Dict[str, Any]], key: str, record: Dict[str, Any]) -> None:
+        """Add a write to the buffer and wake the flusher."""
+        with self._wakeup:
+            target[key] = dict(record)
+            pending = self._pending_count()
+            if pending == 1 or pending >= self.max_pending:
+                self._wakeup.notify()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cache entry, including buffered writes."""
+        with self._pending_lock:
+            entry = self._entries.get(key) or self._flushing_entries.get(key)
+        if entry is not None:
+            return dict(entry)
+        return self.backend.get(key)
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """Buffer a cache entry."""
+        self._buffer(self._entries, key, entry)
+
+    def put_many(self, entries: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """Store several cache entries directly (bulk imports)."""
+        with self._io_lock:
+            self.flush()
+            self.backend.put_many(entries)
+
+    def delete(self, keys: Iterable[str]) -> int:
+        """Delete entries and their processing status, including buffered writes."""
+        keys = list(keys)
+        with self._io_lock:
+            self.flush()
+            return self.backend.delete(keys)
+
+    def scan(self) -> Iterator[EntryMeta]:
+        """Iterate over entry metadata after flushing the buffer."""
+        self.flush()
+        return self.backend.scan()
+
+    def expired_keys(self, cutoff: float, default_ttl: float) -> List[str]:
+        """Get keys of entries whose lifetime ended before `cutoff`."""
+        self.flush()
+        return self.backend.expired_keys(cutoff, default_ttl)
+
+    def keys_older_than(self, cutoff: float) -> List[str]:
+        """Get keys of entries stored before `cutoff`."""
+        self.flush()
+        return self.backend.keys_older_than(cutoff)
+
+    def get_status(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the processing status record of an entry, including buffered writes."""
+        with self._pending_lock:
+            status = self._statuses.get(key) or self._flushing_statuses.get(key)
+        if status is not None:
+            return {'id': status.get('id'), 'processed_stages': dict(status.get('processed_stages', {}))}
+        return self.backend.get_status(key)
+
+    def put_status(self, key: str, status: Dict[str, Any]) -> None:
+        """Buffer the processing status record of an entry."""
+        self._buffer(self._statuses, key, {'id': status.get('id'),
+                                           'processed_stages': dict(status.get('processed_stages', {}))})
+
+    def put_status_many(self, statuses: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """Store several processing status records directly (bulk imports)."""
+        with self._io_lock:
+            self.flush()
+            self.backend.put_status_many(statuses)
+
+    def count(self) -> int:
+        """Get the number of cached entries after flushing the buffer."""
+        self.flush()
+        return self.backend.count()
+
+    def poll_changes(self) -> Tuple[List[EntryMeta], Optional[List[str]]]:
+        """Get the entries other processes wrote or deleted since the last call."""
+        return self.backend.poll_changes()
+
+    def clear(self) -> int:
+        """Remove all entries, including buffered writes."""
+        with self._io_lock:
+            self.flush()
+            return self.backend.clear()
+
+    def close(self) -> None:
+        """Stop the flusher, persist buffered writes and close the backend."""
+        with self._wakeup:
+            if self._closed:
+                return
+            self._closed = True
+            self._wakeup.notify()
+        self._flusher.join()
+        self.flush()
+        self.backend.close()
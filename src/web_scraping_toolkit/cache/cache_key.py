@@ -0,0 +1,154 @@
+"""
+Cache Key Builder for the Web Scraping Toolkit.
+
+This module turns a request into the identifier it is cached under: the
+canonical URL (lowercased scheme and host, default port and fragment removed,
+query merged with the params dict and sorted, tracking parameters dropped),
+plus the method, selected request headers and the fetch mode when they matter.
+Paginated URLs such as `?page=2` and `?page=3` get separate entries, while
+`?utm_source=...` variants of the same page share one.
+"""
+
+import fnmatch
+import hashlib
+from typing import Dict, List, Any, Optional, Mapping, Sequence, Tuple
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from ..utils.config import get_cache_config
+
+# Query parameters that only track the visitor (glob patterns)
+DEFAULT_DROP_PARAMS = [
+    "utm_*", "gclid", "dclid", "gbraid", "wbraid", "fbclid", "msclkid", "yclid",
+    "mc_cid", "mc_eid", "_ga", "_gl", "igshid", "_hsenc", "_hsmi", "mkt_tok",
+]
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+class CacheKeyBuilder:
+    """
+    Builds cache identifiers for requests.
+
+    This class provides:
+    - URL canonicalization with sorted query parameters and tracking parameters removed
+    - Merging of a params dict into the query
+    - Optional inclusion of selected request headers (e.g. Accept-Language)
+    - Separate entries for HTTP and browser-rendered responses
+
+    A plain GET over HTTP without selected headers is keyed by its canonical
+    URL alone; other requests add a suffix such as " |mode=browser".
+    """
+
+    def __init__(
+        self,
+        drop_params: Optional[Sequence[str]] = None,
+        vary_headers: Optional[Sequence[str]] = None,
+        include_mode: Optional[bool] = None
+    ):
+        """
+        Initialize the key builder with optional custom settings.
+
+        Args:
+            drop_params: Query parameter names or glob patterns to ignore (overrides config)
+            vary_headers: Request headers whose values are part of the key (overrides config)
+            include_mode: Whether HTTP and rendered responses are cached separately (overrides config)
+        """
+        # Load cache configuration
+        config = get_cache_config()
+
+        # Override configuration with constructor parameters if provided
+        if drop_params is None:
+            drop_params = config.get("key_drop_params") or DEFAULT_DROP_PARAMS
+        if vary_headers is None:
+            vary_headers = config.get("key_headers", [])
+        self.include_mode = include_mode if include_mode is not None else config.get("key_include_mode", True)
+
+        self.drop_params = [p.lower() for p in drop_params]
+        self.vary_headers = [h.lower() for h in vary_headers]
+
+    def _is_dropped(self, name: str) -> bool:
+        """Check whether a query parameter is ignored."""
+        name = name.lower()
+        return any(fnmatch.fnmatchcase(name, pattern) for pattern in self.drop_params)
+
+    def canonical_url(self, url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        """
+        Canonicalize a URL.
+
+        Args:
+            url: The URL
+            params: Optional query parameters sent with the request
+
+        Returns:
+            str: The canonical URL (stable when applied again)
+        """
+        parts = urlsplit(url.strip())
+        scheme = parts.scheme.lower()
+        host = (parts.hostname or "").lower()
+        if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+            host = f"{host}:{parts.port}"
+        if parts.username:
+            host = f"{parts.username}@{host}"
+
+        # Remove trailing slash
+        path = parts.path
+        if path.endswith("/"):
+            path = path[:-1]
+
+        query: List[Tuple[str, str]] = parse_qsl(parts.query, keep_blank_values=True)
+        for name, value in (params or {}).items():
+            values = value if isinstance(value, (list, tuple)) else [value]
+            query.extend((str(name), "" if v is None else str(v)) for v in values)
+        query = sorted((name, value) for name, value in query if not self._is_dropped(name))
+
+        return urlunsplit((scheme, host, path, urlencode(query), ""))
+
+    def build(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        mode: Optional[str] = None,
+        method: str = "GET"
+    ) -> str:
+        """
+        Build the cache identifier of a request.
+
+        Args:
+            url: The URL
+            params: Optional query parameters
+            headers: Optional request headers
+            mode: The fetch mode ('http' or 'browser'), if responses are kept apart by mode
+            method: The HTTP method
+
+        Returns:
+            str: The cache identifier
+        """
+        key = self.canonical_url(url, params)
+        if method.upper() != "GET":
+            key = f"{method.upper()} {key}"
+
+        suffix = []
+        if self.include_mode and mode and mode != "http":
+            suffix.append(f"mode={mode}")
+        if headers and self.vary_headers:
+            lowered: Dict[str, str] = {name.lower(): value for name, value in headers.items()}
+            for name in self.vary_headers:
+                if name in lowered:
+                    suffix.append(f"{name}={' '.join(str(lowered[name]).split())}")
+
+        return " |".join([key] + suffix)
+
+    def storage_key(self, item_id: str) -> str:
+        """
+        Get the key an item is stored under in a cache backend.
+
+        Args:
+            item_id: The item identifier (a URL, an identifier from `build`, a query, etc.)
+
+        Returns:
+            str: Hash of the canonical identifier, safe to use as a file name
+        """
+        # Identifiers built with a suffix are already canonical
+        if item_id.startswith(('http://', 'https://')) and ' ' not in item_id:
+            item_id = self.canonical_url(item_id)
+        return hashlib.md5(item_id.encode('utf-8')).hexdigest()
@@ -2,19 +2,27 @@
 Cache Mechanism for the Web Scraping Toolkit.
 
 This module provides functionality to cache scraping results, track processing
-status, and implement file-based persistence.
+status, and implement persistence through a pluggable storage backend.
 """
 
 import os
-import json
 import time
-import hashlib
+import atexit
+import weakref
 from typing import Dict, List, Any, Optional, Set, Union
 from datetime import datetime, timedelta
 import threading
 
 from ..utils.logger import get_logger
 from ..utils.config import get_cache_config
+from ..utils.locks import StripedLock
+from .cache_key import CacheKeyBuilder
+from .backends.base import CacheBackend
+from .backends.compressed_backend import CompressedCacheBackend, PayloadCodec
+from .backends.factory import create_backend
+from .backends.tiered_backend import TieredCacheBackend
+from .backends.write_behind import WriteBehindBackend
+from .expiry_index import ExpiryIndex
 
 # Initialize logger
 logger = get_logger("cache_mechanism")
@@ -24,9 +32,14 @@ class CacheMechanism:
     Manages a caching system for web scraping data with status tracking.
     
     This class provides:
-    - Persistent caching of scraped data
+    - Persistent caching of scraped data in a configurable backend (JSON, filesystem, SQLite or memory)
+    - A bounded in-memory LRU tier in front of disk-based backends
+    - Optional compression of cached data, with dictionaries trained per domain
+    - Optional write-behind batching of writes, with explicit flush()
+    - Sharing one cache directory between processes, each seeing the others' entries
     - Multi-stage processing status tracking
-    - Automatic cache invalidation based on time
+    - Automatic cache invalidation based on time, with optional per-item lifetimes
+    - Retention of expired items for a while, so they can be revalidated
     - File existence checking to confirm results are ready
     """
     
@@ -35,7 +48,18 @@ class CacheMechanism:
         cache_name: str,
         cache_dir: Optional[str] = None,
         expiration_seconds: Optional[int] = None,
-        enabled: Optional[bool] = None
+        enabled: Optional[bool] = None,
+        stale_retention_seconds: Optional[int] = None,
+        key_builder: Optional[CacheKeyBuilder] = None,
+        backend: Optional[Union[str, CacheBackend]] = None,
+        hot_max_entries: Optional[int] = None,
+        hot_max_bytes: Optional[int] = None,
+        sweep_interval: Optional[float] = None,
+        write_behind: Optional[bool] = None,
+        durable: Optional[bool] = None,
+        lock_stripes: Optional[int] = None,
+        shared_poll_interval: Optional[float] = None,
+        compression: Optional[str] = None
     ):
         """
         Initialize the cache mechanism with optional custom settings.
@@ -45,6 +69,18 @@ class CacheMechanism:
             cache_dir: Directory to store cache files (overrides config)
             expiration_seconds: Cache expiration time in seconds (overrides config)
             enabled: Whether caching is enabled (overrides config)
+            stale_retention_seconds: How long expired items are kept for revalidation (overrides config)
+            key_builder: Optional builder used to canonicalize URL item ids (defaults to config)
+            backend: Storage backend name ('json', 'filesystem', 'sqlite', 'memory') or instance (overrides config)
+            hot_max_entries: Maximum entries in the in-memory LRU tier, 0 to disable it (overrides config)
+            hot_max_bytes: Maximum estimated bytes in the in-memory LRU tier, 0 for no size limit (overrides config)
+            sweep_interval: Minimum seconds between bulk removals of expired items (overrides config)
+            write_behind: Whether writes are buffered and persisted in batches in the background (overrides config)
+            durable: Whether each persisted write is synced to disk before it returns (overrides config)
+            lock_stripes: Number of reader/writer locks items are spread over (overrides config)
+            shared_poll_interval: Minimum seconds between checks for entries written by other
+                processes sharing the cache directory, 0 to check on every lookup (overrides config)
+            compression: How cached data is compressed: 'zstd', 'zlib' or 'none' (overrides config)
         """
         # Load cache configuration
         self.config = get_cache_config()
@@ -53,104 +89,272 @@ class CacheMechanism:
         self.cache_enabled = enabled if enabled is not None else self.config.get("enabled", True)
         self.cache_name = cache_name
         self.cache_dir = cache_dir or self.config.get("directory", "cache")
+        self.key_builder = key_builder or CacheKeyBuilder()
         self.expiration_seconds = expiration_seconds or self.config.get("expiration", 86400)
+        self.stale_retention_seconds = (
+            stale_retention_seconds if stale_retention_seconds is not None
+            else self.config.get("stale_retention", 604800)
+        )
+        self.sweep_interval = sweep_interval if sweep_interval is not None else self.config.get("sweep_interval", 60)
+        self.shared_poll_interval = (
+            shared_poll_interval if shared_poll_interval is not None
+            else self.config.get("shared_poll_interval", 1.0)
+        )
         
         # Ensure cache directory exists
         self.cache_path = os.path.join(self.cache_dir, self.cache_name)
         os.makedirs(self.cache_path, exist_ok=True)
         
-        # Cache metadata file paths
-        self.items_file = os.path.join(self.cache_path, "items.json")
-        self.status_file = os.path.join(self.cache_path, "status.json")
+        # Storage backend for entries and processing status
+        self.durable = durable if durable is not None else self.config.get("durable", False)
+        if isinstance(backend, CacheBackend):
+            self.store = backend
+        else:
+            self.store = create_backend(backend or self.config.get("backend", "filesystem"), self.cache_path,
+                                        durable=self.durable, key_for=self._get_cache_key)
+        self.backend = self.store.name
+        
+        # Compress data before it reaches the backend (off the hot path with write-behind);
+        # with compression off, data compressed earlier is still decoded
+        self.compression = (compression or self.config.get("compression", "none")).lower()
+        if self.backend != "memory":
+            self.store = CompressedCacheBackend(self.store, PayloadCodec(
+                self.compression,
+                level=self.config.get("compression_level", 3),
+                min_bytes=self.config.get("compression_min_bytes", 512),
+                dictionary_dir=os.path.join(self.cache_path, "dictionaries"),
+                dict_samples=self.config.get("compression_dict_samples", 0)
+            ))
+        
+        # Buffer writes and persist them in batches from a background thread
+        self.write_behind = write_behind if write_behind is not None else self.config.get("write_behind", False)
+        if self.write_behind and self.backend != "memory":
+            self.store = WriteBehindBackend(
+                self.store,
+                max_pending=self.config.get("flush_max_pending", 100),
+                flush_interval=self.config.get("flush_interval", 1.0)
+            )
+            # Persist buffered writes when the interpreter exits
+            atexit.register(_flush_cache_at_exit, weakref.ref(self))
+        
+        # Bounded hot tier in memory; the json and memory backends already hold everything in RAM
+        hot_max_entries = hot_max_entries if hot_max_entries is not None else self.config.get("hot_max_entries", 1000)
+        hot_max_bytes = hot_max_bytes if hot_max_bytes is not None else self.config.get("hot_max_bytes", 64 * 1024 * 1024)
+        if self.backend not in ("json", "memory") and hot_max_entries > 0:
+            self.store = TieredCacheBackend(self.store, hot_max_entries, hot_max_bytes)
         
-        # In-memory cache
-        self.items_cache: Dict[str, Any] = {}
-        self.status_cache: Dict[str, Dict[str, Any]] = {}
+        # Reader/writer locks striped by cache key: reads never wait on each other,
+        # and writes only wait for operations on keys sharing their stripe
+        self._locks = StripedLock(lock_stripes or self.config.get("lock_stripes", 64))
         
-        # Thread lock for thread safety
-        self._lock = threading.RLock()
+        # Removal deadlines of all entries, so sweeps don't scan the whole cache
+        self._expiry = ExpiryIndex()
+        self._expiry_lock = threading.Lock()
+        self._sweep_lock = threading.Lock()
+        self._last_sweep = 0.0
+        for key, _, timestamp, ttl in self.store.scan():
+            self._expiry.set(key, self._purge_deadline(timestamp, ttl))
+        self._last_poll = time.monotonic()
         
-        # Load cache from disk if it exists
-        self._load_cache()
+        # Remove expired items left over from previous runs
+        self._remove_expired_items(force=True)
         
         if self.cache_enabled:
-            logger.info(f"Cache mechanism '{cache_name}' initialized in {self.cache_path}")
+            logger.info(f"Cache mechanism '{cache_name}' initialized in {self.cache_path} ({self.backend} backend)")
             logger.info(f"Cache expiration: {self.expiration_seconds} seconds")
         else:
             logger.info(f"Cache mechanism '{cache_name}' initialized with caching disabled")
     
-    def _load_cache(self) -> None:
-        """Load cache data from disk."""
-        with self._lock:
-            # Load items cache
-            if os.path.exists(self.items_file):
-                try:
-                    with open(self.items_file, 'r', encoding='utf-8') as f:
-                        self.items_cache = json.load(f)
-                    logger.info(f"Loaded {len(self.items_cache)} cached items from {self.items_file}")
-                except Exception as e:
-                    logger.error(f"Error loading items cache: {e}")
-                    self.items_cache = {}
-            
-            # Load status cache
-            if os.path.exists(self.status_file):
-                try:
-                    with open(self.status_file, 'r', encoding='utf-8') as f:
-                        self.status_cache = json.load(f)
-                    logger.info(f"Loaded processing status for {len(self.status_cache)} items")
-                except Exception as e:
-                    logger.error(f"Error loading status cache: {e}")
-                    self.status_cache = {}
-            
-            # Remove expired items
-            self._remove_expired_items()
+    def __enter__(self) -> "CacheMechanism":
+        return self
     
-    def _save_cache(self) -> None:
-        """Save cache data to disk."""
-        if not self.cache_enabled:
-            return
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def _layer(self, layer_class: type) -> Optional[CacheBackend]:
+        """Find the wrapper of a given class among the layers of the store, if any."""
+        store = self.store
+        while store is not None and not isinstance(store, layer_class):
+            store = getattr(store, 'backend', None)
+        return store
+    
+    def flush(self) -> int:
+        """
+        Persist writes buffered in write-behind mode.
+        
+        Returns:
+            int: Number of writes persisted (always 0 without write-behind)
+        """
+        store = self._layer(WriteBehindBackend)
+        return store.flush() if store is not None else 0
+    
+    @property
+    def items_cache(self) -> Dict[str, Any]:
+        """
+        Read-only snapshot of all cache entries by cache key.
+        
+        Kept for compatibility with code written for the JSON-only cache; it
+        loads every entry from the backend, so prefer `get_cached_data`.
+        Changes to the returned dict are not stored.
+        """
+        items = {}
+        for key, _, _, _ in self.store.scan():
+            entry = self.store.get(key)
+            if entry is not None:
+                items[key] = entry
+        return items
+    
+    @property
+    def status_cache(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Read-only snapshot of the processing status records of all cache entries.
+        
+        Kept for compatibility with code written for the JSON-only cache; prefer
+        `is_processed_by_stage`. Changes to the returned dict are not stored.
+        """
+        statuses = {}
+        for key, _, _, _ in self.store.scan():
+            status = self.store.get_status(key)
+            if status is not None:
+                statuses[key] = status
+        return statuses
+    
+    def close(self) -> None:
+        """Persist buffered writes and close the storage backend."""
+        with self._locks.write_all():
+            self.store.close()
+    
+    def _is_expired(self, item: Dict[str, Any], current_time: Optional[float] = None) -> bool:
+        """
+        Check whether a cache entry is past its expiration.
+        
+        Entries stored with a `ttl` expire after their own lifetime, others
+        after `expiration_seconds`.
+        
+        Args:
+            item: The cache entry
+            current_time: The time to check against (defaults to now)
             
-        with self._lock:
-            # Save items cache
-            try:
-                with open(self.items_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.items_cache, f, ensure_ascii=False, indent=2)
-            except Exception as e:
-                logger.error(f"Error saving items cache: {e}")
-            
-            # Save status cache
-            try:
-                with open(self.status_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.status_cache, f, ensure_ascii=False, indent=2)
-            except Exception as e:
-                logger.error(f"Error saving status cache: {e}")
+        Returns:
+            bool: True if the entry is stale
+        """
+        if current_time is None:
+            current_time = time.time()
+        ttl = item.get('ttl')
+        if ttl is None:
+            ttl = self.expiration_seconds
+        return current_time - item.get('timestamp', 0) > ttl
+    
+    def _purge_deadline(self, timestamp: float, ttl: Optional[float]) -> float:
+        """Get the time after which an entry is past expiration and the stale retention window."""
+        return timestamp + (self.expiration_seconds if ttl is None else ttl) + self.stale_retention_seconds
+    
+    def _poll_other_processes(self, force: bool = False) -> None:
+        """
+        Pick up entries written or deleted by other processes sharing the cache directory.
+        
+        Their entries join the expiry index, so this process removes them
+        too once due, and the hot tier drops its copies of changed entries.
+        Runs at most once per `shared_poll_interval` unless forced.
+        
+        Args:
+            force: Poll even if the last poll was less than `shared_poll_interval` ago
+        """
+        now = time.monotonic()
+        if not force and now - self._last_poll < self.shared_poll_interval:
+            return
+        self._last_poll = now
+        
+        written, deleted = self.store.poll_changes()
+        with self._expiry_lock:
+            if deleted is None:
+                # Unknown deletions; written lists every entry
+                self._expiry.clear()
+            else:
+                for key in deleted:
+                    self._expiry.discard(key)
+            # Only ever postpone, so a late report can't expire a fresher local write
+            for key, _, timestamp, ttl in written:
+                self._expiry.extend(key, self._purge_deadline(timestamp, ttl))
     
-    def _remove_expired_items(self) -> None:
-        """Remove expired items from the cache."""
+    def _remove_expired_items(self, force: bool = False) -> None:
+        """
+        Remove items that are past expiration and the stale retention window.
+        
+        Due items are popped from the expiry index, at most once per
+        `sweep_interval` unless forced; lookups check their own entry lazily.
+        Only one thread sweeps at a time; others carry on without waiting.
+        
+        Args:
+            force: Sweep even if the last sweep was less than `sweep_interval` ago
+        """
         if not self.cache_enabled:
             return
+        
+        now = time.time()
+        if not force and now - self._last_sweep < self.sweep_interval:
+            return
+        if not self._sweep_lock.acquire(blocking=force):
+            return
+        try:
+            self._last_sweep = now
+            self._poll_other_processes(force=True)
+            
+            # Expired items stay around for a while so they can be revalidated
+            with self._expiry_lock:
+                due_keys = self._expiry.pop_due(now)
+            
+            # Remove expired items and their status, unless rewritten since
+            removed = 0
+            for key in due_keys:
+                with self._locks.for_key(key).write():
+                    with self._expiry_lock:
+                        rewritten = key in self._expiry
+                    if not rewritten:
+                        removed += self.store.delete([key])
+            if removed:
+                logger.info(f"Removed {removed} expired items from cache")
+        finally:
+            self._sweep_lock.release()
+    
+    def _lookup(self, item_id: str, include_stale: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Get the cache entry of an item, checking its expiration.
+        
+        Entries past the stale retention window are removed on the spot.
+        
+        Args:
+            item_id: The item identifier (e.g., URL, query, etc.)
+            include_stale: Whether expired entries still within the stale retention window count
             
-        with self._lock:
-            current_time = time.time()
-            expired_keys = []
-            
-            # Check items for expiration
-            for key, item in self.items_cache.items():
-                cached_time = item.get('timestamp', 0)
-                if current_time - cached_time > self.expiration_seconds:
-                    expired_keys.append(key)
-            
-            # Remove expired items
-            for key in expired_keys:
-                if key in self.items_cache:
-                    del self.items_cache[key]
-                if key in self.status_cache:
-                    del self.status_cache[key]
-            
-            if expired_keys:
-                logger.info(f"Removed {len(expired_keys)} expired items from cache")
-                # Save changes to disk
-                self._save_cache()
+        Returns:
+            Optional[Dict[str, Any]]: The cache entry, or None if not cached
+        """
+        self._poll_other_processes()
+        self._remove_expired_items()
+        
+        cache_key = self._get_cache_key(item_id)
+        lock = self._locks.for_key(cache_key)
+        with lock.read():
+            item = self.store.get(cache_key)
+        if item is None:
+            return None
+        
+        now = time.time()
+        if now > self._purge_deadline(item.get('timestamp', 0), item.get('ttl')):
+            with lock.write():
+                # Recheck, the item may have been rewritten meanwhile
+                item = self.store.get(cache_key)
+                if item is not None and now > self._purge_deadline(item.get('timestamp', 0), item.get('ttl')):
+                    self.store.delete([cache_key])
+                    with self._expiry_lock:
+                        self._expiry.discard(cache_key)
+                    item = None
+            if item is None:
+                return None
+        if not include_stale and self._is_expired(item, now):
+            return None
+        return item
     
     def _get_cache_key(self, item_id: str) -> str:
         """
@@ -163,24 +367,17 @@ class CacheMechanism:
             str: Normalized cache key
         """
         # Normalize item_id to ensure consistent caching
-        # For URLs, this helps handle slight variations (trailing slashes, etc.)
-        if item_id.startswith(('http://', 'https://')):
-            # Remove query parameters for simpler caching
-            if '?' in item_id:
-                item_id = item_id.split('?')[0]
-            # Remove trailing slash
-            if item_id.endswith('/'):
-                item_id = item_id[:-1]
-                
-        # Generate a hash for the key to ensure valid filenames
-        return hashlib.md5(item_id.encode('utf-8')).hexdigest()
+        # For URLs, this helps handle slight variations (trailing slashes,
+        # query parameter order, tracking parameters, etc.)
+        return self.key_builder.storage_key(item_id)
     
-    def is_cached(self, item_id: str) -> bool:
+    def is_cached(self, item_id: str, include_stale: bool = False) -> bool:
         """
         Check if an item is in the cache.
         
         Args:
             item_id: The item identifier (e.g., URL, query, etc.)
+            include_stale: Whether expired items still within the stale retention window count
             
         Returns:
             bool: True if the item is cached
@@ -188,22 +385,37 @@ class CacheMechanism:
         if not self.cache_enabled:
             return False
             
-        with self._lock:
-            # Remove expired items first
-            self._remove_expired_items()
+        return self._lookup(item_id, include_stale) is not None
+    
+    def seconds_since_expiry(self, item_id: str) -> Optional[float]:
+        """
+        Get how long ago an item expired.
+        
+        Args:
+            item_id: The item identifier (e.g., URL, query, etc.)
             
-            # Get normalized cache key
-            cache_key = self._get_cache_key(item_id)
+        Returns:
+            Optional[float]: Seconds past expiration (negative while fresh), or None if not cached
+        """
+        if not self.cache_enabled:
+            return None
             
-            # Check if it's in the cache
-            return cache_key in self.items_cache
+        item = self._lookup(item_id, include_stale=True)
+        if item is None:
+            return None
+        
+        ttl = item.get('ttl')
+        if ttl is None:
+            ttl = self.expiration_seconds
+        return time.time() - item.get('timestamp', 0) - ttl
     
-    def get_cached_data(self, item_id: str) -> Optional[Any]:
+    def get_cached_data(self, item_id: str, include_stale: bool = False) -> Optional[Any]:
         """
         Get data for an item from the cache.
         
         Args:
             item_id: The item identifier (e.g., URL, query, etc.)
+            include_stale: Whether to return expired data still within the stale retention window
             
         Returns:
             Optional[Any]: The cached data or None if not cached
@@ -211,27 +423,22 @@ class CacheMechanism:
         if not self.cache_enabled:
             return None
             
-        with self._lock:
-            # Check if item is cached
-            if not self.is_cached(item_id):
-                return None
-            
-            # Get normalized cache key
-            cache_key = self._get_cache_key(item_id)
-            
-            # Get cached item
-            cached_item = self.items_cache.get(cache_key, {})
-            
-            # Return the data
-            return cached_item.get('data')
+        # Get cached item
+        cached_item = self._lookup(item_id, include_stale)
+        if cached_item is None:
+            return None
+        
+        # Return the data
+        return cached_item.get('data')
     
-    def cache_data(self, item_id: str, data: Any) -> bool:
+    def cache_data(self, item_id: str, data: Any, ttl: Optional[float] = None) -> bool:
         """
         Store data for an item in the cache.
         
         Args:
             item_id: The item identifier (e.g., URL, query, etc.)
             data: The data to cache
+            ttl: Optional lifetime of this item in seconds (defaults to expiration_seconds)
             
         Returns:
             bool: True if caching was successful
@@ -239,10 +446,10 @@ class CacheMechanism:
         if not self.cache_enabled:
             return False
             
-        with self._lock:
-            # Get normalized cache key
-            cache_key = self._get_cache_key(item_id)
-            
+        # Get normalized cache key
+        cache_key = self._get_cache_key(item_id)
+        
+        with self._locks.for_key(cache_key).write():
             # Create cache entry
             cache_entry = {
                 'id': item_id,
@@ -250,19 +457,20 @@ class CacheMechanism:
                 'timestamp': time.time(),
                 'date': datetime.now().isoformat()
             }
+            if ttl is not None:
+                cache_entry['ttl'] = ttl
             
             # Store in cache
-            self.items_cache[cache_key] = cache_entry
+            self.store.put(cache_key, cache_entry)
+            with self._expiry_lock:
+                self._expiry.set(cache_key, self._purge_deadline(cache_entry['timestamp'], ttl))
             
             # Initialize status tracking if not exists
-            if cache_key not in self.status_cache:
-                self.status_cache[cache_key] = {
+            if self.store.get_status(cache_key) is None:
+                self.store.put_status(cache_key, {
                     'id': item_id,
                     'processed_stages': {}
-                }
-            
-            # Save to disk
-            self._save_cache()
+                })
             
             return True
     
@@ -280,15 +488,16 @@ class CacheMechanism:
         if not self.cache_enabled:
             return False
             
-        with self._lock:
-            # Get normalized cache key
-            cache_key = self._get_cache_key(item_id)
-            
+        # Get normalized cache key
+        cache_key = self._get_cache_key(item_id)
+        
+        with self._locks.for_key(cache_key).write():
             # Check if item exists in cache
-            if cache_key not in self.status_cache:
-                if cache_key in self.items_cache:
+            status = self.store.get_status(cache_key)
+            if status is None:
+                if self.store.get(cache_key) is not None:
                     # Initialize status if item exists but status doesn't
-                    self.status_cache[cache_key] = {
+                    status = {
                         'id': item_id,
                         'processed_stages': {}
                     }
@@ -298,13 +507,13 @@ class CacheMechanism:
                     return False
             
             # Mark as processed
-            self.status_cache[cache_key]['processed_stages'][stage] = {
+            status['processed_stages'][stage] = {
                 'timestamp': time.time(),
                 'date': datetime.now().isoformat()
             }
             
             # Save to disk
-            self._save_cache()
+            self.store.put_status(cache_key, status)
             
             return True
     
@@ -322,15 +531,17 @@ class CacheMechanism:
         if not self.cache_enabled:
             return False
         
-        with self._lock:
-            # Get normalized cache key
-            cache_key = self._get_cache_key(item_id)
-            
+        # Get normalized cache key
+        cache_key = self._get_cache_key(item_id)
+        self._poll_other_processes()
+        
+        with self._locks.for_key(cache_key).read():
             # Check if item exists and has been processed
-            if cache_key not in self.status_cache:
+            status = self.store.get_status(cache_key)
+            if status is None:
                 return False
                 
-            return stage in self.status_cache[cache_key].get('processed_stages', {})
+            return stage in status.get('processed_stages', {})
     
     def reset_processing_status(self, item_id: str, stage: Optional[str] = None) -> bool:
         """
@@ -346,25 +557,26 @@ class CacheMechanism:
         if not self.cache_enabled:
             return False
             
-        with self._lock:
-            # Get normalized cache key
-            cache_key = self._get_cache_key(item_id)
-            
+        # Get normalized cache key
+        cache_key = self._get_cache_key(item_id)
+        
+        with self._locks.for_key(cache_key).write():
             # Check if item exists
-            if cache_key not in self.status_cache:
+            status = self.store.get_status(cache_key)
+            if status is None:
                 return False
                 
             # Reset specific stage or all stages
             if stage:
-                if stage in self.status_cache[cache_key].get('processed_stages', {}):
-                    del self.status_cache[cache_key]['processed_stages'][stage]
+                if stage in status.get('processed_stages', {}):
+                    del status['processed_stages'][stage]
                     logger.info(f"Reset processing status for item {item_id} at stage {stage}")
             else:
-                self.status_cache[cache_key]['processed_stages'] = {}
+                status['processed_stages'] = {}
                 logger.info(f"Reset all processing stages for item {item_id}")
             
             # Save to disk
-            self._save_cache()
+            self.store.put_status(cache_key, status)
             
             return True
     
@@ -381,24 +593,25 @@ class CacheMechanism:
         if not self.cache_enabled:
             return []
             
-        with self._lock:
-            # Remove expired items first
-            self._remove_expired_items()
-            
-            unprocessed = []
-            
-            # Check each item in cache
-            for cache_key, item in self.items_cache.items():
-                item_id = item.get('id')
-                if not item_id:
-                    continue
-                    
-                # Check if item has status and if it's been processed
-                if (cache_key not in self.status_cache or
-                        stage not in self.status_cache[cache_key].get('processed_stages', {})):
-                    unprocessed.append(item_id)
-            
-            return unprocessed
+        # Remove expired items first
+        self._poll_other_processes()
+        self._remove_expired_items()
+        
+        unprocessed = []
+        
+        # Check each item in cache (a snapshot; items written meanwhile may be missed)
+        current_time = time.time()
+        for cache_key, item_id, timestamp, ttl in self.store.scan():
+            if not item_id or self._is_expired({'timestamp': timestamp, 'ttl': ttl}, current_time):
+                continue
+                
+            # Check if item has status and if it's been processed
+            with self._locks.for_key(cache_key).read():
+                status = self.store.get_status(cache_key)
+            if status is None or stage not in status.get('processed_stages', {}):
+                unprocessed.append(item_id)
+        
+        return unprocessed
     
     def verify_output_exists(self, item_id: str, expected_file: str) -> bool:
         """
@@ -437,16 +650,38 @@ class CacheMechanism:
         if not self.cache_enabled:
             return []
             
-        with self._lock:
-            # Get normalized cache key
-            cache_key = self._get_cache_key(item_id)
-            
+        # Get normalized cache key
+        cache_key = self._get_cache_key(item_id)
+        self._poll_other_processes()
+        
+        with self._locks.for_key(cache_key).read():
             # Check if item exists
-            if cache_key not in self.status_cache:
+            status = self.store.get_status(cache_key)
+            if status is None:
                 return []
                 
             # Get all stages
-            return list(self.status_cache[cache_key].get('processed_stages', {}).keys())
+            return list(status.get('processed_stages', {}).keys())
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dict[str, Any]: The 'backend' name, number of 'entries', 'hot' tier
+            counters (entries, bytes, hits, misses, hit_rate, evictions) or None, and
+            'compression' byte counts of the data this cache mechanism wrote since it was
+            created, not persisted (codec, entries, raw_bytes, stored_bytes, ratio,
+            dictionaries, and the same per domain) or None
+        """
+        tiered = self._layer(TieredCacheBackend)
+        compressed = self._layer(CompressedCacheBackend)
+        return {
+            'backend': self.backend,
+            'entries': self.store.count() if self.cache_enabled else 0,
+            'hot': tiered.hot.stats() if tiered is not None else None,
+            'compression': compressed.codec.stats() if compressed is not None and compressed.codec.codec != "none" else None
+        }
     
     def clear_cache(self, age_days: Optional[int] = None) -> int:
         """
@@ -461,35 +696,28 @@ class CacheMechanism:
         if not self.cache_enabled:
             return 0
             
-        with self._lock:
-            original_count = len(self.items_cache)
-            
+        with self._locks.write_all():
             if age_days is not None:
                 # Clear items older than the specified age
                 cutoff_time = time.time() - (age_days * 86400)
-                keys_to_remove = []
-                
-                for key, item in self.items_cache.items():
-                    cached_time = item.get('timestamp', 0)
-                    if cached_time < cutoff_time:
-                        keys_to_remove.append(key)
+                keys_to_remove = self.store.keys_older_than(cutoff_time)
                 
                 # Remove items and their status
-                for key in keys_to_remove:
-                    if key in self.items_cache:
-                        del self.items_cache[key]
-                    if key in self.status_cache:
-                        del self.status_cache[key]
-                
-                cleared_count = len(keys_to_remove)
+                cleared_count = self.store.delete(keys_to_remove)
+                with self._expiry_lock:
+                    for key in keys_to_remove:
+                        self._expiry.discard(key)
             else:
                 # Clear everything
-                cleared_count = original_count
-                self.items_cache = {}
-                self.status_cache = {}
-            
-            # Save changes
-            self._save_cache()
+                cleared_count = self.store.clear()
+                with self._expiry_lock:
+                    self._expiry.clear()
             
             logger.info(f"Cleared {cleared_count} items from cache")
-            return cleared_count 
\ No newline at end of file
+            return cleared_count
+
+def _flush_cache_at_exit(cache_ref: "weakref.ref") -> None:
+    """Persist a cache's buffered writes at interpreter exit if it is still alive."""
+    cache = cache_ref()
+    if cache is not None:
+        cache.flush()
@@ -0,0 +1,192 @@
+"""
+Cache Policy for the Web Scraping Toolkit.
+
+This module decides how long a cached HTTP response stays fresh. The lifetime
+is taken from the response's `Cache-Control: max-age` or `Expires` header,
+clamped to configured bounds, and can be fixed or capped per domain. Entries
+without caching headers fall back to the cache's own expiration. An opt-in
+stale-while-revalidate window lets expired entries be served while they are
+refreshed.
+"""
+
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional, Mapping
+
+from ..utils.logger import get_logger
+from ..utils.config import get_cache_config
+from ..utils.domain_rules import get_host, match_domain_rule
+
+# Initialize logger
+logger = get_logger("cache_policy")
+
+def parse_cache_control(value: str) -> Dict[str, Optional[str]]:
+    """
+    Parse a Cache-Control header.
+
+    Args:
+        value: The header value, e.g. 'public, max-age=300'
+
+    Returns:
+        Dict[str, Optional[str]]: Lowercased directives mapped to their argument (None if they have none)
+    """
+    directives: Dict[str, Optional[str]] = {}
+    for part in value.split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.strip().lower()] = argument.strip().strip('"') if argument else None
+    return directives
+
+def _parse_http_date(value: Optional[str]) -> Optional[float]:
+    """Parse an HTTP date into a Unix timestamp, or None if it is invalid."""
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+class CachePolicy:
+    """
+    Per-entry freshness lifetimes for cached responses.
+
+    This class provides:
+    - Lifetimes from `Cache-Control: max-age` (minus `Age`) or `Expires`
+    - `no-store` detection, for responses that must not be cached
+    - Global minimum/maximum bounds on header-derived lifetimes
+    - Per-domain or glob-pattern rules that fix (`ttl`) or bound (`min_ttl`, `max_ttl`) the lifetime
+    - A stale-while-revalidate window, globally or per rule (`stale_while_revalidate`)
+    """
+
+    def __init__(
+        self,
+        respect_headers: Optional[bool] = None,
+        min_ttl: Optional[float] = None,
+        max_ttl: Optional[float] = None,
+        rules: Optional[Dict[str, Dict[str, Any]]] = None,
+        stale_while_revalidate: Optional[float] = None
+    ):
+        """
+        Initialize the cache policy with optional custom settings.
+
+        Args:
+            respect_headers: Whether to use Cache-Control/Expires (overrides config)
+            min_ttl: Shortest lifetime taken from headers, in seconds (overrides config)
+            max_ttl: Longest lifetime taken from headers, in seconds, 0 for no cap (overrides config)
+            rules: Mapping of domain or glob pattern to {"ttl", "min_ttl", "max_ttl", "respect_headers",
+                "stale_while_revalidate"} (overrides config)
+            stale_while_revalidate: Seconds past expiry an entry may still be served while it is refreshed,
+                0 to disable (overrides config)
+        """
+        # Load cache configuration
+        config = get_cache_config()
+
+        # Override configuration with constructor parameters if provided
+        self.respect_headers = respect_headers if respect_headers is not None else config.get("respect_headers", True)
+        self.min_ttl = min_ttl if min_ttl is not None else config.get("min_ttl", 0)
+        self.max_ttl = max_ttl if max_ttl is not None else config.get("max_ttl", 0)
+        self.rules = rules if rules is not None else config.get("ttl_rules", {})
+        self.stale_while_revalidate = (
+            stale_while_revalidate if stale_while_revalidate is not None
+            else config.get("stale_while_revalidate", 0)
+        )
+
+    def _rule_for(self, url: str) -> Dict[str, Any]:
+        """Get the rule that applies to a URL's host (empty if none)."""
+        key = match_domain_rule(get_host(url), self.rules)
+        return self.rules[key] if key is not None else {}
+
+    def is_storable(self, url: str, headers: Mapping[str, str]) -> bool:
+        """
+        Check whether a response may be cached at all.
+
+        Args:
+            url: The URL that was fetched
+            headers: The response headers (a case-insensitive mapping)
+
+        Returns:
+            bool: False if the response says `Cache-Control: no-store` and no fixed ttl overrides it
+        """
+        rule = self._rule_for(url)
+        if "ttl" in rule or not rule.get("respect_headers", self.respect_headers):
+            return True
+        return "no-store" not in parse_cache_control(headers.get("Cache-Control", ""))
+
+    def ttl_for(self, url: str, headers: Mapping[str, str], now: Optional[float] = None) -> Optional[float]:
+        """
+        Get the freshness lifetime of a response.
+
+        Args:
+            url: The URL that was fetched
+            headers: The response headers (a case-insensitive mapping)
+            now: The time the response was received (defaults to now)
+
+        Returns:
+            Optional[float]: Seconds the entry stays fresh, or None to use the cache's default expiration
+        """
+        rule = self._rule_for(url)
+        if "ttl" in rule:
+            return float(rule["ttl"])
+
+        ttl = None
+        if rule.get("respect_headers", self.respect_headers):
+            ttl = self._ttl_from_headers(headers, time.time() if now is None else now)
+        if ttl is None:
+            return None
+
+        min_ttl = rule.get("min_ttl", self.min_ttl)
+        max_ttl = rule.get("max_ttl", self.max_ttl)
+        if max_ttl:
+            ttl = min(ttl, float(max_ttl))
+        return max(ttl, float(min_ttl or 0))
+
+    def stale_window(self, url: str) -> float:
+        """
+        Get how long past expiry a cached entry for a URL may be served while it is refreshed.
+
+        Args:
+            url: The URL to look up
+
+        Returns:
+            float: The stale-while-revalidate window in seconds (0 if disabled)
+        """
+        rule = self._rule_for(url)
+        return float(rule.get("stale_while_revalidate", self.stale_while_revalidate) or 0)
+
+    def _ttl_from_headers(self, headers: Mapping[str, str], now: float) -> Optional[float]:
+        """
+        Compute the lifetime a response declares for itself.
+
+        Args:
+            headers: The response headers
+            now: The time the response was received
+
+        Returns:
+            Optional[float]: The lifetime in seconds, or None if the headers declare none
+        """
+        directives = parse_cache_control(headers.get("Cache-Control", ""))
+
+        # Responses that must be revalidated before every use
+        if "no-cache" in directives:
+            return 0.0
+
+        if directives.get("max-age") is not None:
+            try:
+                max_age = float(directives["max-age"])
+            except ValueError:
+                logger.debug(f"Ignoring invalid max-age: {directives['max-age']}")
+            else:
+                try:
+                    age = float(headers.get("Age", 0))
+                except ValueError:
+                    age = 0.0
+                return max(0.0, max_age - age)
+
+        if "Expires" in headers:
+            expires = _parse_http_date(headers.get("Expires"))
+            if expires is None:
+                return 0.0  # An invalid Expires means already expired
+            date = _parse_http_date(headers.get("Date")) or now
+            return max(0.0, expires - date)
+
+        return None
@@ -0,0 +1,75 @@
+"""
+Expiry Index for the Web Scraping Toolkit.
+
+This module tracks when each cache entry becomes due for removal in a
+min-heap keyed by deadline, so finding the entries to purge costs
+O(k log n) for k due entries instead of a scan over the whole cache.
+Superseded heap records are skipped lazily when popped.
+"""
+
+import heapq
+from typing import Dict, List, Tuple
+
+class ExpiryIndex:
+    """
+    Min-heap of (deadline, key) with lazy deletion.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._heap: List[Tuple[float, str]] = []
+        self._deadlines: Dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._deadlines
+
+    def set(self, key: str, deadline: float) -> None:
+        """
+        Set (or move) the deadline of a key.
+
+        Args:
+            key: The cache key
+            deadline: Time after which the entry is due for removal
+        """
+        self._deadlines[key] = deadline
+        heapq.heappush(self._heap, (deadline, key))
+
+        # Drop superseded records once they dominate the heap
+        if len(self._heap) > 2 * len(self._deadlines) + 1024:
+            self._heap = [(d, k) for k, d in self._deadlines.items()]
+            heapq.heapify(self._heap)
+
+    def extend(self, key: str, deadline: float) -> None:
+        """Set the deadline of a key unless it already has a later one."""
+        if self._deadlines.get(key, deadline - 1) < deadline:
+            self.set(key, deadline)
+
+    def discard(self, key: str) -> None:
+        """Forget a key; its heap records are skipped when popped."""
+        self._deadlines.pop(key, None)
+
+    def clear(self) -> None:
+        """Forget all keys."""
+        self._heap = []
+        self._deadlines = {}
+
+    def pop_due(self, now: float) -> List[str]:
+        """
+        Remove and return the keys whose deadline has passed.
+
+        Args:
+            now: The current time
+
+        Returns:
+            List[str]: Keys due for removal
+        """
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            deadline, key = heapq.heappop(self._heap)
+            if self._deadlines.get(key) == deadline:
+                del self._deadlines[key]
+                due.append(key)
+        return due
@@ -15,6 +15,8 @@ from bs4 import BeautifulSoup
 
 # 导入集中式日志系统
 from ..utils.logger import get_logger
+from ..browser.resource_policy import ResourceBlockPolicy, summarize_stats
+from ..browser.wait_policy import DomainWaitPolicies, TextStableWait
 
 # 配置日志
 logger = get_logger("web_scraping_toolkit.content")
@@ -192,8 +194,12 @@ def fetch_article_content(
         with sync_playwright() as p:
             browser = p.chromium.launch(headless=True)
             page = browser.new_page()
-            page.goto(url, timeout=20000)
-            time.sleep(2)  # 等待页面渲染和跳转
+            # 拦截图片、字体、媒体和统计/广告请求，只保留正文需要的资源
+            resource_stats = ResourceBlockPolicy().apply(page)
+            # 等待正文文本长度稳定（可按域名配置），而不是固定等待 2 秒
+            wait_policy = DomainWaitPolicies(default=TextStableWait(timeout=20)).for_url(url)
+            wait_condition = wait_policy.navigate(page, url)
+            logger.debug(f"[playwright] {summarize_stats(resource_stats)}, 等待结束条件 {wait_condition}: {url}")
             for sel in selectors:
                 try:
                     node = page.query_selector(sel)
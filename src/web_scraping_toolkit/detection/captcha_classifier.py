@@ -0,0 +1,257 @@
+"""
+CAPTCHA Classifier for the Web Scraping Toolkit.
+
+This module decides whether a page is a CAPTCHA or bot challenge from
+structural evidence instead of loose keywords: known challenge markup and
+vendor scripts, the page title, response headers and status, and the size of
+the page. Each signal carries a weight; the weights are combined into a
+confidence score, and pages with a lot of real content are discounted, since
+an article that embeds a reCAPTCHA comment form or talks about robots is not
+a challenge page.
+
+The markup, title and body phrases are page-signal categories (`SIGNALS`), so
+a caller can find them in the same scan as its other page checks.
+"""
+
+import re
+from typing import Dict, List, Any, Optional, Mapping
+
+from ..utils.config import get_captcha_config
+from .page_signals import PageSignalMatcher
+
+# Challenge markup and vendor scripts: (marker, vendor, weight).
+# Markers are matched case-insensitively against the raw markup.
+MARKUP_SIGNALS = [
+    # Cloudflare interstitials
+    ("challenge-platform", "cloudflare", 0.9),
+    ("cf-challenge", "cloudflare", 0.9),
+    ("challenge-form", "cloudflare", 0.8),
+    ("cf_chl_opt", "cloudflare", 0.9),
+    ("cf-browser-verification", "cloudflare", 0.9),
+    # DataDome, PerimeterX, Akamai, AWS WAF
+    ("captcha-delivery.com", "datadome", 0.9),
+    ("px-captcha", "perimeterx", 0.9),
+    ("captcha.px-cdn", "perimeterx", 0.9),
+    ("sec-if-cpt", "akamai", 0.8),
+    ("awswaf", "aws_waf", 0.6),
+    # Widgets, which also appear on ordinary login and comment forms
+    ("g-recaptcha", "recaptcha", 0.5),
+    ("google.com/recaptcha", "recaptcha", 0.5),
+    ("recaptcha/api.js", "recaptcha", 0.5),
+    ("h-captcha", "hcaptcha", 0.5),
+    ("hcaptcha.com/1/api.js", "hcaptcha", 0.5),
+    ("cf-turnstile", "cloudflare", 0.5),
+    ("arkoselabs.com", "arkose", 0.5),
+    ("funcaptcha", "arkose", 0.5),
+]
+
+# Phrases in the <title>: (phrase, weight)
+TITLE_SIGNALS = [
+    ("just a moment", 0.8),
+    ("attention required", 0.8),
+    ("are you a robot", 0.9),
+    ("are you human", 0.9),
+    ("verify you are human", 0.9),
+    ("human verification", 0.9),
+    ("security check", 0.7),
+    ("bot check", 0.8),
+    ("captcha", 0.8),
+    ("pardon our interruption", 0.8),
+    ("access denied", 0.4),
+]
+
+# Phrases in the page body that only hint at a challenge: (phrase, weight)
+BODY_SIGNALS = [
+    ("verify you are human", 0.3),
+    ("are you a robot", 0.3),
+    ("are you human", 0.3),
+    ("human verification", 0.3),
+    ("checking your browser", 0.4),
+    ("bot check", 0.2),
+]
+
+# Statuses challenge pages are commonly served with
+CHALLENGE_STATUS_WEIGHT = 0.2
+CHALLENGE_STATUSES = (403, 429, 503)
+
+# Visible text length bounds and the factor applied to non-definitive evidence
+SIZE_FACTORS = [
+    (2000, 1.0),
+    (10000, 0.7),
+]
+LARGE_PAGE_FACTOR = 0.35
+
+# Page-signal categories of the classifier's phrases
+CATEGORY_MARKUP = "captcha_markup"
+CATEGORY_TITLE = "captcha_title"
+CATEGORY_TEXT = "captcha_text"
+
+# Title phrases are found anywhere in the page first; only those are then looked for in the title
+SIGNALS: Dict[str, List[str]] = {
+    CATEGORY_MARKUP: [marker for marker, _, _ in MARKUP_SIGNALS],
+    CATEGORY_TITLE: [phrase for phrase, _ in TITLE_SIGNALS],
+    CATEGORY_TEXT: [phrase for phrase, _ in BODY_SIGNALS]
+}
+
+# Matcher for pages classified on their own
+_MATCHER = PageSignalMatcher(SIGNALS)
+
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title", re.I | re.S)
+_SCRIPT_STYLE_RE = re.compile(r"<(script|style)\b.*?</\1\s*>", re.I | re.S)
+_TAG_RE = re.compile(r"<[^>]*>")
+_SPACE_RE = re.compile(r"\s+")
+
+def visible_text_length(html: str) -> int:
+    """
+    Approximate the length of the visible text of a page.
+
+    Args:
+        html: The page markup
+
+    Returns:
+        int: Number of characters outside tags, scripts and styles, with whitespace collapsed
+    """
+    text = _SCRIPT_STYLE_RE.sub(" ", html)
+    text = _TAG_RE.sub(" ", text)
+    return len(_SPACE_RE.sub(" ", text).strip())
+
+class CaptchaClassifier:
+    """
+    Structural CAPTCHA / bot-challenge classifier.
+
+    This class provides:
+    - Detection of Cloudflare, DataDome, PerimeterX, Akamai, AWS WAF,
+      reCAPTCHA, hCaptcha, Turnstile and Arkose challenges
+    - Definitive header signals (`cf-mitigated`, `x-amzn-waf-action`)
+    - A confidence score in [0, 1], discounted for content-rich pages
+    - The list of signals that contributed to the decision
+    """
+
+    def __init__(self, threshold: Optional[float] = None):
+        """
+        Initialize the classifier with optional custom settings.
+
+        Args:
+            threshold: Confidence at or above which a page counts as a CAPTCHA (overrides config)
+        """
+        # Load captcha configuration
+        config = get_captcha_config()
+
+        # Override configuration with constructor parameters if provided
+        self.threshold = threshold if threshold is not None else config.get("confidence_threshold", 0.6)
+
+    def classify(
+        self,
+        html: str,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        page_signals: Optional[Mapping[str, List[str]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Classify a page.
+
+        Args:
+            html: The page markup
+            status_code: The HTTP status code, if known
+            headers: The response headers, if known (a case-insensitive mapping)
+            page_signals: The page's matched signals, including the `SIGNALS` categories,
+                if already computed; otherwise the page is scanned here
+
+        Returns:
+            Dict[str, Any]: 'is_captcha', 'confidence', 'vendor' (or None) and the matched 'signals'
+        """
+        signals: List[str] = []
+        weights: List[float] = []
+        vendor = None
+
+        # Definitive answers from the server
+        definitive = 0.0
+        headers = {key.lower(): value for key, value in (headers or {}).items()}
+        if headers.get("cf-mitigated", "").lower() == "challenge":
+            definitive, vendor = 1.0, "cloudflare"
+            signals.append("header:cf-mitigated")
+        elif headers.get("x-amzn-waf-action", "").lower() in ("captcha", "challenge"):
+            definitive, vendor = 1.0, "aws_waf"
+            signals.append("header:x-amzn-waf-action")
+        elif "x-datadome" in headers and status_code in CHALLENGE_STATUSES:
+            definitive, vendor = 0.8, "datadome"
+            signals.append("header:x-datadome")
+
+        if page_signals is None:
+            page_signals = _MATCHER.match(html)
+        markup = set(page_signals[CATEGORY_MARKUP])
+        title_phrases = set(page_signals[CATEGORY_TITLE])
+        text_phrases = set(page_signals[CATEGORY_TEXT])
+
+        # Challenge markup and vendor scripts; markers of the same vendor are
+        # not independent evidence, so only the strongest one counts
+        vendor_weights: Dict[str, float] = {}
+        for marker, marker_vendor, weight in MARKUP_SIGNALS:
+            if marker in markup:
+                signals.append(f"markup:{marker}")
+                vendor_weights[marker_vendor] = max(weight, vendor_weights.get(marker_vendor, 0.0))
+        if vendor_weights:
+            weights.extend(vendor_weights.values())
+            vendor = vendor or max(vendor_weights, key=vendor_weights.get)
+
+        # The page title, only extracted if a title phrase occurs in the page at all
+        if title_phrases:
+            title_match = _TITLE_RE.search(html)
+            title = title_match.group(1).lower() if title_match else ""
+            for phrase, weight in TITLE_SIGNALS:
+                if phrase in title_phrases and phrase in title:
+                    signals.append(f"title:{phrase}")
+                    weights.append(weight)
+
+        # Weak hints in the body
+        for phrase, weight in BODY_SIGNALS:
+            if phrase in text_phrases:
+                signals.append(f"text:{phrase}")
+                weights.append(weight)
+
+        if status_code in CHALLENGE_STATUSES:
+            signals.append(f"status:{status_code}")
+            weights.append(CHALLENGE_STATUS_WEIGHT)
+
+        # Combine independent evidence (noisy-or), discounted for content-rich pages
+        evidence = 0.0
+        if weights:
+            remaining = 1.0
+            for weight in weights:
+                remaining *= 1.0 - weight
+            text_length = visible_text_length(html)
+            factor = LARGE_PAGE_FACTOR
+            for bound, bound_factor in SIZE_FACTORS:
+                if text_length < bound:
+                    factor = bound_factor
+                    break
+            if factor < 1.0:
+                signals.append(f"size:{text_length}")
+            evidence = (1.0 - remaining) * factor
+
+        confidence = round(max(definitive, evidence), 3)
+        return {
+            'is_captcha': confidence >= self.threshold,
+            'confidence': confidence,
+            'vendor': vendor if confidence > 0 else None,
+            'signals': signals
+        }
+
+    def is_captcha(
+        self,
+        html: str,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None
+    ) -> bool:
+        """
+        Check whether a page is a CAPTCHA or bot challenge.
+
+        Args:
+            html: The page markup
+            status_code: The HTTP status code, if known
+            headers: The response headers, if known
+
+        Returns:
+            bool: True if the confidence reaches the threshold
+        """
+        return self.classify(html, status_code, headers)['is_captcha']
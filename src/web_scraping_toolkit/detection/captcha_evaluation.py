@@ -0,0 +1,141 @@
+"""
+CAPTCHA Classifier Evaluation for the Web Scraping Toolkit.
+
+This module measures CAPTCHA detection against a labelled corpus of saved
+pages and reports false-positive and false-negative rates, for the
+structural classifier and for the old keyword heuristic.
+
+Corpus layout:
+    corpus/captcha/*.html   pages that are CAPTCHA or bot challenges
+    corpus/ok/*.html        ordinary pages
+
+A page may have a sidecar `<name>.json` with the saved response metadata,
+e.g. {"status_code": 403, "headers": {"cf-mitigated": "challenge"}}.
+
+Usage:
+    python -m web_scraping_toolkit.detection.captcha_evaluation corpus/ [--threshold 0.6] [--verbose]
+"""
+
+import os
+import sys
+import json
+import argparse
+from typing import Dict, List, Any, Callable, Optional, Mapping
+
+from .captcha_classifier import CaptchaClassifier
+from .page_signals import classify_page, CLASS_CAPTCHA
+
+# Corpus labels (sub-directory names)
+LABEL_CAPTCHA = "captcha"
+LABEL_OK = "ok"
+
+def keyword_is_captcha(html: str, status_code: int = 200, headers: Optional[Mapping[str, str]] = None) -> bool:
+    """The previous heuristic: any 403/429, or any CAPTCHA keyword in the page."""
+    if status_code in (403, 429):
+        return True
+    return bool(classify_page(html)['signals'][CLASS_CAPTCHA])
+
+def load_corpus(corpus_dir: str) -> List[Dict[str, Any]]:
+    """
+    Load labelled pages from a corpus directory.
+
+    Args:
+        corpus_dir: Directory with `captcha/` and `ok/` sub-directories
+
+    Returns:
+        List[Dict[str, Any]]: Pages with 'path', 'label', 'html', 'status_code' and 'headers'
+    """
+    pages = []
+    for label in (LABEL_CAPTCHA, LABEL_OK):
+        label_dir = os.path.join(corpus_dir, label)
+        if not os.path.isdir(label_dir):
+            continue
+        for name in sorted(os.listdir(label_dir)):
+            if not name.endswith((".html", ".htm")):
+                continue
+            path = os.path.join(label_dir, name)
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                html = f.read()
+
+            meta: Dict[str, Any] = {}
+            meta_path = os.path.splitext(path)[0] + ".json"
+            if os.path.exists(meta_path):
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+
+            pages.append({
+                'path': path,
+                'label': label,
+                'html': html,
+                'status_code': meta.get('status_code', 200),
+                'headers': meta.get('headers', {})
+            })
+    return pages
+
+def evaluate(pages: List[Dict[str, Any]], predict: Callable[..., bool]) -> Dict[str, Any]:
+    """
+    Evaluate a CAPTCHA predicate against labelled pages.
+
+    Args:
+        pages: Pages returned by `load_corpus`
+        predict: Function of (html, status_code, headers) returning True for a CAPTCHA
+
+    Returns:
+        Dict[str, Any]: Counts, 'false_positive_rate', 'false_negative_rate' and the misclassified paths
+    """
+    false_positives = []
+    false_negatives = []
+    positives = negatives = 0
+
+    for page in pages:
+        predicted = predict(page['html'], page['status_code'], page['headers'])
+        if page['label'] == LABEL_CAPTCHA:
+            positives += 1
+            if not predicted:
+                false_negatives.append(page['path'])
+        else:
+            negatives += 1
+            if predicted:
+                false_positives.append(page['path'])
+
+    return {
+        'pages': positives + negatives,
+        'captcha_pages': positives,
+        'ok_pages': negatives,
+        'false_positives': false_positives,
+        'false_negatives': false_negatives,
+        'false_positive_rate': len(false_positives) / negatives if negatives else 0.0,
+        'false_negative_rate': len(false_negatives) / positives if positives else 0.0
+    }
+
+def _print_report(name: str, result: Dict[str, Any], verbose: bool) -> None:
+    print(
+        f"{name:<12} pages={result['pages']} "
+        f"FP={len(result['false_positives'])}/{result['ok_pages']} ({result['false_positive_rate']:.1%}) "
+        f"FN={len(result['false_negatives'])}/{result['captcha_pages']} ({result['false_negative_rate']:.1%})"
+    )
+    if verbose:
+        for path in result['false_positives']:
+            print(f"  false positive: {path}")
+        for path in result['false_negatives']:
+            print(f"  false negative: {path}")
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Evaluate CAPTCHA detection on a labelled corpus")
+    parser.add_argument("corpus", help="Directory with captcha/ and ok/ sub-directories")
+    parser.add_argument("--threshold", type=float, default=None, help="Classifier confidence threshold")
+    parser.add_argument("--verbose", action="store_true", help="List misclassified pages")
+    args = parser.parse_args(argv)
+
+    pages = load_corpus(args.corpus)
+    if not pages:
+        print(f"No labelled pages found in {args.corpus}")
+        return 1
+
+    classifier = CaptchaClassifier(threshold=args.threshold)
+    _print_report("classifier", evaluate(pages, classifier.is_captcha), args.verbose)
+    _print_report("keywords", evaluate(pages, keyword_is_captcha), args.verbose)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""
+Page Signal Detection for the Web Scraping Toolkit.
+
+This module classifies a page as a CAPTCHA/bot check, a page that requires
+JavaScript, or a normal page, from keyword signals in its markup. The same
+matcher serves plain HTTP responses and rendered Playwright pages, and each
+document is lowercased and scanned only once for all checks. A caller that
+also needs other keyword categories (such as the structural CAPTCHA
+classifier's) can pass a matcher built from `PAGE_SIGNALS` plus those
+categories, so they are found in the same scan.
+"""
+
+from typing import Dict, List, Iterable, Optional
+
+# Classifications
+CLASS_CAPTCHA = "captcha"
+CLASS_JS_REQUIRED = "js_required"
+CLASS_OK = "ok"
+
+# Keywords that indicate a CAPTCHA or bot check
+CAPTCHA_SIGNALS = [
+    "captcha", "robot", "human verification", "are you human",
+    "security check", "verify you are human", "bot check",
+    "recaptcha", "hcaptcha", "challenge"
+]
+
+# Keywords that indicate a page that only works with JavaScript
+JS_REQUIRED_SIGNALS = [
+    "javascript is required",
+    "enable javascript",
+    "please enable javascript",
+    "you need to enable javascript"
+]
+
+class PageSignalMatcher:
+    """
+    Precompiled matcher for several categories of keyword signals.
+
+    Keywords are scanned with CPython's substring search, which measured
+    faster on multi-MB pages than a single alternation regex or Aho-Corasick.
+    A keyword that contains another keyword (e.g. "recaptcha" contains
+    "captcha") is only looked for once the shorter one has matched, so a
+    clean page costs one scan per independent keyword.
+    """
+
+    def __init__(self, signals: Dict[str, Iterable[str]]):
+        """
+        Initialize the matcher.
+
+        Args:
+            signals: Mapping of category to keywords (matched case-insensitively)
+        """
+        self.signals = {category: [k.lower() for k in keywords] for category, keywords in signals.items()}
+
+        keywords = sorted({k for ks in self.signals.values() for k in ks}, key=len)
+        self._category = {k: [c for c, ks in self.signals.items() if k in ks] for k in keywords}
+
+        # Each keyword is checked only if the longest keyword inside it matched
+        self._roots: List[str] = []
+        self._children: Dict[str, List[str]] = {k: [] for k in keywords}
+        for index, keyword in enumerate(keywords):
+            parents = [k for k in keywords[:index] if k in keyword]
+            if parents:
+                self._children[max(parents, key=len)].append(keyword)
+            else:
+                self._roots.append(keyword)
+
+    def match(self, text: str) -> Dict[str, List[str]]:
+        """
+        Find the signals present in a document.
+
+        Args:
+            text: The page markup or text
+
+        Returns:
+            Dict[str, List[str]]: Matched keywords by category (every category is present)
+        """
+        content_lower = text.lower()
+        found = {category: [] for category in self.signals}
+
+        pending = list(self._roots)
+        while pending:
+            keyword = pending.pop()
+            if keyword in content_lower:
+                for category in self._category[keyword]:
+                    found[category].append(keyword)
+                pending.extend(self._children[keyword])
+
+        return found
+
+# Keyword categories used to classify a page
+PAGE_SIGNALS: Dict[str, List[str]] = {
+    CLASS_CAPTCHA: CAPTCHA_SIGNALS,
+    CLASS_JS_REQUIRED: JS_REQUIRED_SIGNALS
+}
+
+# Shared matcher for the page categories
+_DEFAULT_MATCHER = PageSignalMatcher(PAGE_SIGNALS)
+
+def classify_page(text: str, matcher: Optional[PageSignalMatcher] = None) -> Dict[str, object]:
+    """
+    Classify a page from its keyword signals.
+
+    CAPTCHA signals take precedence over JavaScript-required signals.
+
+    Args:
+        text: The page markup or text
+        matcher: Matcher to scan with; it must include the `PAGE_SIGNALS` categories
+            and may add others (defaults to a matcher for `PAGE_SIGNALS` only)
+
+    Returns:
+        Dict[str, object]: 'classification' (captcha, js_required or ok) and the matched 'signals'
+        by category of the matcher
+    """
+    signals = (matcher or _DEFAULT_MATCHER).match(text)
+    if signals[CLASS_CAPTCHA]:
+        classification = CLASS_CAPTCHA
+    elif signals[CLASS_JS_REQUIRED]:
+        classification = CLASS_JS_REQUIRED
+    else:
+        classification = CLASS_OK
+    return {'classification': classification, 'signals': signals}
@@ -0,0 +1,151 @@
+"""
+Streaming Tag Counter for the Web Scraping Toolkit.
+
+This module counts `<script>` tags against content tags (p, div, span, h1-h6)
+inside `<body>` with a single regex scan over the raw markup, without building
+a parse tree. It follows the tokenizer rules of Python's html.parser, which
+BeautifulSoup uses: comments and declarations are skipped, script and style
+bodies are opaque, and open elements are closed the way BeautifulSoup closes
+them.
+"""
+
+import re
+from typing import Optional, Tuple, Union
+
+# Tag names counted as page content
+CONTENT_TAGS = frozenset(["p", "div", "span", "h1", "h2", "h3", "h4", "h5", "h6"])
+
+# Void elements, which never contain other elements
+VOID_TAGS = frozenset([
+    "area", "base", "basefont", "bgsound", "br", "col", "command", "embed",
+    "frame", "hr", "image", "img", "input", "isindex", "keygen", "link",
+    "menuitem", "meta", "nextid", "param", "source", "spacer", "track", "wbr"
+])
+
+# Elements whose content is raw text, not markup
+_RAW_TEXT_TAGS = ("script", "style")
+
+# Comments, declarations/processing instructions, end tags and start tags.
+# Attribute values are matched with an unrolled loop so a missing '>' cannot
+# cause catastrophic backtracking.
+_TOKEN_PATTERN = (
+    r"<!--.*?(?:-->|\Z)"
+    r"|<[!?][^>]*>"
+    r"|</\s*([a-zA-Z][^\t\n\r\f />\x00]*)[^>]*>"
+    r"|<([a-zA-Z][^\t\n\r\f />\x00]*)([^>\"']*(?:(?:\"[^\"]*\"|'[^']*')[^>\"']*)*)>"
+)
+
+_TOKEN_RE = {
+    str: re.compile(_TOKEN_PATTERN, re.S),
+    bytes: re.compile(_TOKEN_PATTERN.encode("ascii"), re.S),
+}
+
+_RAW_TEXT_END_RE = {
+    (kind, tag): re.compile((r"</%s[\s/>]" % tag).encode("ascii") if kind is bytes else r"</%s[\s/>]" % tag, re.I)
+    for kind in (str, bytes)
+    for tag in _RAW_TEXT_TAGS
+}
+
+def count_body_tags(html: Union[str, bytes]) -> Optional[Tuple[int, int]]:
+    """
+    Count script and content tags inside the first `<body>` element.
+
+    Only a stack of open tag names is kept, closed the way BeautifulSoup does
+    it: an end tag closes the most recent open element of that name and
+    everything opened after it, and void elements never stay open. The body
+    therefore also ends when an element opened before it is closed.
+
+    Bytes are scanned as is; tag names are ASCII, so any ASCII-compatible
+    encoding gives the same counts as the decoded text.
+
+    Args:
+        html: The page markup, decoded or raw
+
+    Returns:
+        Optional[Tuple[int, int]]: (script tags, content tags), or None if the page has no body
+    """
+    kind = bytes if isinstance(html, bytes) else str
+    token_re = _TOKEN_RE[kind]
+    slash = b"/" if kind is bytes else "/"
+
+    stack = []
+    open_counts = {}
+    body_index = None
+    scripts = 0
+    content = 0
+
+    pos = 0
+    length = len(html)
+    while pos < length:
+        match = token_re.search(html, pos)
+        if match is None:
+            break
+        pos = match.end()
+
+        end_name, start_name, attrs = match.group(1), match.group(2), match.group(3)
+        if end_name is not None:
+            name = end_name.lower()
+            if kind is bytes:
+                name = name.decode("ascii", "replace")
+            if not open_counts.get(name):
+                continue
+
+            # Close the most recent element with this name and everything inside it
+            index = len(stack) - 1 - stack[::-1].index(name)
+            for closed in stack[index:]:
+                open_counts[closed] -= 1
+            del stack[index:]
+            if body_index is not None and index <= body_index:
+                break
+            continue
+
+        if start_name is None:
+            # Comment, declaration or processing instruction
+            continue
+
+        name = start_name.lower()
+        if kind is bytes:
+            name = name.decode("ascii", "replace")
+        self_closing = attrs.endswith(slash)
+
+        if body_index is not None:
+            if name == "script":
+                scripts += 1
+            elif name in CONTENT_TAGS:
+                content += 1
+
+        if not self_closing and name not in VOID_TAGS:
+            if name == "body" and body_index is None:
+                body_index = len(stack)
+            stack.append(name)
+            open_counts[name] = open_counts.get(name, 0) + 1
+        elif name == "body" and body_index is None:
+            # An empty <body/> has no descendants
+            return 0, 0
+
+        # Skip the raw text of script and style elements
+        if name in _RAW_TEXT_TAGS and not self_closing:
+            end = _RAW_TEXT_END_RE[(kind, name)].search(html, pos)
+            if end is None:
+                break
+            pos = end.start()
+
+    if body_index is None:
+        return None
+    return scripts, content
+
+def is_script_heavy(html: Union[str, bytes]) -> bool:
+    """
+    Check whether a page's body has more than twice as many scripts as content tags.
+
+    Args:
+        html: The page markup, decoded or raw
+
+    Returns:
+        bool: True if the page looks like a JavaScript-rendered shell
+    """
+    counts = count_body_tags(html)
+    if counts is None:
+        return False
+    scripts, content = counts
+    return scripts > content * 2
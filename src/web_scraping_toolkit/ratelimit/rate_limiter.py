@@ -0,0 +1,167 @@
+"""
+Rate Limiter for the Web Scraping Toolkit.
+
+This module provides per-host token-bucket rate limiting so that requests are
+spaced out per site rather than globally, keeping the scraper polite to each
+server without capping total throughput.
+"""
+
+import time
+import threading
+from typing import Dict, Any, Optional, Tuple
+
+from ..utils.logger import get_logger
+from ..utils.config import get_rate_limit_config
+from ..utils.domain_rules import get_host, match_domain_rule
+
+# Initialize logger
+logger = get_logger("rate_limiter")
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at `rate` per second up to `burst`. Taking a
+    token when the bucket is empty drives the balance negative, which queues
+    the caller behind earlier reservations instead of letting waiters race.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize the token bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens the bucket can hold
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take one token, returning how long the caller must wait before using it.
+
+        Returns:
+            float: Seconds to wait (0 if a token was immediately available)
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+class RateLimiter:
+    """
+    Per-host rate limiter backed by token buckets.
+
+    This class provides:
+    - One token bucket per host, created on first use
+    - Configurable default rate and burst
+    - Per-domain or glob-pattern overrides (e.g. "example.com", "*.gov")
+    - Thread-safe blocking (`acquire`) and non-blocking (`reserve`) use
+    """
+
+    def __init__(
+        self,
+        default_rate: Optional[float] = None,
+        default_burst: Optional[int] = None,
+        rules: Optional[Dict[str, Dict[str, Any]]] = None,
+        enabled: Optional[bool] = None
+    ):
+        """
+        Initialize the rate limiter with optional custom settings.
+
+        Args:
+            default_rate: Requests per second allowed per host (overrides config, 0 = unlimited)
+            default_burst: Requests allowed back-to-back per host (overrides config)
+            rules: Mapping of domain or glob pattern to {"rate": float, "burst": int} (overrides config)
+            enabled: Whether rate limiting is enabled (overrides config)
+        """
+        # Load rate limit configuration
+        self.config = get_rate_limit_config()
+
+        # Override configuration with constructor parameters if provided
+        self.enabled = enabled if enabled is not None else self.config.get("enabled", True)
+        self.default_rate = default_rate if default_rate is not None else self.config.get("default_rate", 1.0)
+        self.default_burst = default_burst if default_burst is not None else self.config.get("default_burst", 1)
+        self.rules = rules if rules is not None else self.config.get("rules", {})
+
+        # Token buckets by host
+        self._buckets: Dict[str, TokenBucket] = {}
+
+        # Thread lock for the bucket registry
+        self._lock = threading.Lock()
+
+        if self.enabled:
+            logger.info(f"Rate limiter initialized ({self.default_rate} req/s per host, burst {self.default_burst})")
+            if self.rules:
+                logger.info(f"Rate limit rules for {len(self.rules)} domains/patterns")
+        else:
+            logger.info("Rate limiting is disabled")
+
+    def _get_limits(self, host: str) -> Tuple[float, int]:
+        """
+        Resolve the rate and burst for a host.
+
+        Args:
+            host: The host name
+
+        Returns:
+            Tuple[float, int]: The rate and burst for the host
+        """
+        best_match = match_domain_rule(host, self.rules)
+        rule = self.rules.get(best_match, {}) if best_match is not None else {}
+        return (
+            float(rule.get("rate", self.default_rate)),
+            int(rule.get("burst", self.default_burst))
+        )
+
+    def _get_bucket(self, host: str) -> TokenBucket:
+        """Get or create the token bucket for a host."""
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate, burst = self._get_limits(host)
+                bucket = TokenBucket(rate, burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def reserve(self, url: str) -> float:
+        """
+        Reserve a request slot for the URL's host without blocking.
+
+        Args:
+            url: The URL about to be requested
+
+        Returns:
+            float: Seconds the caller must wait before sending the request
+        """
+        if not self.enabled:
+            return 0.0
+        return self._get_bucket(get_host(url)).reserve()
+
+    def acquire(self, url: str) -> float:
+        """
+        Block until a request to the URL's host is allowed.
+
+        Args:
+            url: The URL about to be requested
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        wait_time = self.reserve(url)
+        if wait_time > 0:
+            logger.debug(f"Rate limiting {get_host(url)}: sleeping for {wait_time:.2f} seconds")
+            time.sleep(wait_time)
+        return wait_time
@@ -10,9 +10,13 @@ import time
 import random
 import json
 import threading
-from typing import Dict, List, Any, Optional, Union, Tuple
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Dict, List, Any, Optional, Union, Tuple, Iterable, Iterator
 import hashlib
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 from urllib.parse import urlparse
 from bs4 import BeautifulSoup
 import tempfile
@@ -20,11 +24,31 @@ import tempfile
 from .proxy.proxy_manager import ProxyManager
 from .captcha.captcha_solver import CaptchaSolver
 from .cache.cache_mechanism import CacheMechanism
+from .cache.cache_policy import CachePolicy
+from .ratelimit.rate_limiter import RateLimiter
+from .browser.browser_pool import BrowserPool
+from .browser.render_service import RenderService, RenderError
+from .browser.resource_policy import ResourceBlockPolicy, summarize_stats
+from .browser.wait_policy import DomainWaitPolicies
+from .strategy.fetch_mode_memory import FetchModeMemory, FETCH_MODE_FILENAME, MODE_HTTP, MODE_BROWSER
+from .strategy.escalation_policy import (
+    EscalationPolicy, describe_path,
+    OUTCOME_OK, OUTCOME_CAPTCHA, OUTCOME_SHORT_BODY, OUTCOME_JS_REQUIRED,
+    OUTCOME_LEARNED_BROWSER, OUTCOME_RENDER_ERROR, OUTCOME_NOT_MODIFIED,
+    ACTION_RETURN, ACTION_FAIL, ACTION_RETRY, ACTION_RENDER, ACTION_ROTATE_PROXY
+)
+from .detection.tag_counter import is_script_heavy
+from .detection.page_signals import classify_page, PageSignalMatcher, PAGE_SIGNALS, CLASS_JS_REQUIRED
+from .detection.captcha_classifier import CaptchaClassifier, SIGNALS as CAPTCHA_CLASSIFIER_SIGNALS
 from .utils.logger import get_logger
+from .utils.config import get_scraper_config, get_fetch_mode_config
 
 # Initialize logger
 logger = get_logger("web_scraper")
 
+# Headers of a 304 that describe the (empty) body rather than the cached entity
+_BODY_HEADERS = ("content-length", "content-encoding", "transfer-encoding", "content-type")
+
 class WebScraper:
     """
     Main web scraping class that integrates all toolkit components.
@@ -42,7 +66,16 @@ class WebScraper:
         captcha_solver: Optional[CaptchaSolver] = None,
         cache_mechanism: Optional[CacheMechanism] = None,
         user_agent: Optional[str] = None,
-        browser_headless: bool = True
+        browser_headless: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        browser_pool: Optional[BrowserPool] = None,
+        render_service: Optional[RenderService] = None,
+        resource_policy: Optional[ResourceBlockPolicy] = None,
+        wait_policies: Optional[DomainWaitPolicies] = None,
+        fetch_modes: Optional[FetchModeMemory] = None,
+        captcha_classifier: Optional[CaptchaClassifier] = None,
+        escalation_policy: Optional[EscalationPolicy] = None,
+        cache_policy: Optional[CachePolicy] = None
     ):
         """
         Initialize the web scraper with optional components.
@@ -53,11 +86,38 @@ class WebScraper:
             cache_mechanism: Optional cache mechanism
             user_agent: Custom user agent string
             browser_headless: Whether to run browser in headless mode
+            rate_limiter: Optional per-host rate limiter (defaults to one built from config)
+            browser_pool: Optional shared browser pool (defaults to a pool owned by this scraper)
+            render_service: Optional render worker processes used instead of in-process browsers
+            resource_policy: Optional policy for blocking browser sub-resources (defaults to config)
+            wait_policies: Optional per-domain policies deciding when a rendered page is ready (defaults to config)
+            fetch_modes: Optional per-domain memory of which fetch mode works (defaults to config)
+            captcha_classifier: Optional classifier deciding which pages are CAPTCHAs (defaults to config)
+            escalation_policy: Optional policy mapping HTTP outcomes to retry/render/fail (defaults to config)
+            cache_policy: Optional policy deciding how long each cached response stays fresh (defaults to config)
         """
         # Store components
         self.proxy_manager = proxy_manager
         self.captcha_solver = captcha_solver
         self.cache_mechanism = cache_mechanism
+        self.cache_policy = cache_policy or CachePolicy()
+        self.rate_limiter = rate_limiter or RateLimiter()
+        
+        # Browsers are launched lazily and reused across renders
+        self._owns_browser_pool = browser_pool is None
+        self.browser_pool = browser_pool or BrowserPool(headless=browser_headless)
+        self.render_service = render_service
+        self.resource_policy = resource_policy or ResourceBlockPolicy()
+        self.wait_policies = wait_policies or DomainWaitPolicies()
+        # Learned fetch modes are kept next to the cache, so a scraper without one writes no files
+        if fetch_modes is None and cache_mechanism is not None and get_fetch_mode_config().get("file") is None:
+            fetch_modes = FetchModeMemory(path=os.path.join(cache_mechanism.cache_dir, FETCH_MODE_FILENAME))
+        self.fetch_modes = fetch_modes or FetchModeMemory()
+        self.captcha_classifier = captcha_classifier or CaptchaClassifier()
+        
+        # One scan of a response finds the page signals and the classifier's
+        self._signal_matcher = PageSignalMatcher({**PAGE_SIGNALS, **CAPTCHA_CLASSIFIER_SIGNALS})
+        self.escalation_policy = escalation_policy or EscalationPolicy()
         self.browser_headless = browser_headless
         
         # Set up default user agent if not provided
@@ -74,13 +134,20 @@ class WebScraper:
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": self.user_agent})
         
-        # Track requests to avoid overloading servers
+        # Track the time of the last completed request
         self.last_request_time = 0
-        self.min_request_interval = 1.0  # seconds
+        
+        # Bulk fetching settings
+        self.scraper_config = get_scraper_config()
+        self._pool_maxsize = requests.adapters.DEFAULT_POOLSIZE
         
         # Thread lock for thread safety
         self._lock = threading.RLock()
         
+        # Background refreshes of stale cache entries, at most one per cache key
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+        self._refreshing: set = set()
+        
         logger.info("Web scraper initialized")
         if self.proxy_manager:
             logger.info("Using proxy rotation")
@@ -89,6 +156,23 @@ class WebScraper:
         if self.cache_mechanism:
             logger.info("Caching enabled")
     
+    def __enter__(self) -> "WebScraper":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Release the browsers and HTTP connections held by this scraper."""
+        # Let background refreshes finish while the browsers are still available
+        if self._refresh_executor is not None:
+            self._refresh_executor.shutdown(wait=True)
+            self._refresh_executor = None
+        if self._owns_browser_pool:
+            self.browser_pool.close()
+        self.session.close()
+        self.fetch_modes.save()
+    
     def _randomize_user_agent(self) -> None:
         """Slightly randomize the user agent to avoid detection patterns."""
         # Extract base components
@@ -129,6 +213,10 @@ class WebScraper:
         """
         Fetch a URL using HTTP GET, with proxy rotation and caching.
         
+        The escalation policy decides after each HTTP attempt whether to
+        return, retry, rotate the proxy, render in the browser or fail fast.
+        The steps taken are reported in `response.fetch_info['path']`.
+        
         Args:
             url: The URL to fetch
             params: Optional query parameters
@@ -139,78 +227,698 @@ class WebScraper:
             timeout: Request timeout in seconds
             
         Returns:
-            requests.Response: The HTTP response
+            requests.Response: The HTTP response (an error response such as a 404 when the policy fails fast)
             
         Raises:
-            requests.RequestException: If the request fails after all retries
+            requests.RequestException: If the request fails after all retries, or fails fast without a response
         """
         # Check if the URL is already in cache
         should_use_cache = use_cache if use_cache is not None else bool(self.cache_mechanism)
-        if should_use_cache and self.cache_mechanism and self.cache_mechanism.is_cached(url):
-            cached_data = self.cache_mechanism.get_cached_data(url)
-            if cached_data and isinstance(cached_data, dict) and 'content' in cached_data:
-                logger.info(f"Using cached response for {url}")
-                
-                # Create a Response-like object from cached data
-                response = requests.Response()
-                response.url = url
-                response._content = cached_data['content'].encode('utf-8')
-                response.status_code = cached_data.get('status_code', 200)
-                response.headers = cached_data.get('headers', {})
-                response.encoding = 'utf-8'
-                
-                return response
+        if should_use_cache and self.cache_mechanism:
+            cache_keys = self._lookup_cache_keys(url, params, headers, force_browser)
+            cached_response = self._get_cached_response(url, cache_keys)
+            if cached_response is not None:
+                return cached_response
+            
+            # Within the stale-while-revalidate window the stale body is served
+            # right away and the entry is refreshed in the background
+            stale_response = self._get_stale_response(url, cache_keys)
+            if stale_response is not None:
+                stale_response.fetch_info['refreshing'] = self._refresh_in_background(
+                    url, stale_response.fetch_info['cache_key'], params, headers, force_browser, retry_count, timeout
+                )
+                return stale_response
+        
+        return self._fetch(url, params, headers, should_use_cache, force_browser, retry_count, timeout)
+    
+    def _fetch(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        should_use_cache: bool,
+        force_browser: bool,
+        retry_count: int,
+        timeout: int
+    ) -> requests.Response:
+        """
+        Fetch a URL from the network, bypassing fresh and stale cache hits.
+        
+        Args:
+            url: The URL to fetch
+            params: Optional query parameters
+            headers: Optional HTTP headers
+            should_use_cache: Whether to revalidate and store cache entries
+            force_browser: Whether to force browser-based fetching
+            retry_count: Number of retries on failure
+            timeout: Request timeout in seconds
+            
+        Returns:
+            requests.Response: The HTTP response
+            
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        cache_key = self._cache_key(url, params, headers, MODE_HTTP)
+        
+        # An expired entry with an ETag/Last-Modified is revalidated instead of refetched
+        revalidation_data = self._get_revalidation_data(cache_key) if should_use_cache else None
+        http_headers = self._conditional_headers(headers, revalidation_data)
         
-        # Throttle requests to avoid overloading servers
-        self._respect_rate_limits()
+        # The browser loads the same URL, query parameters included
+        browser_url = self._url_with_params(url, params)
+        
+        # Steps taken for this URL, reported in response.fetch_info['path']
+        path: List[Dict[str, Any]] = []
         
         # Try browser-based fetching if forced
         if force_browser:
-            return self._get_with_browser(url, headers, retry_count)
+            return self._get_with_browser_escalated(browser_url, headers, retry_count, path, record=False)
+        
+        # Skip the HTTP attempt for domains where it is known to fail
+        if self.fetch_modes.choose_mode(url) == MODE_BROWSER:
+            logger.info(f"HTTP keeps failing for this domain, using browser mode for {url}")
+            path.append(self._escalation_step(MODE_HTTP, OUTCOME_LEARNED_BROWSER, ACTION_RENDER))
+            try:
+                return self._get_with_browser_escalated(browser_url, headers, retry_count, path, on_error=ACTION_RETRY)
+            except requests.RequestException as e:
+                logger.warning(f"Browser mode failed for {url}, falling back to HTTP: {e}")
         
-        # Try regular HTTP fetching with retries
+        # Try regular HTTP fetching, escalating according to the outcome of each attempt
         for attempt in range(retry_count):
+            response, error = None, None
             try:
-                response = self._get_with_requests(url, params, headers, timeout)
-                
-                # Check if we need to handle CAPTCHA
-                if self._is_captcha_page(response) and self.captcha_solver:
-                    logger.info(f"CAPTCHA detected, switching to browser mode for {url}")
-                    return self._get_with_browser(url, headers, retry_count - attempt)
-                
-                # Check for other issues that might require browser
-                if self._needs_browser(response):
-                    logger.info(f"Content requires JavaScript, switching to browser mode for {url}")
-                    return self._get_with_browser(url, headers, retry_count - attempt)
-                
-                # If successful, cache the response
-                if response.status_code == 200 and should_use_cache and self.cache_mechanism:
-                    self._cache_response(url, response)
-                    
-                return response
-                
+                response = self._get_with_requests(url, params, http_headers, timeout)
+                if revalidation_data is not None and response.status_code == 304:
+                    return self._serve_revalidated(url, revalidation_data, response, path, cache_key)
+                outcome = self._classify_outcome(response)
             except requests.RequestException as e:
                 logger.warning(f"Request failed (attempt {attempt+1}/{retry_count}): {e}")
+                error = e
+                outcome = self.escalation_policy.classify_exception(e)
+            
+            action = self._next_action(url, outcome, attempt, retry_count, response, path)
+            
+            if action == ACTION_RETURN:
+                return self._finish_http(url, response, path, should_use_cache, cache_key)
+            if action == ACTION_RENDER:
+                return self._get_with_browser_escalated(browser_url, headers, retry_count - attempt, path)
+            if action == ACTION_FAIL:
+                return self._fail_fast(response, error, path)
+            
+            # Sleep before retry
+            time.sleep(self.escalation_policy.retry_delay(attempt, response))
+        
+        raise requests.RequestException(f"Failed to fetch {url} after all retries")
+    
+    def _next_action(
+        self,
+        url: str,
+        outcome: str,
+        attempt: int,
+        retry_count: int,
+        response: Optional[requests.Response],
+        path: List[Dict[str, Any]]
+    ) -> str:
+        """
+        Choose and prepare the action for the outcome of an HTTP attempt.
+        
+        The step is appended to the path; escalating to the browser is
+        remembered for the domain, and rotating the proxy blacklists the
+        current one.
+        
+        Args:
+            url: The URL being fetched
+            outcome: The outcome of the attempt
+            attempt: Zero-based index of the attempt
+            retry_count: Number of HTTP attempts allowed
+            response: The response of the attempt, if any
+            path: Steps taken so far
+            
+        Returns:
+            str: The action (see `EscalationPolicy.action_for`)
+        """
+        action = self.escalation_policy.action_for(outcome, attempt < retry_count - 1)
+        path.append(self._escalation_step(MODE_HTTP, outcome, action, response))
+        
+        if action == ACTION_RENDER:
+            logger.info(f"HTTP attempt gave {outcome}, switching to browser mode for {url}")
+            self.fetch_modes.record(url, MODE_HTTP, False)
+        elif action == ACTION_ROTATE_PROXY and self.proxy_manager:
+            logger.info("Blacklisting current proxy and retrying")
+            self.proxy_manager.blacklist_current_proxy()
+        elif action == ACTION_FAIL:
+            logger.info(f"Giving up on {url} without escalating ({describe_path(path)})")
+        
+        return action
+    
+    def _finish_http(
+        self,
+        url: str,
+        response: requests.Response,
+        path: List[Dict[str, Any]],
+        should_use_cache: bool,
+        cache_key: Optional[str] = None
+    ) -> requests.Response:
+        """
+        Record, cache and return a good HTTP response.
+        
+        Args:
+            url: The URL that was fetched
+            response: The HTTP response
+            path: Steps taken for the URL
+            should_use_cache: Whether the response may be cached
+            cache_key: The identifier to cache the response under (defaults to the URL)
+            
+        Returns:
+            requests.Response: The response, with `fetch_info` set
+        """
+        self.fetch_modes.record(url, MODE_HTTP, True)
+        
+        # If successful, cache the response
+        if response.status_code == 200 and should_use_cache and self.cache_mechanism:
+            self._cache_response(url, response, cache_key)
+        
+        return self._attach_fetch_path(response, MODE_HTTP, path)
+    
+    def _fail_fast(
+        self,
+        response: Optional[requests.Response],
+        error: Optional[requests.RequestException],
+        path: List[Dict[str, Any]]
+    ) -> requests.Response:
+        """
+        Stop escalating: hand back the error response, or raise the request error.
+        
+        Args:
+            response: The last HTTP response, if any
+            error: The exception of the last attempt, if there was no response
+            path: Steps taken for the URL
+            
+        Returns:
+            requests.Response: The error response, with `fetch_info` set
+            
+        Raises:
+            requests.RequestException: The error of the last attempt, with `fetch_info` set
+        """
+        if response is not None:
+            return self._attach_fetch_path(response, MODE_HTTP, path)
+        error.fetch_info = {'mode': MODE_HTTP, 'path': path}
+        raise error
+    
+    def _get_with_browser_escalated(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        retry_count: int,
+        path: List[Dict[str, Any]],
+        record: bool = True,
+        on_error: str = ACTION_FAIL
+    ) -> requests.Response:
+        """
+        Fetch a URL with the browser as a step of the escalation path.
+        
+        Args:
+            url: The URL to fetch
+            headers: Optional HTTP headers
+            retry_count: Number of browser attempts
+            path: Steps taken so far
+            record: Whether to remember the outcome in the per-domain fetch mode memory
+            on_error: Action recorded if the browser fails
+            
+        Returns:
+            requests.Response: The rendered response, with `fetch_info` set
+            
+        Raises:
+            requests.RequestException: If the browser fetch fails, with `fetch_info` set
+        """
+        fetch = self._get_with_browser_recorded if record else self._get_with_browser
+        try:
+            response = fetch(url, headers, max(1, retry_count))
+        except requests.RequestException as e:
+            path.append(self._escalation_step(MODE_BROWSER, OUTCOME_RENDER_ERROR, on_error))
+            e.fetch_info = {'mode': MODE_BROWSER, 'path': list(path)}
+            raise
+        path.append(self._escalation_step(MODE_BROWSER, OUTCOME_OK, ACTION_RETURN))
+        return self._attach_fetch_path(response, MODE_BROWSER, path)
+    
+    @staticmethod
+    def _escalation_step(
+        mode: str,
+        outcome: str,
+        action: str,
+        response: Optional[requests.Response] = None
+    ) -> Dict[str, Any]:
+        """Describe one step of the escalation path."""
+        return {
+            'mode': mode,
+            'outcome': outcome,
+            'action': action,
+            'status': response.status_code if response is not None else None
+        }
+    
+    @staticmethod
+    def _attach_fetch_path(
+        response: requests.Response,
+        mode: str,
+        path: List[Dict[str, Any]]
+    ) -> requests.Response:
+        """Report the fetch mode and escalation path in `response.fetch_info`."""
+        fetch_info = getattr(response, 'fetch_info', None) or {'mode': mode}
+        fetch_info['path'] = path
+        response.fetch_info = fetch_info
+        return response
+    
+    def _get_with_browser_recorded(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        retry_count: int
+    ) -> requests.Response:
+        """
+        Fetch a URL with the browser and remember whether it worked for the domain.
+        
+        Args:
+            url: The URL to fetch
+            headers: Optional HTTP headers
+            retry_count: Number of browser attempts
+            
+        Returns:
+            requests.Response: The rendered response
+            
+        Raises:
+            requests.RequestException: If the browser fetch fails
+        """
+        try:
+            response = self._get_with_browser(url, headers, retry_count)
+        except requests.RequestException:
+            self.fetch_modes.record(url, MODE_BROWSER, False)
+            raise
+        self.fetch_modes.record(url, MODE_BROWSER, True)
+        return response
+    
+    def fetch_many(
+        self,
+        urls: Iterable[str],
+        concurrency: int = 8,
+        per_host_limit: Optional[int] = None,
+        preserve_order: bool = False,
+        **get_kwargs: Any
+    ) -> Iterator[Tuple[str, Union[requests.Response, Exception]]]:
+        """
+        Fetch many URLs on a bounded thread pool, yielding results as they complete.
+        
+        URLs are scheduled round-robin across hosts, and no host ever has more
+        than `per_host_limit` requests in flight, so a large batch aimed at one
+        site cannot occupy the whole pool. Failures are yielded, not raised.
+        
+        Args:
+            urls: The URLs to fetch
+            concurrency: Maximum number of fetches running at once
+            per_host_limit: Maximum in-flight fetches per host (overrides config, 0 = unlimited)
+            preserve_order: Yield results in input order instead of completion order
+            **get_kwargs: Extra keyword arguments passed to `get` for every URL
+            
+        Yields:
+            Tuple[str, Union[requests.Response, Exception]]: The URL and its response or error
+        """
+        url_list = list(urls)
+        if not url_list:
+            return
+        
+        if per_host_limit is None:
+            per_host_limit = self.scraper_config.get("per_host_concurrency", 2)
+        concurrency = max(1, concurrency)
+        self._ensure_pool_size(concurrency)
+        
+        # Group pending URLs by host, keeping their input positions
+        pending_by_host: "OrderedDict[str, deque]" = OrderedDict()
+        for index, url in enumerate(url_list):
+            host = urlparse(url).netloc.lower()
+            pending_by_host.setdefault(host, deque()).append((index, url))
+        
+        in_flight_per_host: Dict[str, int] = {}
+        running = {}
+        finished: Dict[int, Tuple[str, Union[requests.Response, Exception]]] = {}
+        next_to_yield = 0
+        
+        def fetch(url: str) -> requests.Response:
+            return self.get(url, **get_kwargs)
+        
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="fetch_many")
+        try:
+            while pending_by_host or running:
+                # Fill free worker slots, taking one URL per eligible host in turn
+                submitted = True
+                while submitted and len(running) < concurrency:
+                    submitted = False
+                    for host in list(pending_by_host):
+                        if len(running) >= concurrency:
+                            break
+                        if per_host_limit and in_flight_per_host.get(host, 0) >= per_host_limit:
+                            continue
+                        
+                        index, url = pending_by_host[host].popleft()
+                        if not pending_by_host[host]:
+                            del pending_by_host[host]
+                        
+                        in_flight_per_host[host] = in_flight_per_host.get(host, 0) + 1
+                        running[executor.submit(fetch, url)] = (index, url, host)
+                        submitted = True
                 
-                # Blacklist the current proxy if it's a connection issue
-                if self.proxy_manager and isinstance(e, (
-                    requests.exceptions.ProxyError,
-                    requests.exceptions.ConnectTimeout,
-                    requests.exceptions.ConnectionError
-                )):
-                    logger.info("Blacklisting current proxy and retrying")
-                    self.proxy_manager.blacklist_current_proxy()
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, url, host = running.pop(future)
+                    in_flight_per_host[host] -= 1
+                    
+                    try:
+                        result: Union[requests.Response, Exception] = future.result()
+                    except Exception as e:
+                        logger.warning(f"Bulk fetch failed for {url}: {e}")
+                        result = e
+                    
+                    if not preserve_order:
+                        yield url, result
+                    else:
+                        finished[index] = (url, result)
                 
-                # Last attempt failed, try with browser
-                if attempt == retry_count - 1:
-                    logger.info(f"All HTTP requests failed, trying browser mode for {url}")
-                    return self._get_with_browser(url, headers, 1)
+                # Release every result that is next in input order
+                while next_to_yield in finished:
+                    yield finished.pop(next_to_yield)
+                    next_to_yield += 1
+        finally:
+            # Stop scheduling if the caller abandons the generator early
+            for future in running:
+                future.cancel()
+            executor.shutdown(wait=False)
+    
+    def _ensure_pool_size(self, pool_size: int) -> None:
+        """
+        Grow the session connection pool so concurrent fetches can reuse connections.
+        
+        Args:
+            pool_size: Minimum number of pooled connections per host
+        """
+        with self._lock:
+            if pool_size <= self._pool_maxsize:
+                return
+            
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+            self._pool_maxsize = pool_size
+    
+    def _get_cached_response(
+        self,
+        url: str,
+        cache_keys: Optional[List[str]] = None
+    ) -> Optional[requests.Response]:
+        """
+        Build a response from the cache if the URL has a usable cached entry.
+        
+        Args:
+            url: The URL to look up
+            cache_keys: Identifiers to look up, in order (defaults to the URL)
+            
+        Returns:
+            Optional[requests.Response]: The cached response, or None on a miss
+        """
+        if not self.cache_mechanism:
+            return None
+        
+        for cache_key in cache_keys or [url]:
+            cached_data = self.cache_mechanism.get_cached_data(cache_key)
+            if not (cached_data and isinstance(cached_data, dict) and 'content' in cached_data):
+                continue
                 
-                # Sleep before retry
-                time.sleep(2 ** attempt)  # Exponential backoff
+            logger.info(f"Using cached response for {url}")
+            
+            response = self._response_from_cache(url, cached_data)
+            response.fetch_info = {'mode': 'cache', 'cache_key': cache_key}
+            return response
         
-        # This should not happen as _get_with_browser will either return or raise
-        raise requests.RequestException(f"Failed to fetch {url} after all retries")
+        return None
+    
+    def _cache_key(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        mode: str
+    ) -> str:
+        """
+        Build the identifier a request is cached under.
+        
+        Args:
+            url: The URL
+            params: Optional query parameters
+            headers: Optional HTTP headers
+            mode: The fetch mode (MODE_HTTP or MODE_BROWSER)
+            
+        Returns:
+            str: The cache identifier (see `CacheKeyBuilder.build`)
+        """
+        if not self.cache_mechanism:
+            return url
+        return self.cache_mechanism.key_builder.build(url, params, headers, mode)
+    
+    def _lookup_cache_keys(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        force_browser: bool
+    ) -> List[str]:
+        """
+        Get the identifiers a request can be served from, in order of preference.
+        
+        A plain request can be answered by a cached HTTP or rendered response;
+        a forced browser request only by a rendered one.
+        
+        Args:
+            url: The URL
+            params: Optional query parameters
+            headers: Optional HTTP headers
+            force_browser: Whether browser-based fetching is forced
+            
+        Returns:
+            List[str]: The cache identifiers
+        """
+        keys = [] if force_browser else [self._cache_key(url, params, headers, MODE_HTTP)]
+        browser_key = self._cache_key(self._url_with_params(url, params), None, headers, MODE_BROWSER)
+        if browser_key not in keys:
+            keys.append(browser_key)
+        return keys
+    
+    @staticmethod
+    def _url_with_params(url: str, params: Optional[Dict[str, Any]]) -> str:
+        """Merge query parameters into a URL, as requests would send them."""
+        if not params:
+            return url
+        return requests.Request('GET', url, params=params).prepare().url
+    
+    def _response_from_cache(self, url: str, cached_data: Dict[str, Any]) -> requests.Response:
+        """
+        Create a Response-like object from cached data.
+        
+        Args:
+            url: The URL that was fetched
+            cached_data: The cached 'content', 'status_code' and 'headers'
+            
+        Returns:
+            requests.Response: The response
+        """
+        response = requests.Response()
+        response.url = url
+        response._content = cached_data['content'].encode('utf-8')
+        response.status_code = cached_data.get('status_code', 200)
+        response.headers = CaseInsensitiveDict(cached_data.get('headers') or {})
+        response.encoding = 'utf-8'
+        return response
+    
+    def _get_stale_response(
+        self,
+        url: str,
+        cache_keys: Optional[List[str]] = None
+    ) -> Optional[requests.Response]:
+        """
+        Build a response from an expired cache entry within the stale-while-revalidate window.
+        
+        Args:
+            url: The URL to look up
+            cache_keys: Identifiers to look up, in order (defaults to the URL)
+            
+        Returns:
+            Optional[requests.Response]: The stale response, or None if there is no servable entry
+        """
+        if not self.cache_mechanism:
+            return None
+        
+        window = self.cache_policy.stale_window(url)
+        if window <= 0:
+            return None
+        
+        for cache_key in cache_keys or [url]:
+            overdue = self.cache_mechanism.seconds_since_expiry(cache_key)
+            if overdue is None or overdue > window:
+                continue
+            
+            cached_data = self.cache_mechanism.get_cached_data(cache_key, include_stale=True)
+            if not (cached_data and isinstance(cached_data, dict) and 'content' in cached_data):
+                continue
+            
+            logger.info(f"Serving stale response for {url} ({overdue:.0f}s past expiry)")
+            
+            response = self._response_from_cache(url, cached_data)
+            response.fetch_info = {
+                'mode': 'cache',
+                'cache_key': cache_key,
+                'stale': True,
+                'stale_seconds': max(0.0, overdue)
+            }
+            return response
+        
+        return None
+    
+    def _refresh_in_background(
+        self,
+        url: str,
+        cache_key: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        force_browser: bool,
+        retry_count: int,
+        timeout: int
+    ) -> bool:
+        """
+        Refresh a stale cache entry in a background thread, once per cache entry at a time.
+        
+        Args:
+            url: The URL to refresh
+            cache_key: Identifier of the stale entry, used to run one refresh per entry
+            params: Optional query parameters
+            headers: Optional HTTP headers
+            force_browser: Whether to force browser-based fetching
+            retry_count: Number of retries on failure
+            timeout: Request timeout in seconds
+            
+        Returns:
+            bool: True if a refresh is running for the entry (started now or earlier)
+        """
+        with self._lock:
+            if cache_key in self._refreshing:
+                return True
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(
+                    max_workers=self.scraper_config.get("refresh_workers", 4),
+                    thread_name_prefix="cache-refresh"
+                )
+            self._refreshing.add(cache_key)
+        
+        def refresh() -> None:
+            try:
+                self._fetch(url, params, headers, True, force_browser, retry_count, timeout)
+            except Exception as e:
+                logger.warning(f"Background refresh of {url} failed: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(cache_key)
+        
+        try:
+            self._refresh_executor.submit(refresh)
+        except RuntimeError:
+            # The scraper is closing
+            with self._lock:
+                self._refreshing.discard(cache_key)
+            return False
+        return True
+    
+    def _get_revalidation_data(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get an expired cache entry that can be revalidated.
+        
+        Args:
+            cache_key: The identifier of the HTTP response (see `_cache_key`)
+            
+        Returns:
+            Optional[Dict[str, Any]]: The cached data if it has an ETag or Last-Modified validator
+        """
+        if not self.cache_mechanism:
+            return None
+        
+        cached_data = self.cache_mechanism.get_cached_data(cache_key, include_stale=True)
+        if not (cached_data and isinstance(cached_data, dict) and 'content' in cached_data):
+            return None
+        
+        cached_headers = CaseInsensitiveDict(cached_data.get('headers') or {})
+        if not (cached_headers.get('ETag') or cached_headers.get('Last-Modified')):
+            return None
+        return cached_data
+    
+    @staticmethod
+    def _conditional_headers(
+        headers: Optional[Dict[str, str]],
+        cached_data: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, str]]:
+        """
+        Add If-None-Match/If-Modified-Since from a cached entry to the request headers.
+        
+        Args:
+            headers: Optional HTTP headers
+            cached_data: The cached entry being revalidated, if any
+            
+        Returns:
+            Optional[Dict[str, str]]: The headers for the HTTP attempts
+        """
+        if cached_data is None:
+            return headers
+        
+        cached_headers = CaseInsensitiveDict(cached_data.get('headers') or {})
+        conditional = dict(headers or {})
+        if cached_headers.get('ETag'):
+            conditional['If-None-Match'] = cached_headers['ETag']
+        if cached_headers.get('Last-Modified'):
+            conditional['If-Modified-Since'] = cached_headers['Last-Modified']
+        return conditional
+    
+    def _serve_revalidated(
+        self,
+        url: str,
+        cached_data: Dict[str, Any],
+        not_modified: requests.Response,
+        path: List[Dict[str, Any]],
+        cache_key: Optional[str] = None
+    ) -> requests.Response:
+        """
+        Refresh a cached entry after a 304 Not Modified and return its body.
+        
+        Args:
+            url: The URL that was fetched
+            cached_data: The cached entry that was revalidated
+            not_modified: The 304 response
+            path: Steps taken for the URL
+            cache_key: The identifier of the entry (defaults to the URL)
+            
+        Returns:
+            requests.Response: The cached response, with `fetch_info` set
+        """
+        logger.info(f"Cached response for {url} is still valid (304 Not Modified)")
+        path.append(self._escalation_step(MODE_HTTP, OUTCOME_NOT_MODIFIED, ACTION_RETURN, not_modified))
+        self.fetch_modes.record(url, MODE_HTTP, True)
+        
+        # Headers sent with the 304 (new validators, caching directives) replace the stored ones
+        headers = CaseInsensitiveDict(cached_data.get('headers') or {})
+        for name, value in not_modified.headers.items():
+            if name.lower() not in _BODY_HEADERS:
+                headers[name] = value
+        cached_data = dict(cached_data, headers=dict(headers))
+        
+        # Storing the entry again restarts its expiration
+        self.cache_mechanism.cache_data(cache_key or url, cached_data, ttl=self.cache_policy.ttl_for(url, headers))
+        
+        response = self._response_from_cache(url, cached_data)
+        response.fetch_info = {'mode': MODE_HTTP, 'path': path, 'revalidated': True}
+        return response
     
     def _get_with_requests(
         self,
@@ -234,6 +942,9 @@ class WebScraper:
         Raises:
             requests.RequestException: If the request fails
         """
+        # Throttle requests to avoid overloading the host
+        self._respect_rate_limits(url)
+        
         # Prepare headers
         request_headers = {"User-Agent": self.user_agent}
         if headers:
@@ -286,105 +997,82 @@ class WebScraper:
         """
         try:
             # Only import Playwright when needed
-            from playwright.sync_api import sync_playwright, Error as PlaywrightError
+            from playwright.sync_api import Error as PlaywrightError
             
-            with sync_playwright() as p:
-                for attempt in range(retry_count):
-                    try:
-                        # Launch browser
-                        browser_options = {
-                            'headless': self.browser_headless
-                        }
-                        
-                        # Add proxy if available
-                        if self.proxy_manager:
-                            proxy_config = self.proxy_manager.get_playwright_proxy()
-                            if proxy_config:
-                                browser_options['proxy'] = proxy_config
-                                logger.debug(f"Using proxy for browser fetching: {url}")
-                        
-                        # Launch browser
-                        browser = p.chromium.launch(**browser_options)
-                        
-                        # Randomize viewport to avoid fingerprinting
-                        context_options = {
-                            'viewport': {
-                                'width': random.randint(1280, 1920),
-                                'height': random.randint(720, 1080)
-                            },
-                            'user_agent': self.user_agent
-                        }
-                        
-                        # Create context and page
-                        context = browser.new_context(**context_options)
-                        
-                        # Set extra headers if provided
-                        if headers:
-                            context.set_extra_http_headers(headers)
-                        
-                        # Create page
-                        page = context.new_page()
-                        
-                        # Navigate to URL
-                        logger.info(f"Fetching {url} with browser")
-                        page.goto(url, wait_until="networkidle", timeout=60000)
-                        
-                        # Check for and solve CAPTCHA if needed
-                        if self.captcha_solver and self._is_browser_captcha_page(page):
-                            logger.info(f"CAPTCHA detected in browser, attempting to solve")
-                            captcha_solved = self.captcha_solver.detect_and_solve_recaptcha(page)
-                            
-                            if captcha_solved:
-                                logger.info("CAPTCHA solved, waiting for page to load")
-                                page.wait_for_load_state("networkidle")
-                                time.sleep(2)  # Give extra time for page to update
-                            else:
-                                logger.warning("Failed to solve CAPTCHA")
-                                
-                                # Try with another proxy if available
-                                if self.proxy_manager:
-                                    self.proxy_manager.blacklist_current_proxy()
-                        
-                        # Get page content
-                        content = page.content()
-                        
-                        # Get cookies
-                        cookies = context.cookies()
-                        
-                        # Create a Response-like object
-                        response = requests.Response()
-                        response.url = page.url
-                        response._content = content.encode('utf-8')
-                        response.status_code = 200
-                        
-                        # Add cookies to session
-                        for cookie in cookies:
-                            domain = cookie.get('domain', '')
-                            if domain and domain in url:
-                                self.session.cookies.set(
-                                    cookie.get('name', ''), 
-                                    cookie.get('value', ''),
-                                    domain=domain
-                                )
-                        
-                        # Close browser
-                        browser.close()
-                        
-                        # Cache the response if enabled
-                        if self.cache_mechanism:
-                            self._cache_response(url, response)
-                        
-                        return response
-                        
-                    except PlaywrightError as e:
-                        logger.warning(f"Browser fetch failed (attempt {attempt+1}/{retry_count}): {e}")
-                        
-                        # Blacklist proxy if it appears to be the issue
-                        if "proxy" in str(e).lower() and self.proxy_manager:
-                            self.proxy_manager.blacklist_current_proxy()
+            for attempt in range(retry_count):
+                try:
+                    # Throttle requests to avoid overloading the host
+                    self._respect_rate_limits(url)
+                    
+                    # Use a proxy for this browser context if available
+                    proxy_config = None
+                    if self.proxy_manager:
+                        proxy_config = self.proxy_manager.get_playwright_proxy()
+                        if proxy_config:
+                            logger.debug(f"Using proxy for browser fetching: {url}")
+                    
+                    # Randomize viewport to avoid fingerprinting
+                    context_options = {
+                        'viewport': {
+                            'width': random.randint(1280, 1920),
+                            'height': random.randint(720, 1080)
+                        },
+                        'user_agent': self.user_agent
+                    }
+                    
+                    rendered = None
+                    if self.render_service is not None:
+                        logger.info(f"Fetching {url} with render service")
+                        rendered = self.render_service.render(
+                            url,
+                            headers=headers,
+                            proxy=proxy_config,
+                            context_options=context_options,
+                            wait_policy=self.wait_policies.for_url(url),
+                            resource_policy=self.resource_policy
+                        )
                         
-                        # Sleep before retry
-                        time.sleep(2 ** attempt)  # Exponential backoff
+                        # CAPTCHAs can only be solved against a live page in this process
+                        if self.captcha_solver and self._is_captcha_page(self._build_rendered_response(rendered)):
+                            logger.info(f"CAPTCHA detected in rendered page, re-rendering locally to solve it")
+                            rendered = None
+                    
+                    if rendered is None:
+                        rendered = self._render_in_pool(url, headers, proxy_config, context_options)
+                    
+                    # Create a Response-like object
+                    response = self._build_rendered_response(rendered)
+                    cookies = rendered['cookies']
+                    logger.debug(
+                        f"Rendered {url} (wait ended by {rendered.get('wait_condition')}): "
+                        f"{summarize_stats(rendered.get('resource_stats'))}"
+                    )
+                    
+                    # Add cookies to session
+                    for cookie in cookies:
+                        domain = cookie.get('domain', '')
+                        if domain and domain in url:
+                            self.session.cookies.set(
+                                cookie.get('name', ''), 
+                                cookie.get('value', ''),
+                                domain=domain
+                            )
+                    
+                    # Cache the response if enabled
+                    if self.cache_mechanism:
+                        self._cache_response(url, response, self._cache_key(url, None, headers, MODE_BROWSER))
+                    
+                    return response
+                    
+                except (PlaywrightError, RenderError) as e:
+                    logger.warning(f"Browser fetch failed (attempt {attempt+1}/{retry_count}): {e}")
+                    
+                    # Blacklist proxy if it appears to be the issue
+                    if "proxy" in str(e).lower() and self.proxy_manager:
+                        self.proxy_manager.blacklist_current_proxy()
+                    
+                    # Sleep before retry
+                    time.sleep(2 ** attempt)  # Exponential backoff
         
         except ImportError:
             logger.error("Playwright is not installed. Install with: pip install playwright")
@@ -394,6 +1082,94 @@ class WebScraper:
         except Exception as e:
             logger.error(f"Browser fetching error: {e}")
             raise requests.RequestException(f"Browser fetch failed: {e}")
+        
+        raise requests.RequestException(f"Browser fetch failed for {url} after {retry_count} attempts")
+    
+    def _render_in_pool(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        proxy_config: Optional[Dict[str, str]],
+        context_options: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Render a URL in this process using the browser pool, solving CAPTCHAs if possible.
+        
+        Args:
+            url: The URL to render
+            headers: Optional HTTP headers
+            proxy_config: Optional Playwright proxy configuration
+            context_options: Keyword arguments for the browser context
+            
+        Returns:
+            Dict[str, Any]: The rendered 'html', final 'url', 'cookies', 'resource_stats' and 'wait_condition'
+        """
+        wait_policy = self.wait_policies.for_url(url)
+        
+        def render(context: Any, page: Any) -> Dict[str, Any]:
+            # Skip sub-resources that never reach page.content()
+            resource_stats = self.resource_policy.apply(context)
+            
+            # Navigate to URL and wait until the page is ready
+            logger.info(f"Fetching {url} with browser")
+            wait_condition = wait_policy.navigate(page, url)
+            
+            # Check for and solve CAPTCHA if needed
+            if self.captcha_solver and self._is_browser_captcha_page(page):
+                logger.info(f"CAPTCHA detected in browser, attempting to solve")
+                captcha_solved = self.captcha_solver.detect_and_solve_recaptcha(page)
+                
+                if captcha_solved:
+                    logger.info("CAPTCHA solved, waiting for page to load")
+                    wait_condition = wait_policy.wait(page)
+                else:
+                    logger.warning("Failed to solve CAPTCHA")
+                    
+                    # Try with another proxy if available
+                    if self.proxy_manager:
+                        self.proxy_manager.blacklist_current_proxy()
+            
+            return {
+                'html': page.content(),
+                'url': page.url,
+                'cookies': context.cookies(),
+                'resource_stats': resource_stats,
+                'wait_condition': wait_condition
+            }
+        
+        # Render in a fresh context of one of the pool's long-lived browsers
+        return self.browser_pool.render(
+            render,
+            proxy=proxy_config,
+            context_options=context_options,
+            extra_headers=headers
+        )
+    
+    def _build_rendered_response(self, rendered: Dict[str, Any]) -> requests.Response:
+        """
+        Create a Response-like object from a rendered page.
+        
+        The response carries a `fetch_info` dict describing how it was fetched,
+        including the blocked/allowed request counters of the render and the
+        condition that ended the wait for the page.
+        
+        Args:
+            rendered: The rendered 'html', final 'url' and optional 'resource_stats' and 'wait_condition'
+            
+        Returns:
+            requests.Response: The response
+        """
+        response = requests.Response()
+        response.url = rendered['url']
+        response._content = rendered['html'].encode('utf-8')
+        response.status_code = 200
+        response.encoding = 'utf-8'
+        response.fetch_info = {
+            'mode': 'browser',
+            'resource_stats': rendered.get('resource_stats'),
+            'wait_condition': rendered.get('wait_condition')
+        }
+        return response
     
     def _is_captcha_page(self, response: requests.Response) -> bool:
         """
@@ -405,19 +1181,66 @@ class WebScraper:
         Returns:
             bool: True if a CAPTCHA is detected
         """
-        # Check status code (many CAPTCHA pages return 403)
-        if response.status_code in (403, 429):
-            return True
+        # Challenge markup, vendor scripts, title, headers and status, weighed
+        # against the amount of real content on the page; scored from the shared
+        # signal scan and kept on the response, so the page is only scanned once
+        cached = getattr(response, '_captcha_result', None)
+        if cached is not None and cached[0] is response.content:
+            return cached[1]['is_captcha']
+        result = self.captcha_classifier.classify(
+            response.text, response.status_code, response.headers,
+            page_signals=self._classify_response(response)['signals']
+        )
+        response._captcha_result = (response.content, result)
+        if result['is_captcha']:
+            logger.debug(f"CAPTCHA page ({result['vendor']}, confidence {result['confidence']}): {result['signals']}")
+        return result['is_captcha']
+    
+    def _classify_outcome(self, response: requests.Response) -> str:
+        """
+        Classify the outcome of an HTTP attempt for the escalation policy.
+        
+        Args:
+            response: The HTTP response
             
-        # Check content for CAPTCHA keywords
-        content_lower = response.text.lower()
-        captcha_keywords = [
-            "captcha", "robot", "human verification", "are you human",
-            "security check", "verify you are human", "bot check",
-            "recaptcha", "hcaptcha", "challenge"
-        ]
+        Returns:
+            str: The outcome (captcha, an error status class, short_body, js_required or ok)
+        """
+        # Challenge pages are often served with 403/429/503, so look at them first
+        if self._is_captcha_page(response):
+            return OUTCOME_CAPTCHA
+        
+        outcome = self.escalation_policy.classify_status(response.status_code)
+        if outcome:
+            return outcome
         
-        return any(keyword in content_lower for keyword in captcha_keywords)
+        if len(response.text) < 1000:
+            return OUTCOME_SHORT_BODY
+        
+        if self._needs_browser(response):
+            return OUTCOME_JS_REQUIRED
+        
+        return OUTCOME_OK
+    
+    def _classify_response(self, response: requests.Response) -> Dict[str, Any]:
+        """
+        Classify a response from its keyword signals, scanning it only once.
+        
+        The result is kept on the response (for its current content) so repeated
+        checks, including the CAPTCHA classifier, share a single scan.
+        
+        Args:
+            response: The HTTP response
+            
+        Returns:
+            Dict[str, Any]: The 'classification' and matched 'signals' (see `classify_page`)
+        """
+        cached = getattr(response, '_page_signals', None)
+        if cached is not None and cached[0] is response.content:
+            return cached[1]
+        result = classify_page(response.text, self._signal_matcher)
+        response._page_signals = (response.content, result)
+        return result
     
     def _is_browser_captcha_page(self, page: Any) -> bool:
         """
@@ -430,32 +1253,12 @@ class WebScraper:
             bool: True if a CAPTCHA is detected
         """
         try:
-            # Check for common CAPTCHA elements and text
-            content = page.content().lower()
-            captcha_keywords = [
-                "captcha", "robot", "human verification", "are you human",
-                "security check", "verify you are human", "bot check",
-                "recaptcha", "hcaptcha", "challenge"
-            ]
-            
-            # Check for text indicators
-            if any(keyword in content for keyword in captcha_keywords):
-                return True
-                
-            # Check for specific CAPTCHA elements
-            captcha_elements = [
-                ".g-recaptcha",
-                ".h-captcha",
-                "iframe[src*='captcha']",
-                "iframe[src*='recaptcha']",
-                "iframe[src*='hcaptcha']"
-            ]
-            
-            for selector in captcha_elements:
-                if page.query_selector(selector):
-                    return True
-                    
-            return False
+            # The rendered DOM includes injected widgets and challenge iframes,
+            # so the same structural classifier applies
+            result = self.captcha_classifier.classify(page.content())
+            if result['is_captcha']:
+                logger.debug(f"CAPTCHA in browser ({result['vendor']}, confidence {result['confidence']}): {result['signals']}")
+            return result['is_captcha']
             
         except Exception as e:
             logger.error(f"Error checking for CAPTCHA in browser: {e}")
@@ -476,58 +1279,42 @@ class WebScraper:
             return True
             
         # Check for very short content
-        if len(response.text) < 1000:
+        text = response.text
+        if len(text) < 1000:
             return True
             
-        # Check for JavaScript-only pages
-        content_lower = response.text.lower()
-        js_indicators = [
-            "javascript is required", 
-            "enable javascript", 
-            "please enable javascript",
-            "you need to enable javascript"
-        ]
-        
         # Check for JavaScript indicators
-        if any(indicator in content_lower for indicator in js_indicators):
+        if self._classify_response(response)['signals'][CLASS_JS_REQUIRED]:
             return True
             
-        # Count specific tags that might indicate a JS-only page
-        soup = BeautifulSoup(response.text, 'html.parser')
-        body_content = soup.find('body')
-        
-        if body_content:
-            # If too many script tags compared to other content
-            script_tags = body_content.find_all('script')
-            other_tags = body_content.find_all(['p', 'div', 'span', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-            
-            if len(script_tags) > len(other_tags) * 2:
-                return True
-                
-        return False
+        # Too many script tags compared to content tags in the body, counted
+        # in a single scan of the raw bytes instead of building a parse tree
+        return is_script_heavy(response.content)
     
-    def _respect_rate_limits(self) -> None:
+    def _respect_rate_limits(self, url: str) -> None:
         """
-        Ensure a minimum interval between requests to be respectful.
-        """
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
+        Wait until the per-host rate limiter allows a request to the URL.
         
-        if time_since_last_request < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last_request
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
+        Args:
+            url: The URL about to be requested
+        """
+        self.rate_limiter.acquire(url)
     
-    def _cache_response(self, url: str, response: requests.Response) -> None:
+    def _cache_response(self, url: str, response: requests.Response, cache_key: Optional[str] = None) -> None:
         """
         Cache a response for future use.
         
         Args:
             url: The URL that was fetched
             response: The HTTP response
+            cache_key: The identifier to cache the response under (defaults to the URL)
         """
         if not self.cache_mechanism:
             return
+        
+        if not self.cache_policy.is_storable(url, response.headers):
+            logger.debug(f"Not caching {url} (Cache-Control: no-store)")
+            return
             
         try:
             # Extract response data to cache
@@ -538,9 +1325,10 @@ class WebScraper:
                 'url': response.url
             }
             
-            # Store in cache
-            self.cache_mechanism.cache_data(url, cached_data)
-            logger.debug(f"Cached response for {url}")
+            # Store in cache, fresh for the lifetime the response declares
+            ttl = self.cache_policy.ttl_for(url, response.headers)
+            self.cache_mechanism.cache_data(cache_key or url, cached_data, ttl=ttl)
+            logger.debug(f"Cached response for {url} (ttl: {ttl if ttl is not None else 'default'})")
             
         except Exception as e:
             logger.error(f"Error caching response: {e}")
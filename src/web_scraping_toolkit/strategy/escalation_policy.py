@@ -0,0 +1,220 @@
+"""
+Escalation Policy for the Web Scraping Toolkit.
+
+This module decides what `WebScraper.get` does after an HTTP attempt. Each
+attempt is classified into an outcome (permanent client error, rate limited,
+server error, DNS failure, short body, JavaScript required, ...) and the
+policy maps the outcome to an action: fail fast, retry over HTTP, rotate the
+proxy and retry, or render in the browser. Browser capacity is only spent on
+URLs a browser can actually fix.
+"""
+
+from typing import Dict, List, Any, Optional, Union
+
+import requests
+
+from ..utils.logger import get_logger
+from ..utils.config import get_escalation_config
+
+# Initialize logger
+logger = get_logger("escalation_policy")
+
+# Outcomes of an HTTP attempt
+OUTCOME_OK = "ok"
+OUTCOME_CAPTCHA = "captcha"
+OUTCOME_JS_REQUIRED = "js_required"
+OUTCOME_SHORT_BODY = "short_body"
+OUTCOME_CLIENT_ERROR = "client_error"      # permanent 4xx: 400, 404, 410, ...
+OUTCOME_FORBIDDEN = "forbidden"            # 401, 403: often a bot block
+OUTCOME_RATE_LIMITED = "rate_limited"      # 429
+OUTCOME_SERVER_ERROR = "server_error"      # 5xx
+OUTCOME_TIMEOUT = "timeout"
+OUTCOME_CONNECTION_ERROR = "connection_error"
+OUTCOME_PROXY_ERROR = "proxy_error"
+OUTCOME_DNS_ERROR = "dns_error"
+OUTCOME_REQUEST_ERROR = "request_error"    # invalid URL, too many redirects, ...
+
+# Outcomes that only annotate the recorded path
+OUTCOME_LEARNED_BROWSER = "learned_browser"  # HTTP skipped, the domain needs the browser
+OUTCOME_RENDER_ERROR = "render_error"
+OUTCOME_NOT_MODIFIED = "not_modified"        # 304 to a revalidation, the cached body is served
+
+# Actions
+ACTION_RETURN = "return"                   # hand back a good response
+ACTION_FAIL = "fail"                       # stop: return the response or raise the error
+ACTION_RETRY = "retry"                     # retry over HTTP
+ACTION_ROTATE_PROXY = "rotate_proxy"       # blacklist the current proxy and retry
+ACTION_RENDER = "render"                   # fetch with the browser
+
+ACTIONS = (ACTION_FAIL, ACTION_RETRY, ACTION_ROTATE_PROXY, ACTION_RENDER)
+
+# Actions that need another HTTP attempt
+RETRY_ACTIONS = (ACTION_RETRY, ACTION_ROTATE_PROXY)
+
+# Default action chains: the first action applies while HTTP attempts remain,
+# the first non-retry action once they are used up (fail if there is none)
+DEFAULT_RULES: Dict[str, List[str]] = {
+    OUTCOME_CAPTCHA: [ACTION_RENDER],
+    OUTCOME_JS_REQUIRED: [ACTION_RENDER],
+    OUTCOME_SHORT_BODY: [ACTION_RENDER],
+    OUTCOME_CLIENT_ERROR: [ACTION_FAIL],
+    OUTCOME_FORBIDDEN: [ACTION_RENDER],
+    OUTCOME_RATE_LIMITED: [ACTION_RETRY, ACTION_FAIL],
+    OUTCOME_SERVER_ERROR: [ACTION_RETRY, ACTION_FAIL],
+    OUTCOME_TIMEOUT: [ACTION_RETRY, ACTION_FAIL],
+    OUTCOME_CONNECTION_ERROR: [ACTION_ROTATE_PROXY, ACTION_RENDER],
+    OUTCOME_PROXY_ERROR: [ACTION_ROTATE_PROXY, ACTION_FAIL],
+    OUTCOME_DNS_ERROR: [ACTION_FAIL],
+    OUTCOME_REQUEST_ERROR: [ACTION_FAIL],
+}
+
+# Fragments of resolver errors as reported by urllib3, aiohttp and the OS
+_DNS_ERROR_MARKERS = (
+    "nameresolutionerror",
+    "failed to resolve",
+    "name or service not known",
+    "nodename nor servname",
+    "getaddrinfo failed",
+    "temporary failure in name resolution",
+    "no address associated with hostname",
+)
+
+class EscalationPolicy:
+    """
+    Configurable mapping from HTTP attempt outcomes to actions.
+
+    This class provides:
+    - Classification of status codes and request exceptions into outcomes
+    - Per-outcome action chains (e.g. retry, then fail), configurable via ESCALATION_RULES
+    - Retry delays with exponential backoff that honour Retry-After
+    """
+
+    def __init__(
+        self,
+        rules: Optional[Dict[str, Union[str, List[str]]]] = None,
+        max_retry_after: Optional[float] = None
+    ):
+        """
+        Initialize the escalation policy with optional custom settings.
+
+        Args:
+            rules: Mapping of outcome to an action or action chain, merged over the defaults (overrides config)
+            max_retry_after: Longest Retry-After delay honoured, in seconds (overrides config)
+
+        Raises:
+            ValueError: If a rule names an unknown outcome or action
+        """
+        # Load escalation configuration
+        config = get_escalation_config()
+
+        # Override configuration with constructor parameters if provided
+        if rules is None:
+            rules = config.get("rules", {})
+        self.max_retry_after = max_retry_after if max_retry_after is not None else config.get("max_retry_after", 60)
+
+        self.rules = {outcome: list(chain) for outcome, chain in DEFAULT_RULES.items()}
+        for outcome, chain in rules.items():
+            if outcome not in DEFAULT_RULES:
+                raise ValueError(f"Unknown escalation outcome: {outcome}")
+            chain = [chain] if isinstance(chain, str) else list(chain)
+            unknown = [action for action in chain if action not in ACTIONS]
+            if not chain or unknown:
+                raise ValueError(f"Invalid escalation actions for {outcome}: {chain}")
+            self.rules[outcome] = chain
+
+    def classify_status(self, status_code: int) -> Optional[str]:
+        """
+        Classify an HTTP status code.
+
+        Args:
+            status_code: The response status code
+
+        Returns:
+            Optional[str]: The outcome for error statuses, or None for success
+        """
+        if status_code == 429:
+            return OUTCOME_RATE_LIMITED
+        if status_code in (401, 403):
+            return OUTCOME_FORBIDDEN
+        if status_code >= 500:
+            return OUTCOME_SERVER_ERROR
+        if status_code >= 400:
+            return OUTCOME_CLIENT_ERROR
+        return None
+
+    def classify_exception(self, error: requests.RequestException) -> str:
+        """
+        Classify a request exception.
+
+        Args:
+            error: The exception raised by the HTTP attempt
+
+        Returns:
+            str: The outcome
+        """
+        if isinstance(error, requests.exceptions.ProxyError):
+            return OUTCOME_PROXY_ERROR
+        if isinstance(error, requests.exceptions.ConnectionError):
+            message = str(error).lower()
+            if any(marker in message for marker in _DNS_ERROR_MARKERS):
+                return OUTCOME_DNS_ERROR
+            return OUTCOME_CONNECTION_ERROR
+        if isinstance(error, requests.exceptions.Timeout):
+            return OUTCOME_TIMEOUT
+        return OUTCOME_REQUEST_ERROR
+
+    def action_for(self, outcome: str, can_retry: bool) -> str:
+        """
+        Choose the action for an outcome.
+
+        Args:
+            outcome: The outcome of the HTTP attempt
+            can_retry: Whether another HTTP attempt is allowed
+
+        Returns:
+            str: The action to take
+        """
+        if outcome == OUTCOME_OK:
+            return ACTION_RETURN
+
+        chain = self.rules.get(outcome, [ACTION_FAIL])
+        if can_retry or chain[0] not in RETRY_ACTIONS:
+            return chain[0]
+        for action in chain[1:]:
+            if action not in RETRY_ACTIONS:
+                return action
+        return ACTION_FAIL
+
+    def retry_delay(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """
+        Get the delay before the next HTTP attempt.
+
+        Args:
+            attempt: Zero-based index of the attempt that just failed
+            response: The response of that attempt, if any
+
+        Returns:
+            float: Seconds to wait
+        """
+        delay = float(2 ** attempt)  # Exponential backoff
+
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                delay = max(delay, min(float(retry_after), self.max_retry_after))
+            except ValueError:
+                logger.debug(f"Ignoring non-numeric Retry-After: {retry_after}")
+
+        return delay
+
+def describe_path(path: List[Dict[str, Any]]) -> str:
+    """
+    Format an escalation path for logging.
+
+    Args:
+        path: Steps recorded in `response.fetch_info['path']`
+
+    Returns:
+        str: e.g. "http:server_error->retry, http:ok->return"
+    """
+    return ", ".join(f"{step['mode']}:{step['outcome']}->{step['action']}" for step in path)
@@ -0,0 +1,226 @@
+"""
+Fetch Mode Memory for the Web Scraping Toolkit.
+
+This module remembers, per domain, whether plain HTTP fetches work or keep
+being escalated to a browser (CAPTCHA pages, JavaScript-only content, failed
+requests). Domains where HTTP is known to fail go straight to the browser,
+skipping the doomed HTTP round trip and the page inspection that follows it.
+
+Evidence decays over time and HTTP is re-probed periodically, so a domain
+that stops needing a browser is noticed again. The memory can be persisted
+as JSON so it survives restarts; by default it is kept next to the cache of
+the scraper that uses it, and only in memory when there is no cache.
+"""
+
+import os
+import json
+import time
+import tempfile
+import threading
+from typing import Dict, Any, Optional
+
+from ..utils.logger import get_logger
+from ..utils.config import get_fetch_mode_config
+from ..utils.domain_rules import get_host
+
+# Initialize logger
+logger = get_logger("fetch_mode_memory")
+
+# Fetch modes
+MODE_HTTP = "http"
+MODE_BROWSER = "browser"
+
+# File name used when the memory is kept in a cache directory
+FETCH_MODE_FILENAME = "fetch_modes.json"
+
+# Seconds between automatic saves of a changed memory
+SAVE_INTERVAL = 30
+
+# Slack for comparing decayed scores, so back-to-back failures count as whole ones
+_SCORE_SLACK = 1e-3
+
+class FetchModeMemory:
+    """
+    Persisted per-domain memory of which fetch mode works.
+
+    This class provides:
+    - Success/failure scores per domain and mode, decayed with a half-life
+    - `choose_mode()` returning the cheapest mode expected to work
+    - Periodic HTTP re-probes for domains routed to the browser
+    - JSON persistence, written atomically
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        enabled: Optional[bool] = None,
+        half_life_hours: Optional[float] = None,
+        reprobe_interval: Optional[int] = None,
+        min_evidence: Optional[float] = None
+    ):
+        """
+        Initialize the fetch mode memory with optional custom settings.
+
+        Args:
+            path: JSON file the memory is loaded from and saved to (overrides config, "" = not persisted;
+                not persisted by default)
+            enabled: Whether fetch mode learning is enabled (overrides config)
+            half_life_hours: Hours after which old evidence counts half (overrides config)
+            reprobe_interval: Seconds between HTTP re-probes of browser domains (overrides config)
+            min_evidence: Decayed HTTP failures needed before skipping HTTP (overrides config)
+        """
+        # Load fetch mode configuration
+        self.config = get_fetch_mode_config()
+
+        # Override configuration with constructor parameters if provided
+        self.path = path if path is not None else self.config.get("file") or ""
+        self.enabled = enabled if enabled is not None else self.config.get("enabled", True)
+        self.half_life = (half_life_hours if half_life_hours is not None else self.config.get("half_life_hours", 24)) * 3600
+        self.reprobe_interval = reprobe_interval if reprobe_interval is not None else self.config.get("reprobe_interval", 3600)
+        self.min_evidence = min_evidence if min_evidence is not None else self.config.get("min_evidence", 2)
+
+        # Records by host
+        self._domains: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._last_save = time.time()
+
+        # Thread lock for the records
+        self._lock = threading.Lock()
+
+        if self.enabled:
+            self._load()
+
+    def _load(self) -> None:
+        """Load persisted records, ignoring a missing or unreadable file."""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._domains = json.load(f)
+            logger.info(f"Loaded fetch modes for {len(self._domains)} domains from {self.path}")
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load fetch modes from {self.path}: {e}")
+
+    def save(self) -> None:
+        """Write the memory to disk if it changed since the last save."""
+        with self._lock:
+            if not self.path or not self._dirty:
+                return
+            data = json.dumps(self._domains)
+            self._dirty = False
+            self._last_save = time.time()
+
+        try:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".fetch_modes.")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not save fetch modes to {self.path}: {e}")
+
+    def _decay(self, record: Dict[str, Any], now: float) -> None:
+        """Scale the record's scores down by the time elapsed since its last update (lock must be held)."""
+        elapsed = now - record['updated']
+        if elapsed > 0 and self.half_life > 0:
+            factor = 0.5 ** (elapsed / self.half_life)
+            for scores in record['scores'].values():
+                scores[0] *= factor
+                scores[1] *= factor
+        record['updated'] = now
+
+    def choose_mode(self, url: str) -> str:
+        """
+        Choose the fetch mode for a URL.
+
+        Returns MODE_BROWSER only when HTTP has failed repeatedly for the
+        domain while the browser has succeeded, and no HTTP re-probe is due.
+
+        Args:
+            url: The URL about to be fetched
+
+        Returns:
+            str: MODE_HTTP or MODE_BROWSER
+        """
+        if not self.enabled:
+            return MODE_HTTP
+
+        host = get_host(url)
+        now = time.time()
+        with self._lock:
+            record = self._domains.get(host)
+            if record is None:
+                return MODE_HTTP
+
+            self._decay(record, now)
+            http_ok, http_failed = record['scores'][MODE_HTTP]
+            browser_ok, browser_failed = record['scores'][MODE_BROWSER]
+            if http_failed + _SCORE_SLACK < self.min_evidence or http_failed <= http_ok or browser_ok <= browser_failed:
+                return MODE_HTTP
+
+            # Re-probe HTTP now and then in case the site changed
+            if now - record['last_http_probe'] >= self.reprobe_interval:
+                record['last_http_probe'] = now
+                logger.debug(f"Re-probing HTTP for {host}")
+                return MODE_HTTP
+
+            return MODE_BROWSER
+
+    def record(self, url: str, mode: str, success: bool) -> None:
+        """
+        Record the outcome of a fetch.
+
+        Domains are only tracked once something failed for them, so plain
+        HTTP sites never enter the memory. A successful HTTP fetch clears the
+        domain's HTTP failures, so one good re-probe switches it back to HTTP.
+
+        Args:
+            url: The fetched URL
+            mode: MODE_HTTP or MODE_BROWSER
+            success: Whether the mode produced a usable page
+        """
+        if not self.enabled:
+            return
+
+        host = get_host(url)
+        now = time.time()
+        with self._lock:
+            record = self._domains.get(host)
+            if record is None:
+                if success:
+                    return
+                record = {
+                    'scores': {MODE_HTTP: [0.0, 0.0], MODE_BROWSER: [0.0, 0.0]},
+                    'updated': now,
+                    'last_http_probe': now
+                }
+                self._domains[host] = record
+
+            self._decay(record, now)
+            record['scores'][mode][0 if success else 1] += 1
+            if mode == MODE_HTTP:
+                record['last_http_probe'] = now
+                if success:
+                    # A working HTTP fetch (e.g. a re-probe) outweighs older failures
+                    record['scores'][MODE_HTTP][1] = 0.0
+            self._dirty = True
+            save_due = now - self._last_save >= SAVE_INTERVAL
+
+        if save_due:
+            self.save()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the current mode and decayed scores per domain.
+
+        Returns:
+            Dict[str, Any]: Records by host
+        """
+        now = time.time()
+        with self._lock:
+            stats = {}
+            for host, record in self._domains.items():
+                self._decay(record, now)
+                stats[host] = {mode: list(scores) for mode, scores in record['scores'].items()}
+            return stats
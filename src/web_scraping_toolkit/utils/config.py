@@ -41,14 +41,82 @@ def load_config() -> Dict[str, Any]:
         # Captcha solver configuration
         "captcha": {
             "service": os.getenv("CAPTCHA_SERVICE", "2captcha"),
-            "api_key": os.getenv("TWOCAPTCHA_API_KEY", "")
+            "api_key": os.getenv("TWOCAPTCHA_API_KEY", ""),
+            "confidence_threshold": float(os.getenv("CAPTCHA_CONFIDENCE_THRESHOLD", "0.6"))
         },
         
         # Cache configuration
         "cache": {
             "enabled": os.getenv("USE_CACHE", "").lower() == "true",
             "directory": os.getenv("CACHE_DIRECTORY", "cache"),
-            "expiration": int(os.getenv("CACHE_EXPIRATION_SECONDS", "86400"))  # Default: 24 hours
+            "backend": os.getenv("CACHE_BACKEND", "filesystem"),  # filesystem, sqlite, json or memory
+            "hot_max_entries": int(os.getenv("CACHE_HOT_MAX_ENTRIES", "1000")),  # in-memory LRU tier, 0 = disabled
+            "hot_max_bytes": int(os.getenv("CACHE_HOT_MAX_BYTES", str(64 * 1024 * 1024))),  # 0 = no size limit
+            "write_behind": os.getenv("CACHE_WRITE_BEHIND", "false").lower() == "true",  # batch writes in background
+            "flush_interval": float(os.getenv("CACHE_FLUSH_INTERVAL", "1.0")),  # max seconds a write stays buffered
+            "flush_max_pending": int(os.getenv("CACHE_FLUSH_MAX_PENDING", "100")),  # buffered writes that trigger a flush
+            "durable": os.getenv("CACHE_DURABLE", "false").lower() == "true",  # fsync every persisted write
+            "compression": os.getenv("CACHE_COMPRESSION", "none"),  # zstd, zlib or none
+            "compression_level": int(os.getenv("CACHE_COMPRESSION_LEVEL", "3")),
+            "compression_min_bytes": int(os.getenv("CACHE_COMPRESSION_MIN_BYTES", "512")),  # smaller data stays raw
+            "compression_dict_samples": int(os.getenv("CACHE_COMPRESSION_DICT_SAMPLES", "0")),  # pages per domain, 0 = off
+            "lock_stripes": int(os.getenv("CACHE_LOCK_STRIPES", "64")),  # reader/writer locks spread by key
+            "shared_poll_interval": float(os.getenv("CACHE_SHARED_POLL_SECONDS", "1.0")),  # other processes' writes
+            "expiration": int(os.getenv("CACHE_EXPIRATION_SECONDS", "86400")),  # Default: 24 hours
+            "stale_retention": int(os.getenv("CACHE_STALE_RETENTION_SECONDS", "604800")),  # kept for revalidation
+            "sweep_interval": float(os.getenv("CACHE_SWEEP_INTERVAL_SECONDS", "60")),  # between bulk expiry sweeps
+            "respect_headers": os.getenv("CACHE_RESPECT_HEADERS", "true").lower() == "true",  # Cache-Control/Expires
+            "min_ttl": float(os.getenv("CACHE_MIN_TTL", "0")),
+            "max_ttl": float(os.getenv("CACHE_MAX_TTL", "0")),  # 0 = no cap
+            "ttl_rules": _parse_json_env("CACHE_TTL_RULES", {}),
+            "stale_while_revalidate": float(os.getenv("CACHE_STALE_WHILE_REVALIDATE", "0")),  # 0 = disabled
+            "key_drop_params": _parse_list_env("CACHE_KEY_DROP_PARAMS"),  # empty = built-in tracking params
+            "key_headers": _parse_list_env("CACHE_KEY_HEADERS"),  # request headers that are part of the key
+            "key_include_mode": os.getenv("CACHE_KEY_INCLUDE_MODE", "true").lower() == "true"
+        },
+        
+        # Rate limiter configuration
+        "rate_limit": {
+            "enabled": os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true",
+            "default_rate": float(os.getenv("RATE_LIMIT_DEFAULT_RATE", "1.0")),  # requests per second per host
+            "default_burst": int(os.getenv("RATE_LIMIT_DEFAULT_BURST", "1")),
+            "rules": _parse_json_env("RATE_LIMIT_RULES", {})
+        },
+        
+        # Browser pool configuration
+        "browser": {
+            "max_pages_per_browser": int(os.getenv("BROWSER_MAX_PAGES", "100")),
+            "max_memory_mb": int(os.getenv("BROWSER_MAX_MEMORY_MB", "1024")),  # 0 = no memory limit
+            "pool_threads": int(os.getenv("BROWSER_POOL_THREADS", "4")),
+            "render_workers": int(os.getenv("BROWSER_RENDER_WORKERS", "2")),
+            "block_enabled": os.getenv("BROWSER_BLOCK_ENABLED", "true").lower() == "true",
+            "block_resource_types": _parse_list_env("BROWSER_BLOCK_RESOURCE_TYPES"),  # empty = defaults
+            "block_domains": _parse_list_env("BROWSER_BLOCK_DOMAINS"),  # added to the built-in list
+            "wait_default": _parse_json_env("BROWSER_WAIT_DEFAULT", None),  # strategy name or {"strategy": ...}
+            "wait_rules": _parse_json_env("BROWSER_WAIT_RULES", {})
+        },
+        
+        # Scraper configuration
+        "scraper": {
+            "max_concurrency": int(os.getenv("SCRAPER_MAX_CONCURRENCY", "100")),
+            "per_host_concurrency": int(os.getenv("SCRAPER_PER_HOST_CONCURRENCY", "2")),  # 0 = unlimited
+            "refresh_workers": int(os.getenv("SCRAPER_REFRESH_WORKERS", "4")),  # background cache refreshes
+            "io_workers": int(os.getenv("SCRAPER_IO_WORKERS", "4"))  # AsyncWebScraper cache/detection work
+        },
+        
+        # Per-domain fetch mode learning configuration
+        "fetch_mode": {
+            "enabled": os.getenv("FETCH_MODE_LEARNING", "true").lower() == "true",
+            "file": os.getenv("FETCH_MODE_FILE"),
+            "half_life_hours": float(os.getenv("FETCH_MODE_HALF_LIFE_HOURS", "24")),
+            "reprobe_interval": int(os.getenv("FETCH_MODE_REPROBE_SECONDS", "3600")),
+            "min_evidence": float(os.getenv("FETCH_MODE_MIN_EVIDENCE", "2"))
+        },
+        
+        # Escalation policy configuration
+        "escalation": {
+            "rules": _parse_json_env("ESCALATION_RULES", {}),  # outcome -> action or [action, fallback]
+            "max_retry_after": float(os.getenv("ESCALATION_MAX_RETRY_AFTER", "60"))
         }
     }
     
@@ -70,6 +138,27 @@ def _parse_list_env(env_name: str) -> List[str]:
     
     return [item.strip() for item in env_value.split(",") if item.strip()]
 
+def _parse_json_env(env_name: str, default: Any) -> Any:
+    """
+    Parse a JSON-encoded environment variable.
+    
+    Args:
+        env_name: Name of the environment variable.
+        default: Value returned when the variable is unset or invalid.
+        
+    Returns:
+        Any: The decoded value or the default.
+    """
+    env_value = os.getenv(env_name, "")
+    if not env_value:
+        return default
+    
+    try:
+        return json.loads(env_value)
+    except json.JSONDecodeError:
+        print(f"Warning: Invalid format for {env_name}. Should be valid JSON.")
+        return default
+
 def _parse_custom_proxies() -> List[Dict[str, str]]:
     """
     Parse custom proxies from the CUSTOM_PROXIES environment variable.
@@ -115,6 +204,51 @@ def get_cache_config() -> Dict[str, Any]:
     """
     return load_config()["cache"]
 
+def get_rate_limit_config() -> Dict[str, Any]:
+    """
+    Get rate-limiter-specific configuration.
+    
+    Returns:
+        Dict[str, Any]: Rate limiter configuration dictionary.
+    """
+    return load_config()["rate_limit"]
+
+def get_browser_config() -> Dict[str, Any]:
+    """
+    Get browser-pool-specific configuration.
+    
+    Returns:
+        Dict[str, Any]: Browser configuration dictionary.
+    """
+    return load_config()["browser"]
+
+def get_scraper_config() -> Dict[str, Any]:
+    """
+    Get scraper-specific configuration.
+    
+    Returns:
+        Dict[str, Any]: Scraper configuration dictionary.
+    """
+    return load_config()["scraper"]
+
+def get_fetch_mode_config() -> Dict[str, Any]:
+    """
+    Get fetch-mode-learning-specific configuration.
+    
+    Returns:
+        Dict[str, Any]: Fetch mode configuration dictionary.
+    """
+    return load_config()["fetch_mode"]
+
+def get_escalation_config() -> Dict[str, Any]:
+    """
+    Get escalation-policy-specific configuration.
+    
+    Returns:
+        Dict[str, Any]: Escalation configuration dictionary.
+    """
+    return load_config()["escalation"]
+
 # 日志配置
 def get_logger_config() -> Dict[str, Any]:
     """
@@ -0,0 +1,49 @@
+"""
+Domain rule matching for the Web Scraping Toolkit.
+
+This module resolves per-domain settings keyed by exact domains (which also
+cover their subdomains) or glob patterns such as "*.gov".
+"""
+
+import fnmatch
+from typing import Dict, Any, Optional
+from urllib.parse import urlparse
+
+def get_host(url: str) -> str:
+    """
+    Extract the lowercased host name of a URL.
+    
+    Args:
+        url: A URL or bare host name
+        
+    Returns:
+        str: Lowercased host name without port
+    """
+    if "://" not in url:
+        return url.lower()
+    return (urlparse(url).hostname or "").lower()
+
+def match_domain_rule(host: str, rules: Dict[str, Any]) -> Optional[str]:
+    """
+    Find the rule key that applies to a host.
+    
+    Exact domains also match their subdomains; keys containing wildcards are
+    matched with fnmatch. The most specific (longest) matching key wins.
+    
+    Args:
+        host: The host name
+        rules: Mapping of domain or glob pattern to a rule
+        
+    Returns:
+        Optional[str]: The matching key, or None if no rule applies
+    """
+    best_match = None
+    for pattern in rules:
+        key = pattern.lower()
+        if any(c in key for c in "*?["):
+            matched = fnmatch.fnmatch(host, key)
+        else:
+            matched = host == key or host.endswith("." + key)
+        if matched and (best_match is None or len(key) > len(best_match)):
+            best_match = pattern
+    return best_match
@@ -0,0 +1,189 @@
+"""
+Lock utilities for the Web Scraping Toolkit.
+
+This module provides a reader/writer lock, which lets any number of readers
+hold it at once while writers get exclusive access, and a striped set of
+such locks selected by key hash, so operations on different keys don't
+contend at all. `FileLock` extends mutual exclusion to other processes
+sharing a cache directory.
+"""
+
+import os
+import threading
+import zlib
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows; FileLock then only excludes threads of this process
+    fcntl = None
+
+class ReadWriteLock:
+    """
+    Reader/writer lock that prefers writers.
+
+    New readers wait while a writer is waiting, so a steady stream of reads
+    cannot starve writes. The thread holding the write lock may acquire it
+    again, and may also take the read lock; readers must not nest.
+    """
+
+    def __init__(self):
+        """Initialize an unlocked lock."""
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = None
+        self._writer_depth = 0
+        self._waiting_writers = 0
+
+    def acquire_read(self) -> None:
+        """Acquire the lock for reading."""
+        with self._cond:
+            if self._writer == threading.get_ident():
+                self._writer_depth += 1
+                return
+            while self._writer is not None or self._waiting_writers:
+                self._cond.wait()
+            self._readers += 1
+
+    def release_read(self) -> None:
+        """Release a read acquisition."""
+        with self._cond:
+            if self._writer == threading.get_ident():
+                self._writer_depth -= 1
+                return
+            self._readers -= 1
+            if not self._readers:
+                self._cond.notify_all()
+
+    def acquire_write(self) -> None:
+        """Acquire the lock for writing."""
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._writer_depth += 1
+                return
+            self._waiting_writers += 1
+            while self._writer is not None or self._readers:
+                self._cond.wait()
+            self._waiting_writers -= 1
+            self._writer = me
+            self._writer_depth = 1
+
+    def release_write(self) -> None:
+        """Release a write acquisition."""
+        with self._cond:
+            self._writer_depth -= 1
+            if not self._writer_depth:
+                self._writer = None
+                self._cond.notify_all()
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """Hold the lock for reading within a `with` block."""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """Hold the lock for writing within a `with` block."""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+class StripedLock:
+    """
+    Fixed set of reader/writer locks, one chosen per key by hash.
+    """
+
+    def __init__(self, stripes: int = 64):
+        """
+        Initialize the stripes.
+
+        Args:
+            stripes: Number of locks; keys sharing a stripe contend with each other
+        """
+        self._stripes: List[ReadWriteLock] = [ReadWriteLock() for _ in range(max(1, stripes))]
+
+    def __len__(self) -> int:
+        return len(self._stripes)
+
+    def for_key(self, key: str) -> ReadWriteLock:
+        """Get the lock guarding a key."""
+        return self._stripes[zlib.crc32(key.encode('utf-8')) % len(self._stripes)]
+
+    @contextmanager
+    def write_all(self) -> Iterator[None]:
+        """Hold every stripe for writing (in a fixed order) within a `with` block."""
+        acquired = []
+        try:
+            for stripe in self._stripes:
+                stripe.acquire_write()
+                acquired.append(stripe)
+            yield
+        finally:
+            for stripe in reversed(acquired):
+                stripe.release_write()
+
+class FileLock:
+    """
+    Exclusive advisory lock on a file, held by at most one process at a time.
+
+    Uses flock(2), so the lock is released by the OS if the holder dies. It
+    also excludes other threads of the same process, and the holding thread
+    may acquire it again.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the lock; the lock file is created on first use.
+
+        Args:
+            path: Path of the lock file
+        """
+        self.path = path
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._fd: Optional[int] = None
+
+    def acquire(self) -> None:
+        """Acquire the lock, waiting for other processes and threads to release it."""
+        self._thread_lock.acquire()
+        try:
+            if not self._depth and fcntl is not None:
+                if self._fd is None:
+                    self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+        except BaseException:
+            self._thread_lock.release()
+            raise
+        self._depth += 1
+
+    def release(self) -> None:
+        """Release one acquisition."""
+        self._depth -= 1
+        if not self._depth and self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        self._thread_lock.release()
+
+    @contextmanager
+    def hold(self) -> Iterator[None]:
+        """Hold the lock within a `with` block."""
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        """Close the lock file."""
+        with self._thread_lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
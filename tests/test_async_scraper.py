@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+测试 AsyncWebScraper 的异步抓取功能
+
+使用本地 HTTP 服务器验证并发抓取、缓存命中和并发上限
+"""
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from web_scraping_toolkit import AsyncWebScraper, CacheMechanism, RateLimiter
+
+PAGE = ("<html><body>" + "<p>paragraph</p>" * 100 + "</body></html>").encode("utf-8")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """返回固定页面并记录并发请求数"""
+
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with _Handler.lock:
+            _Handler.active += 1
+            _Handler.peak = max(_Handler.peak, _Handler.active)
+        time.sleep(0.05)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+        with _Handler.lock:
+            _Handler.active -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+def _start_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_aget_concurrency_limit():
+    """并发请求数不应超过 max_concurrency"""
+    server = _start_server()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    _Handler.peak = 0
+
+    async def run():
+        async with AsyncWebScraper(rate_limiter=RateLimiter(enabled=False), max_concurrency=4) as scraper:
+            urls = [f"{base}/page/{i}" for i in range(12)]
+            return await asyncio.gather(*(scraper.aget(url, use_cache=False) for url in urls))
+
+    try:
+        responses = asyncio.run(run())
+    finally:
+        server.shutdown()
+
+    assert all(r.status_code == 200 for r in responses)
+    assert all("paragraph" in r.text for r in responses)
+    assert 1 < _Handler.peak <= 4
+
+
+def test_aget_uses_cache(tmp_path):
+    """第二次请求应直接命中缓存"""
+    server = _start_server()
+    url = f"http://127.0.0.1:{server.server_address[1]}/cached"
+    cache = CacheMechanism("async_test", cache_dir=str(tmp_path), enabled=True)
+
+    async def run():
+        async with AsyncWebScraper(cache_mechanism=cache, rate_limiter=RateLimiter(enabled=False)) as scraper:
+            first = await scraper.aget(url)
+            server.shutdown()
+            second = await scraper.aget(url)
+            return first, second
+
+    first, second = asyncio.run(run())
+    assert cache.is_cached(url)
+    assert first.text == second.text
+
+
+def test_session_follows_event_loop():
+    """换用新的事件循环时关闭旧的会话，aclose() 关闭当前会话"""
+    server = _start_server()
+    url = f"http://127.0.0.1:{server.server_address[1]}/loop"
+    scraper = AsyncWebScraper(rate_limiter=RateLimiter(enabled=False))
+
+    async def fetch_and_close():
+        response = await scraper.aget(url, use_cache=False)
+        session = scraper._client_session
+        await scraper.aclose()
+        return response, session
+
+    try:
+        assert asyncio.run(scraper.aget(url, use_cache=False)).status_code == 200
+        first_session = scraper._client_session
+        response, second_session = asyncio.run(fetch_and_close())
+        assert response.status_code == 200
+    finally:
+        server.shutdown()
+
+    assert first_session.closed
+    assert second_session is not first_session
+    assert second_session.closed
+    assert scraper._client_session is None
+
+
+def test_sync_close_only_warns_about_open_session(monkeypatch):
+    """同步 close() 不在新的事件循环中关闭会话，只发出警告"""
+    from web_scraping_toolkit import async_scraper
+
+    server = _start_server()
+    url = f"http://127.0.0.1:{server.server_address[1]}/sync-close"
+    scraper = AsyncWebScraper(rate_limiter=RateLimiter(enabled=False))
+    warnings = []
+    monkeypatch.setattr(async_scraper.logger, "warning", warnings.append)
+
+    async def run():
+        await scraper.aget(url, use_cache=False)
+        scraper.close()
+        session = scraper._client_session
+        await scraper.aclose()
+        return session
+
+    try:
+        session = asyncio.run(run())
+    finally:
+        server.shutdown()
+
+    assert any("aclose" in message for message in warnings)
+    assert session.closed
+
+
+def test_cache_work_runs_off_event_loop(tmp_path):
+    """缓存查询、页面检测和缓存写入都不在事件循环线程中执行"""
+    server = _start_server()
+    url = f"http://127.0.0.1:{server.server_address[1]}/offload"
+    cache = CacheMechanism("async_offload", cache_dir=str(tmp_path), enabled=True)
+    scraper = AsyncWebScraper(cache_mechanism=cache, rate_limiter=RateLimiter(enabled=False))
+    threads = {}
+
+    def recorded(name):
+        method = getattr(scraper, name)
+
+        def wrapper(*args, **kwargs):
+            threads[name] = threading.get_ident()
+            return method(*args, **kwargs)
+        return wrapper
+
+    for name in ("_lookup_cache_keys", "_classify_outcome", "_cache_response"):
+        setattr(scraper, name, recorded(name))
+
+    async def run():
+        async with scraper:
+            await scraper.aget(url)
+            return threading.get_ident()
+
+    try:
+        loop_thread = asyncio.run(run())
+    finally:
+        server.shutdown()
+
+    assert set(threads) == {"_lookup_cache_keys", "_classify_outcome", "_cache_response"}
+    assert loop_thread not in threads.values()
+
+
+def test_forwards_resource_policy():
+    """资源拦截策略传给 AsyncWebScraper 后同样生效"""
+    from web_scraping_toolkit.browser.resource_policy import ResourceBlockPolicy
+
+    policy = ResourceBlockPolicy(blocked_domains=["ads.example.com"])
+    with AsyncWebScraper(resource_policy=policy) as scraper:
+        assert scraper.resource_policy is policy
+
+
+def test_forwards_captcha_classifier():
+    """验证码分类器传给 AsyncWebScraper 后同样生效"""
+    from web_scraping_toolkit.detection.captcha_classifier import CaptchaClassifier
+
+    classifier = CaptchaClassifier(threshold=0.9)
+    with AsyncWebScraper(captcha_classifier=classifier) as scraper:
+        assert scraper.captcha_classifier is classifier
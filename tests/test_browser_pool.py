@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+测试 BrowserPool 的浏览器复用与回收
+
+使用伪造的 Playwright 模块，验证浏览器在多次渲染间复用、
+达到页面上限后回收，以及关闭后不再分配页面
+"""
+
+import sys
+import types
+import threading
+
+import pytest
+
+from web_scraping_toolkit.browser.browser_pool import BrowserPool
+
+
+class _FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+        self.closed = False
+
+    def set_extra_http_headers(self, headers):
+        self.headers = headers
+
+    def new_page(self):
+        return object()
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.contexts = []
+
+    def is_connected(self):
+        return self.connected
+
+    def new_context(self, **options):
+        context = _FakeContext(self)
+        self.contexts.append(context)
+        return context
+
+    def close(self):
+        self.connected = False
+
+
+class _FakePlaywright:
+    def __init__(self, launches):
+        self.launches = launches
+        self.thread = threading.get_ident()
+        self.stopped = False
+        self.chromium = types.SimpleNamespace(launch=self._launch)
+
+    def _launch(self, **options):
+        assert threading.get_ident() == self.thread
+        browser = _FakeBrowser()
+        self.launches.append(browser)
+        return browser
+
+    def stop(self):
+        assert threading.get_ident() == self.thread
+        self.stopped = True
+
+
+@pytest.fixture
+def launches(monkeypatch):
+    """用伪造模块替换 playwright.sync_api，记录每次浏览器启动"""
+    launched = []
+    sync_api = types.ModuleType("playwright.sync_api")
+    sync_api.sync_playwright = lambda: types.SimpleNamespace(start=lambda: _FakePlaywright(launched))
+    monkeypatch.setitem(sys.modules, "playwright.sync_api", sync_api)
+    return launched
+
+
+def test_browser_is_reused_and_recycled(launches):
+    """同一线程复用浏览器，每个页面使用新的上下文，达到上限后重新启动"""
+    pool = BrowserPool(max_pages_per_browser=3, max_memory_mb=0)
+
+    contexts = []
+    for _ in range(5):
+        with pool.new_page(extra_headers={"X-Test": "1"}) as (context, page):
+            contexts.append(context)
+
+    assert len(launches) == 2
+    assert len(launches[0].contexts) == 3
+    assert all(context.closed for context in contexts)
+    assert not launches[0].is_connected()
+    pool.close()
+
+
+def test_closed_pool_refuses_pages(launches):
+    """关闭后释放浏览器且不再分配页面"""
+    pool = BrowserPool(max_pages_per_browser=10, max_memory_mb=0)
+    with pool.new_page():
+        pass
+
+    pool.close()
+    assert not launches[0].is_connected()
+    with pytest.raises(RuntimeError):
+        with pool.new_page():
+            pass
+
+
+def test_renders_from_many_threads_share_bounded_browsers(launches):
+    """多个线程通过 render() 渲染时只启动渲染线程数个浏览器，close() 后全部关闭"""
+    pool = BrowserPool(max_pages_per_browser=100, max_memory_mb=0, max_threads=2)
+    results = []
+
+    def worker():
+        results.append(pool.render(lambda context, page: threading.current_thread().name))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 8
+    assert all(name.startswith("browser_pool") for name in results)
+    assert 1 <= len(launches) <= 2
+
+    pool.close()
+    assert not any(browser.is_connected() for browser in launches)
+    with pytest.raises(RuntimeError):
+        pool.render(lambda context, page: None)
+
+
+def test_warns_once_without_psutil(monkeypatch):
+    """设置了内存上限但没有安装 psutil 时只警告一次"""
+    from web_scraping_toolkit.browser import browser_pool
+
+    warnings = []
+    monkeypatch.setattr(browser_pool, "psutil", None)
+    monkeypatch.setattr(browser_pool, "_psutil_warned", False)
+    monkeypatch.setattr(browser_pool.logger, "warning", warnings.append)
+
+    BrowserPool(max_memory_mb=512)
+    BrowserPool(max_memory_mb=512)
+    BrowserPool(max_memory_mb=0)
+    assert len(warnings) == 1 and "psutil" in warnings[0]
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+缓存存储后端的一致性测试
+
+对 memory、json、filesystem、sqlite 四种后端运行同一组测试，
+验证条目读写、按时间查询、处理状态、删除和持久化行为一致
+"""
+
+import pytest
+
+from web_scraping_toolkit import CacheMechanism
+from web_scraping_toolkit.cache.backends.factory import BACKENDS, create_backend
+
+PERSISTENT = ["json", "filesystem", "sqlite"]
+
+
+def _entry(item_id, timestamp, ttl=None, data="body"):
+    entry = {"id": item_id, "data": data, "timestamp": timestamp, "date": "2024-01-01T00:00:00"}
+    if ttl is not None:
+        entry["ttl"] = ttl
+    return entry
+
+
+@pytest.fixture(params=sorted(BACKENDS))
+def backend(request, tmp_path):
+    backend = create_backend(request.param, str(tmp_path))
+    yield backend
+    backend.close()
+
+
+def test_put_get_replace(backend):
+    """写入后原样读出，重复写入替换旧条目，返回的是副本"""
+    assert backend.get("k1") is None
+    entry = _entry("https://example.com/", 100.0, ttl=60, data={"content": "页面", "headers": {"ETag": "x"}})
+    backend.put("k1", entry)
+    assert backend.get("k1") == entry
+    backend.put("k2", _entry("b", 100.0))
+    assert "ttl" not in backend.get("k2")
+
+    backend.put("k1", _entry("https://example.com/", 200.0, data="new"))
+    assert backend.get("k1")["data"] == "new"
+    assert "ttl" not in backend.get("k1")
+
+    backend.get("k1")["data"] = "mutated"
+    assert backend.get("k1")["data"] == "new"
+    assert backend.count() == 2
+
+
+def test_scan_and_age_queries(backend):
+    """scan 返回元数据，按有效期和存入时间查询"""
+    backend.put("old", _entry("a", 100.0))
+    backend.put("short", _entry("b", 900.0, ttl=50))
+    backend.put("new", _entry("c", 990.0))
+
+    assert sorted(backend.scan()) == [("new", "c", 990.0, None), ("old", "a", 100.0, None), ("short", "b", 900.0, 50)]
+    assert sorted(backend.expired_keys(1000.0, 500)) == ["old", "short"]
+    assert backend.expired_keys(1000.0, 1000) == ["short"]
+    assert backend.keys_older_than(900.0) == ["old"]
+
+
+def test_status_and_delete(backend):
+    """处理状态独立读写，删除条目时一并删除状态"""
+    backend.put("k1", _entry("a", 1.0))
+    backend.put("k2", _entry("b", 1.0))
+    assert backend.get_status("k1") is None
+
+    backend.put_status("k1", {"id": "a", "processed_stages": {"parse": {"timestamp": 1.0}}})
+    status = backend.get_status("k1")
+    assert status == {"id": "a", "processed_stages": {"parse": {"timestamp": 1.0}}}
+    status["processed_stages"]["extra"] = {}
+    assert "extra" not in backend.get_status("k1")["processed_stages"]
+
+    assert backend.delete(["k1", "missing"]) == 1
+    assert backend.get("k1") is None and backend.get_status("k1") is None
+    assert backend.delete([]) == 0
+
+    backend.put_status("k2", {"id": "b", "processed_stages": {}})
+    assert backend.clear() == 1
+    assert backend.count() == 0 and backend.get_status("k2") is None
+
+
+@pytest.mark.parametrize("name", PERSISTENT)
+def test_persistence(tmp_path, name):
+    """持久化后端重新打开后数据仍在"""
+    backend = create_backend(name, str(tmp_path))
+    backend.put_many([("k1", _entry("a", 1.0, ttl=5)), ("k2", _entry("b", 2.0))])
+    backend.put_status("k1", {"id": "a", "processed_stages": {"parse": {}}})
+    backend.close()
+
+    backend = create_backend(name, str(tmp_path))
+    assert backend.count() == 2
+    assert backend.get("k1") == _entry("a", 1.0, ttl=5)
+    assert backend.get_status("k1") == {"id": "a", "processed_stages": {"parse": {}}}
+    backend.close()
+
+
+@pytest.mark.parametrize("name", sorted(BACKENDS))
+def test_cache_mechanism_with_backend(tmp_path, name):
+    """CacheMechanism 在每种后端上的行为一致"""
+    cache = CacheMechanism("conformance", cache_dir=str(tmp_path), expiration_seconds=3600, enabled=True, backend=name)
+    assert cache.backend == name
+    cache.cache_data("https://example.com/a", {"content": "a"})
+    cache.cache_data("https://example.com/b", {"content": "b"})
+    cache.mark_as_processed("https://example.com/a", "parse")
+
+    assert cache.get_cached_data("https://example.com/a/") == {"content": "a"}
+    assert cache.get_unprocessed_items("parse") == ["https://example.com/b"]
+    assert cache.get_processing_stages("https://example.com/a") == ["parse"]
+    assert cache.clear_cache() == 2
+    cache.close()
+
+
+def test_unknown_backend(tmp_path):
+    """未知的后端名称报错"""
+    with pytest.raises(ValueError):
+        create_backend("redis", str(tmp_path))
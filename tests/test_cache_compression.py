@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+测试缓存数据压缩
+
+验证压缩对调用方透明、小数据不压缩、按域名训练的 zstd 字典，
+以及原始字节数和压缩后字节数的统计
+"""
+
+import base64
+import json
+import os
+import random
+import sqlite3
+import time
+import zlib
+
+import pytest
+
+from web_scraping_toolkit import CacheMechanism
+from web_scraping_toolkit.cache.backends.compressed_backend import PayloadCodec, MARKER
+
+_rng = random.Random(0)
+BOILERPLATE = "".join(
+    f'<a class="{_rng.getrandbits(48):x}" href="/{_rng.getrandbits(64):x}">{_rng.getrandbits(40):x}</a>\n'
+    for _ in range(300)
+)
+
+
+def _page(i):
+    words = " ".join(random.Random(i).choice(["alpha", "beta", "gamma", "delta", "omega"]) for _ in range(200))
+    return f"<html><head><title>Page {i}</title></head><body>{BOILERPLATE}<p>{words}</p></body></html>"
+
+
+def _persistent(cache):
+    store = cache.store
+    while hasattr(store, "backend"):
+        store = store.backend
+    return store
+
+
+def _open(tmp_path, **kwargs):
+    return CacheMechanism("compressed", cache_dir=str(tmp_path), expiration_seconds=3600, enabled=True, **kwargs)
+
+
+@pytest.mark.parametrize("backend", ["filesystem", "sqlite", "json"])
+def test_compression_is_transparent(tmp_path, backend):
+    """压缩后读取得到原始数据，存储的是压缩记录，小数据保持原样"""
+    cache = _open(tmp_path, backend=backend, compression="zlib", write_behind=True)
+    page = {"content": _page(1), "status_code": 200}
+    cache.cache_data("https://example.com/1", page)
+    cache.cache_data("https://example.com/small", {"content": "tiny"})
+    cache.flush()
+
+    key = cache._get_cache_key("https://example.com/1")
+    stored = _persistent(cache).get(key)["data"]
+    assert stored[MARKER] == "zlib"
+    assert len(stored["payload"]) < len(json.dumps(page)) / 1.5
+    small = _persistent(cache).get(cache._get_cache_key("https://example.com/small"))
+    assert small["data"] == {"content": "tiny"}
+    cache.close()
+
+    # Readable after reopening, also with compression turned off
+    reopened = _open(tmp_path, backend=backend, compression="none")
+    assert reopened.get_cached_data("https://example.com/1") == page
+    assert reopened.get_cached_data("https://example.com/small") == {"content": "tiny"}
+    reopened.close()
+
+
+@pytest.mark.parametrize("backend", ["filesystem", "sqlite"])
+def test_payload_stored_as_raw_bytes(tmp_path, backend):
+    """压缩数据以原始字节保存：SQLite 存入 BLOB 列，文件系统后端存入单独的二进制文件"""
+    cache = _open(tmp_path, backend=backend, compression="zlib")
+    page = {"content": _page(1)}
+    cache.cache_data("https://example.com/1", page)
+    key = cache._get_cache_key("https://example.com/1")
+    cache.close()
+
+    if backend == "sqlite":
+        conn = sqlite3.connect(os.path.join(str(tmp_path), "compressed", "cache.db"))
+        data, body = conn.execute("SELECT data, body FROM items WHERE key = ?", (key,)).fetchone()
+        conn.close()
+    else:
+        entry_path = os.path.join(str(tmp_path), "compressed", "entries", key[:2], f"{key}.json")
+        with open(entry_path, encoding="utf-8") as f:
+            data = json.dumps(json.load(f)["data"])
+        with open(entry_path[:-len(".json")] + ".bin", "rb") as f:
+            body = f.read()
+    assert isinstance(body, bytes)
+    assert "payload" not in json.loads(data)
+    assert json.loads(zlib.decompress(body)) == page
+
+
+@pytest.mark.parametrize("backend", ["filesystem", "sqlite"])
+def test_reads_base64_payloads_written_earlier(tmp_path, backend):
+    """仍能读取以 base64 文本保存的旧压缩记录"""
+    cache = _open(tmp_path, backend=backend, compression="zlib")
+    page = {"content": _page(2)}
+    raw = json.dumps(page).encode("utf-8")
+    key = cache._get_cache_key("https://example.com/old")
+    _persistent(cache).put(key, {
+        "id": "https://example.com/old", "timestamp": time.time(),
+        "date": "", "data": {MARKER: "zlib", "dict_id": 0, "size": len(raw),
+                             "payload": base64.b64encode(zlib.compress(raw)).decode("ascii")}
+    })
+    assert cache.get_cached_data("https://example.com/old") == page
+    cache.close()
+
+
+def test_stats_per_domain(tmp_path):
+    """get_stats 按域名统计原始字节数和压缩后字节数"""
+    cache = _open(tmp_path, backend="filesystem", compression="zlib")
+    for i in range(5):
+        cache.cache_data(f"https://example.com/{i}", {"content": _page(i)})
+    cache.cache_data("https://other.org/a", {"content": "short"})
+
+    stats = cache.get_stats()["compression"]
+    assert stats["codec"] == "zlib"
+    assert stats["entries"] == 6
+    assert stats["stored_bytes"] < stats["raw_bytes"] / 1.5
+    assert stats["domains"]["example.com"]["entries"] == 5
+    assert stats["domains"]["other.org"]["ratio"] == 1.0
+    assert _open(tmp_path, backend="filesystem").get_stats()["compression"] is None
+    cache.close()
+
+
+def test_zstd_dictionary_per_domain(tmp_path, monkeypatch):
+    """每个域名用前几个页面训练字典，之后的页面压缩得更小，字典保存在缓存目录中"""
+    pytest.importorskip("zstandard")
+    monkeypatch.setenv("CACHE_COMPRESSION_DICT_SAMPLES", "16")
+    cache = _open(tmp_path, backend="filesystem", compression="zstd")
+    for i in range(16):
+        cache.cache_data(f"https://example.com/{i}", {"content": _page(i)})
+
+    stats = cache.get_stats()["compression"]
+    assert stats["dictionaries"] == 1
+    dictionaries = os.listdir(os.path.join(str(tmp_path), "compressed", "dictionaries"))
+    assert len(dictionaries) == 1 and dictionaries[0].startswith("example.com.")
+
+    page = {"content": _page(100)}
+    cache.cache_data("https://example.com/100", page)
+    with_dictionary = cache.get_stats()["compression"]["stored_bytes"] - stats["stored_bytes"]
+    without_dictionary = len(PayloadCodec("zstd").encode("https://example.com/100", page)["payload"])
+    assert with_dictionary < without_dictionary / 2
+    cache.close()
+
+    # Another process (or a later run) finds the dictionary on disk
+    monkeypatch.delenv("CACHE_COMPRESSION_DICT_SAMPLES")
+    reopened = _open(tmp_path, backend="filesystem", compression="zstd")
+    assert reopened.get_cached_data("https://example.com/100") == page
+    assert reopened.get_cached_data("https://example.com/3") == {"content": _page(3)}
+    reopened.close()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+测试缓存的过期索引
+
+验证最小堆按到期时间弹出条目、被覆盖的记录被跳过，
+以及查询不再遍历整个缓存、批量清理按间隔进行
+"""
+
+import time
+
+from web_scraping_toolkit import CacheMechanism
+from web_scraping_toolkit.cache.backends.memory_backend import MemoryCacheBackend
+from web_scraping_toolkit.cache.expiry_index import ExpiryIndex
+
+
+class _CountingBackend(MemoryCacheBackend):
+    """记录 scan 调用次数的内存后端"""
+
+    def __init__(self):
+        super().__init__()
+        self.scans = 0
+
+    def scan(self):
+        self.scans += 1
+        return super().scan()
+
+
+def test_expiry_index_pops_due_keys():
+    """按到期时间弹出，重新设置或删除的键不会提前弹出"""
+    index = ExpiryIndex()
+    index.set("a", 10.0)
+    index.set("b", 20.0)
+    index.set("c", 5.0)
+    index.set("a", 30.0)
+    index.discard("b")
+
+    assert index.pop_due(4.0) == []
+    assert index.pop_due(25.0) == ["c"]
+    assert len(index) == 1
+    assert index.pop_due(100.0) == ["a"]
+    assert len(index) == 0
+
+
+def test_lookups_do_not_scan(tmp_path):
+    """命中查询只读取单个条目，不遍历整个缓存"""
+    backend = _CountingBackend()
+    cache = CacheMechanism("expiry", cache_dir=str(tmp_path), expiration_seconds=3600, enabled=True,
+                           backend=backend, sweep_interval=0)
+    for i in range(100):
+        cache.cache_data(f"https://example.com/{i}", i)
+    scans = backend.scans
+
+    for i in range(100):
+        assert cache.get_cached_data(f"https://example.com/{i}") == i
+        assert cache.is_cached(f"https://example.com/{i}")
+    assert backend.scans == scans
+
+
+def test_sweep_removes_due_entries(tmp_path):
+    """批量清理删除超过保留期的条目，间隔内不重复清理"""
+    backend = MemoryCacheBackend()
+    cache = CacheMechanism("sweep", cache_dir=str(tmp_path), expiration_seconds=60, enabled=True,
+                           backend=backend, stale_retention_seconds=0, sweep_interval=3600)
+    cache.cache_data("https://example.com/short", "short", ttl=0.05)
+    cache.cache_data("https://example.com/long", "long")
+    time.sleep(0.1)
+
+    # Not swept yet; the lazy per-key check still hides the expired entry
+    cache.is_cached("https://example.com/long")
+    assert backend.count() == 2
+    assert cache.get_cached_data("https://example.com/short", include_stale=True) is None
+    assert backend.count() == 1
+
+    cache.cache_data("https://example.com/other", "other", ttl=0.05)
+    time.sleep(0.1)
+    cache._remove_expired_items(force=True)
+    assert backend.count() == 1
+    assert cache.get_cached_data("https://example.com/long") == "long"
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+测试缓存的内存热层
+
+验证 LRU 热层按条目数和字节数淘汰、命中率与淘汰计数，
+以及淘汰后仍可从持久层读出
+"""
+
+from web_scraping_toolkit import CacheMechanism
+from web_scraping_toolkit.cache.backends.memory_backend import MemoryCacheBackend
+from web_scraping_toolkit.cache.backends.tiered_backend import LRUHotTier, TieredCacheBackend, estimate_size
+
+
+def _entry(data):
+    return {"id": "x", "data": data, "timestamp": 1.0, "date": "2024-01-01T00:00:00"}
+
+
+def test_lru_eviction_by_count_and_bytes():
+    """超过条目数或字节数上限时淘汰最久未使用的条目"""
+    tier = LRUHotTier(max_entries=2, max_bytes=0)
+    tier.put("a", _entry("a"))
+    tier.put("b", _entry("b"))
+    assert tier.get("a") is not None
+    tier.put("c", _entry("c"))
+    assert tier.get("b") is None
+    assert tier.get("a") is not None and tier.get("c") is not None
+
+    big = _entry("x" * 1000)
+    tier = LRUHotTier(max_entries=0, max_bytes=estimate_size(big) * 2 + 10)
+    for key in ("a", "b", "c"):
+        tier.put(key, big)
+    assert tier.stats()["entries"] == 2
+    assert tier.stats()["evictions"] == 1
+    assert tier.stats()["bytes"] <= tier.max_bytes
+
+    tier.put("huge", _entry("x" * 10000))
+    assert tier.get("huge") is None
+    assert tier.stats()["entries"] == 2
+
+
+def test_tiered_backend_reads_through():
+    """淘汰的条目从持久层读出并重新放入热层，删除时两层一起删除"""
+    persistent = MemoryCacheBackend()
+    backend = TieredCacheBackend(persistent, max_entries=1, max_bytes=0)
+    backend.put("a", _entry("a"))
+    backend.put("b", _entry("b"))
+
+    assert backend.get("a")["data"] == "a"
+    assert backend.get("a")["data"] == "a"
+    assert backend.hot.stats() == {"entries": 1, "bytes": estimate_size(_entry("a")), "hits": 1,
+                                   "misses": 1, "hit_rate": 0.5, "evictions": 2}
+
+    backend.delete(["a"])
+    assert backend.get("a") is None
+    assert persistent.get("a") is None
+
+
+def test_cache_mechanism_stats(tmp_path):
+    """CacheMechanism 为磁盘后端启用热层并报告统计"""
+    cache = CacheMechanism("hot", cache_dir=str(tmp_path), expiration_seconds=3600, enabled=True,
+                           backend="filesystem", hot_max_entries=2)
+    for i in range(3):
+        cache.cache_data(f"https://example.com/{i}", {"content": i})
+    for i in range(3):
+        assert cache.get_cached_data(f"https://example.com/{i}") == {"content": i}
+
+    stats = cache.get_stats()
+    assert stats["backend"] == "filesystem"
+    assert stats["entries"] == 3
+    assert stats["hot"]["entries"] == 2
+    assert stats["hot"]["evictions"] >= 1
+    cache.close()
+
+    plain = CacheMechanism("plain", cache_dir=str(tmp_path), enabled=True, backend="filesystem", hot_max_entries=0)
+    assert plain.get_stats()["hot"] is None
+    plain.close()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+测试缓存键的构建
+
+验证 URL 规范化（查询参数排序、去除跟踪参数、合并 params）、请求头和抓取模式后缀，
+以及分页 URL 不再共用同一个缓存条目
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from web_scraping_toolkit import CacheMechanism, RateLimiter, WebScraper
+from web_scraping_toolkit.cache.cache_key import CacheKeyBuilder
+from web_scraping_toolkit.strategy.fetch_mode_memory import FetchModeMemory
+
+
+def _builder(**options):
+    options.setdefault("vary_headers", [])
+    options.setdefault("include_mode", True)
+    return CacheKeyBuilder(**options)
+
+
+def test_canonical_url():
+    """查询参数排序并去除跟踪参数，主机名小写，默认端口、片段和末尾斜杠被去掉"""
+    builder = _builder()
+    canonical = builder.canonical_url("HTTPS://Example.COM:443/list/?b=2&utm_source=mail&a=1&fbclid=x#top")
+    assert canonical == "https://example.com/list?a=1&b=2"
+    assert builder.canonical_url(canonical) == canonical
+    assert builder.canonical_url("http://example.com:8080/a") == "http://example.com:8080/a"
+
+    assert builder.canonical_url("https://example.com/list", {"page": 2, "tag": ["x", "y"]}) == \
+        "https://example.com/list?page=2&tag=x&tag=y"
+    assert builder.canonical_url("https://example.com/list?page=2") != \
+        builder.canonical_url("https://example.com/list?page=3")
+
+    custom = _builder(drop_params=["session*"])
+    assert custom.canonical_url("https://example.com/?sessionid=1&utm_source=x") == \
+        "https://example.com?utm_source=x"
+
+
+def test_build_suffixes():
+    """渲染结果、指定的请求头和非 GET 方法会加入缓存键"""
+    builder = _builder(vary_headers=["Accept-Language"])
+    url = "https://example.com/a?x=1"
+    assert builder.build(url, mode="http") == "https://example.com/a?x=1"
+    assert builder.build(url, mode="browser") == "https://example.com/a?x=1 |mode=browser"
+    assert builder.build(url, headers={"accept-language": "fr-CA,  fr"}, mode="http") == \
+        "https://example.com/a?x=1 |accept-language=fr-CA, fr"
+    assert builder.build(url, headers={"User-Agent": "x"}) == "https://example.com/a?x=1"
+    assert builder.build(url, method="post") == "POST https://example.com/a?x=1"
+    assert _builder(include_mode=False).build(url, mode="browser") == "https://example.com/a?x=1"
+
+
+def test_cache_mechanism_keeps_query(tmp_path):
+    """分页 URL 使用不同的缓存条目，只有跟踪参数不同的 URL 共用一个条目"""
+    cache = CacheMechanism("keys", cache_dir=str(tmp_path), enabled=True, key_builder=_builder())
+    cache.cache_data("https://example.com/list?page=2", "page 2")
+    cache.cache_data("https://example.com/list?page=3", "page 3")
+
+    assert cache.get_cached_data("https://example.com/list?page=2") == "page 2"
+    assert cache.get_cached_data("https://example.com/list/?utm_campaign=x&page=3") == "page 3"
+    assert cache.get_cached_data("https://example.com/list") is None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """在页面中回显请求路径"""
+
+    hits = 0
+
+    def do_GET(self):
+        _Handler.hits += 1
+        body = (f"<html><body><h1>{self.path}</h1>" + "<p>paragraph text</p>" * 80 + "</body></html>").encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_scraper_caches_params_separately(tmp_path):
+    """WebScraper 按 params 区分缓存条目，强制浏览器时不使用 HTTP 响应的缓存"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/list"
+    _Handler.hits = 0
+
+    rendered = []
+
+    def fake_browser(url, headers=None, retry_count=1):
+        rendered.append(url)
+        raise RuntimeError("browser not expected to succeed here")
+
+    scraper = WebScraper(
+        cache_mechanism=CacheMechanism("scraper_keys", cache_dir=str(tmp_path), enabled=True, key_builder=_builder()),
+        rate_limiter=RateLimiter(enabled=False),
+        fetch_modes=FetchModeMemory(path=str(tmp_path / "fetch_modes.json"), enabled=True)
+    )
+    scraper._get_with_browser = fake_browser
+    try:
+        page2 = scraper.get(url, params={"page": 2})
+        page3 = scraper.get(url, params={"page": 3})
+        again = scraper.get(url + "?utm_source=feed", params={"page": 2})
+        try:
+            scraper.get(url, params={"page": 2}, force_browser=True)
+        except RuntimeError:
+            pass
+    finally:
+        scraper.close()
+        server.shutdown()
+
+    assert "/list?page=2" in page2.text
+    assert "/list?page=3" in page3.text
+    assert again.text == page2.text
+    assert again.fetch_info["mode"] == "cache"
+    assert _Handler.hits == 2
+    assert rendered == [url + "?page=2"]
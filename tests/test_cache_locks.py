@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+测试缓存的读写锁分段
+
+验证读写锁允许并发读、写操作互斥、等待中的写优先，
+以及按键分段的锁。吞吐量的测量见 benchmarks/cache_lock_benchmark.py
+"""
+
+import threading
+import time
+
+from web_scraping_toolkit.utils.locks import ReadWriteLock, StripedLock
+
+
+def test_readers_share_writers_exclude():
+    """多个读者可同时持有锁，写者独占，等待中的写者优先于新读者"""
+    lock = ReadWriteLock()
+    events = []
+
+    lock.acquire_read()
+    lock.acquire_read()  # a second reader (from this thread) does not block
+
+    def writer():
+        with lock.write():
+            events.append("write")
+
+    def late_reader():
+        with lock.read():
+            events.append("read")
+
+    writer_thread = threading.Thread(target=writer)
+    writer_thread.start()
+    time.sleep(0.05)
+    reader_thread = threading.Thread(target=late_reader)
+    reader_thread.start()
+    time.sleep(0.05)
+    assert events == []
+
+    lock.release_read()
+    lock.release_read()
+    writer_thread.join(1)
+    reader_thread.join(1)
+    assert events == ["write", "read"]
+
+    # The writer may re-enter and read
+    with lock.write():
+        with lock.write():
+            with lock.read():
+                pass
+
+
+def test_striped_lock_spreads_keys():
+    """同一个键总是映射到同一把锁，不同的键分散到各段"""
+    locks = StripedLock(16)
+    assert locks.for_key("abc") is locks.for_key("abc")
+    assert len({id(locks.for_key(f"key{i}")) for i in range(200)}) == 16
+    with locks.write_all():
+        pass
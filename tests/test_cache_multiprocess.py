@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+测试多进程共享缓存目录
+
+验证多个工作进程同时写入同一个缓存目录不会互相覆盖，
+并且每个进程能看到其他进程写入、改写和删除的条目
+"""
+
+import multiprocessing
+
+import pytest
+
+from web_scraping_toolkit import CacheMechanism
+from web_scraping_toolkit.cache.backends.factory import create_backend
+from web_scraping_toolkit.cache.backends.tiered_backend import TieredCacheBackend
+
+SHARED_BACKENDS = ["json", "filesystem", "sqlite"]
+
+
+def _open(cache_dir, backend, **kwargs):
+    return CacheMechanism("shared", cache_dir=cache_dir, expiration_seconds=3600, enabled=True,
+                          backend=backend, sweep_interval=3600, shared_poll_interval=0, **kwargs)
+
+
+def _worker(cache_dir, backend, worker, count):
+    cache = _open(cache_dir, backend)
+    for i in range(count):
+        url = f"https://example.com/{worker}/{i}"
+        cache.cache_data(url, {"worker": worker, "page": i})
+        cache.mark_as_processed(url, "parse")
+    cache.close()
+
+
+def _run(target, *args):
+    process = multiprocessing.get_context("fork").Process(target=target, args=args)
+    process.start()
+    process.join(60)
+    assert process.exitcode == 0
+
+
+def _rewrite(cache_dir, backend, url):
+    cache = _open(cache_dir, backend)
+    cache.cache_data(url, {"version": 2})
+    cache.cache_data("https://example.com/from-child", {"child": True})
+    cache.close()
+
+
+def _clear(cache_dir, backend):
+    cache = _open(cache_dir, backend)
+    cache.clear_cache()
+    cache.close()
+
+
+@pytest.mark.parametrize("backend", SHARED_BACKENDS)
+def test_concurrent_workers_keep_all_entries(tmp_path, backend):
+    """4 个进程同时写入同一个缓存目录，所有条目和处理状态都保留下来"""
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=_worker, args=(str(tmp_path), backend, w, 40)) for w in range(4)]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join(60)
+        assert process.exitcode == 0
+
+    cache = _open(str(tmp_path), backend)
+    assert cache.get_stats()["entries"] == 160
+    for worker in range(4):
+        for i in range(40):
+            url = f"https://example.com/{worker}/{i}"
+            assert cache.get_cached_data(url) == {"worker": worker, "page": i}
+            assert cache.is_processed_by_stage(url, "parse")
+    cache.close()
+
+
+@pytest.mark.parametrize("backend", SHARED_BACKENDS)
+def test_sees_writes_and_clears_of_other_processes(tmp_path, backend):
+    """一个进程能看到另一个进程新写入、改写和清空的条目，热缓存不会返回旧数据"""
+    cache = _open(str(tmp_path), backend)
+    url = "https://example.com/page"
+    cache.cache_data(url, {"version": 1})
+    assert cache.get_cached_data(url) == {"version": 1}
+
+    _run(_rewrite, str(tmp_path), backend, url)
+    assert cache.get_cached_data(url) == {"version": 2}
+    assert cache.get_cached_data("https://example.com/from-child") == {"child": True}
+    # Entries from other processes join this process's expiry index
+    assert cache._get_cache_key("https://example.com/from-child") in cache._expiry
+
+    _run(_clear, str(tmp_path), backend)
+    assert cache.get_cached_data(url) is None
+    assert cache.get_stats()["entries"] == 0
+    cache.close()
+
+
+@pytest.mark.parametrize("backend", SHARED_BACKENDS)
+def test_poll_changes_reports_other_writers(tmp_path, backend):
+    """poll_changes 报告另一个后端实例写入和删除的键"""
+    first = create_backend(backend, str(tmp_path))
+    second = create_backend(backend, str(tmp_path))
+    first.poll_changes()
+    second.poll_changes()
+
+    entry = {"id": "a", "data": "a", "timestamp": 100.0, "date": "2024-01-01T00:00:00"}
+    second.put("k1", entry)
+    second.put("k2", dict(entry, id="b"))
+    second.delete(["k2"])
+    written, deleted = first.poll_changes()
+    assert [meta[:3] for meta in written] == [("k1", "a", 100.0)]
+    assert deleted in (["k2"], [])
+    assert first.get("k1")["data"] == "a"
+    assert first.poll_changes() == ([], [])
+
+    second.delete(["k1"])
+    assert first.poll_changes() == ([], ["k1"])
+    first.close()
+    second.close()
+
+
+@pytest.mark.parametrize("backend", SHARED_BACKENDS)
+def test_poll_changes_skips_own_writes(tmp_path, backend):
+    """poll_changes 不报告本实例自己写入和删除的键"""
+    store = create_backend(backend, str(tmp_path))
+    store.poll_changes()
+
+    entry = {"id": "a", "data": "a", "timestamp": 100.0, "date": "2024-01-01T00:00:00"}
+    store.put("k1", entry)
+    store.put("k2", dict(entry, id="b"))
+    store.delete(["k2"])
+    assert store.poll_changes() == ([], [])
+    store.close()
+
+
+@pytest.mark.parametrize("backend", ["filesystem", "sqlite"])
+def test_hot_tier_keeps_own_writes(tmp_path, backend):
+    """轮询其他进程的改动时，本进程刚写入的条目仍留在热缓存中"""
+    cache = _open(str(tmp_path), backend, hot_max_entries=16)
+    url = "https://example.com/hot"
+    cache.cache_data(url, {"hot": True})
+    cache._poll_other_processes()
+    hot = cache._layer(TieredCacheBackend).hot
+    assert hot.get(cache._get_cache_key(url)) is not None
+    cache.close()
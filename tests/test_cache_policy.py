@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+测试按条目的缓存有效期
+
+验证从 Cache-Control/Expires 计算有效期、全局上下限和按域名规则，
+以及 CacheMechanism 按每个条目自己的有效期判断过期
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from requests.structures import CaseInsensitiveDict
+
+from web_scraping_toolkit import CacheMechanism, RateLimiter, WebScraper
+from web_scraping_toolkit.cache.cache_policy import CachePolicy, parse_cache_control
+from web_scraping_toolkit.strategy.fetch_mode_memory import FetchModeMemory
+
+URL = "https://www.example.com/page"
+
+
+def _policy(**options):
+    options.setdefault("respect_headers", True)
+    options.setdefault("min_ttl", 0)
+    options.setdefault("max_ttl", 0)
+    options.setdefault("rules", {})
+    return CachePolicy(**options)
+
+
+def _headers(**headers):
+    return CaseInsensitiveDict({name.replace("_", "-"): value for name, value in headers.items()})
+
+
+def test_ttl_from_headers():
+    """max-age 减去 Age，其次是 Expires 减去 Date，没有缓存头时使用默认有效期"""
+    policy = _policy()
+    assert parse_cache_control('public, max-age="300", no-transform') == {
+        "public": None, "max-age": "300", "no-transform": None
+    }
+    assert policy.ttl_for(URL, _headers(Cache_Control="public, max-age=300")) == 300
+    assert policy.ttl_for(URL, _headers(Cache_Control="max-age=300", Age="100")) == 200
+    assert policy.ttl_for(URL, _headers(
+        Expires="Wed, 21 Oct 2015 08:28:00 GMT", Date="Wed, 21 Oct 2015 07:28:00 GMT")) == 3600
+    assert policy.ttl_for(URL, _headers(Expires="0")) == 0
+    assert policy.ttl_for(URL, _headers(Cache_Control="no-cache, max-age=300")) == 0
+    assert policy.ttl_for(URL, _headers(Content_Type="text/html")) is None
+
+    assert not policy.is_storable(URL, _headers(Cache_Control="private, no-store"))
+    assert policy.is_storable(URL, _headers(Cache_Control="max-age=300"))
+    assert _policy(respect_headers=False).ttl_for(URL, _headers(Cache_Control="max-age=300")) is None
+
+
+def test_bounds_and_domain_rules():
+    """全局上下限约束头部给出的有效期，按域名规则可固定或约束有效期"""
+    policy = _policy(min_ttl=60, max_ttl=86400, rules={
+        "news.example.com": {"max_ttl": 300},
+        "*.pdf-archive.org": {"ttl": 604800},
+    })
+    assert policy.ttl_for(URL, _headers(Cache_Control="max-age=10")) == 60
+    assert policy.ttl_for(URL, _headers(Cache_Control="max-age=31536000")) == 86400
+    assert policy.ttl_for("https://news.example.com/", _headers(Cache_Control="max-age=3600")) == 300
+    assert policy.ttl_for("https://files.pdf-archive.org/a.pdf", _headers(Cache_Control="no-store")) == 604800
+    assert policy.is_storable("https://files.pdf-archive.org/a.pdf", _headers(Cache_Control="no-store"))
+
+
+def test_entries_expire_by_their_own_ttl(tmp_path):
+    """每个条目按自己的有效期过期，未指定时使用 expiration_seconds"""
+    cache = CacheMechanism("ttl", cache_dir=str(tmp_path), expiration_seconds=3600, enabled=True)
+    cache.cache_data("https://example.com/hot", {"content": "hot"}, ttl=60)
+    cache.cache_data("https://example.com/static", {"content": "static"}, ttl=86400)
+    cache.cache_data("https://example.com/default", {"content": "default"})
+
+    for key, _, _, _ in cache.store.scan():
+        item = cache.store.get(key)
+        item["timestamp"] -= 7200
+        cache.store.put(key, item)
+
+    assert not cache.is_cached("https://example.com/hot")
+    assert cache.is_cached("https://example.com/static")
+    assert not cache.is_cached("https://example.com/default")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """按路径返回不同 Cache-Control 的页面"""
+
+    hits = {}
+    body = b"<html><body>" + b"<p>Some ordinary paragraph text for the page.</p>" * 30 + b"</body></html>"
+
+    def do_GET(self):
+        _Handler.hits[self.path] = _Handler.hits.get(self.path, 0) + 1
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.send_header("Cache-Control", {"/fresh": "max-age=600", "/expired": "max-age=0"}.get(self.path, "no-store"))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_scraper_uses_response_ttl(tmp_path):
+    """WebScraper 按响应声明的有效期缓存，no-store 的响应不缓存"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    _Handler.hits = {}
+
+    cache = CacheMechanism("scraper_ttl", cache_dir=str(tmp_path), expiration_seconds=3600, enabled=True)
+    scraper = WebScraper(
+        cache_mechanism=cache,
+        cache_policy=_policy(),
+        rate_limiter=RateLimiter(enabled=False),
+        fetch_modes=FetchModeMemory(path=str(tmp_path / "fetch_modes.json"), enabled=True)
+    )
+    try:
+        for path in ("/fresh", "/expired", "/private"):
+            scraper.get(base + path)
+            scraper.get(base + path)
+    finally:
+        scraper.close()
+        server.shutdown()
+
+    assert _Handler.hits == {"/fresh": 1, "/expired": 2, "/private": 2}
+    assert cache.store.get(cache._get_cache_key(base + "/fresh"))["ttl"] == 600
+    assert not cache.is_cached(base + "/private", include_stale=True)
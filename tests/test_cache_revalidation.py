@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+测试缓存的条件请求重新验证
+
+验证过期条目在保留期内仍可用于重新验证，WebScraper 发送 If-None-Match/If-Modified-Since，
+收到 304 后刷新条目时间戳并返回缓存的正文
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from web_scraping_toolkit import CacheMechanism, RateLimiter, WebScraper
+from web_scraping_toolkit.strategy.fetch_mode_memory import FetchModeMemory
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """带 ETag 的页面，If-None-Match 匹配时返回 304"""
+
+    requests_seen = []
+    body = b"<html><body>" + b"<p>A page that rarely changes, with plenty of text.</p>" * 30 + b"</body></html>"
+
+    def do_GET(self):
+        _Handler.requests_seen.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.send_header("ETag", '"v1"')
+            self.send_header("X-Revalidated", "yes")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.send_header("ETag", '"v1"')
+        self.send_header("Last-Modified", "Wed, 21 Oct 2015 07:28:00 GMT")
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _age(cache, url, seconds):
+    key = cache._get_cache_key(url)
+    entry = cache.store.get(key)
+    entry["timestamp"] -= seconds
+    cache.store.put(key, entry)
+
+
+def test_stale_entries_are_kept_for_revalidation(tmp_path):
+    """过期条目不再算作缓存命中，但在保留期内仍可取出，超过保留期后删除"""
+    cache = CacheMechanism("stale", cache_dir=str(tmp_path), expiration_seconds=60,
+                           enabled=True, stale_retention_seconds=3600)
+    cache.cache_data("https://example.com/a", {"content": "x"})
+
+    _age(cache, "https://example.com/a", 120)
+    assert not cache.is_cached("https://example.com/a")
+    assert cache.get_cached_data("https://example.com/a") is None
+    assert cache.get_cached_data("https://example.com/a", include_stale=True) == {"content": "x"}
+    assert cache.get_unprocessed_items("parse") == []
+
+    _age(cache, "https://example.com/a", 3600)
+    assert cache.get_cached_data("https://example.com/a", include_stale=True) is None
+    assert cache.store.count() == 0
+
+
+def test_not_modified_refreshes_cached_entry(tmp_path):
+    """条目过期后发送条件请求，304 时返回缓存正文并刷新时间戳"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/page"
+    _Handler.requests_seen = []
+
+    cache = CacheMechanism("revalidate", cache_dir=str(tmp_path), expiration_seconds=60, enabled=True)
+    scraper = WebScraper(
+        cache_mechanism=cache,
+        rate_limiter=RateLimiter(enabled=False),
+        fetch_modes=FetchModeMemory(path=str(tmp_path / "fetch_modes.json"), enabled=True)
+    )
+    try:
+        first = scraper.get(url)
+        assert first.status_code == 200
+        assert scraper.get(url).fetch_info["mode"] == "cache"
+        assert len(_Handler.requests_seen) == 1
+
+        _age(cache, url, 120)
+        revalidated = scraper.get(url)
+    finally:
+        scraper.close()
+        server.shutdown()
+
+    assert len(_Handler.requests_seen) == 2
+    assert _Handler.requests_seen[1]["If-None-Match"] == '"v1"'
+    assert _Handler.requests_seen[1]["If-Modified-Since"] == "Wed, 21 Oct 2015 07:28:00 GMT"
+
+    assert revalidated.status_code == 200
+    assert revalidated.text == first.text
+    assert revalidated.fetch_info["revalidated"] is True
+    assert revalidated.fetch_info["path"][-1]["outcome"] == "not_modified"
+
+    assert cache.is_cached(url)
+    assert cache.get_cached_data(url)["headers"]["X-Revalidated"] == "yes"
+    assert cache.get_cached_data(url)["headers"]["Content-Type"] == "text/html; charset=utf-8"
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+测试缓存的延迟批量写入
+
+验证写入先进入缓冲区、读取能看到未落盘的写入、按数量和时间批量落盘，
+以及 flush()、上下文管理器和 durable 选项
+"""
+
+import sqlite3
+import time
+
+import pytest
+
+from web_scraping_toolkit import CacheMechanism
+from web_scraping_toolkit.cache.backends.memory_backend import MemoryCacheBackend
+from web_scraping_toolkit.cache.backends.sqlite_backend import SQLiteCacheBackend
+from web_scraping_toolkit.cache.backends.write_behind import WriteBehindBackend
+
+
+def _entry(item_id):
+    return {"id": item_id, "data": item_id, "timestamp": time.time(), "date": "2024-01-01T00:00:00"}
+
+
+def test_writes_are_buffered_until_flush():
+    """写入先缓冲，读取能看到，flush 后才写入后端"""
+    persistent = MemoryCacheBackend()
+    backend = WriteBehindBackend(persistent, max_pending=1000, flush_interval=60)
+    backend.put("k1", _entry("a"))
+    backend.put_status("k1", {"id": "a", "processed_stages": {"parse": {}}})
+
+    assert persistent.get("k1") is None
+    assert backend.get("k1")["data"] == "a"
+    assert backend.get_status("k1") == {"id": "a", "processed_stages": {"parse": {}}}
+
+    assert backend.flush() == 2
+    assert persistent.get("k1")["data"] == "a"
+    assert persistent.get_status("k1") is not None
+
+    backend.put("k2", _entry("b"))
+    assert backend.delete(["k1", "k2"]) == 2
+    assert backend.get("k2") is None
+    backend.close()
+
+
+def test_background_flush_by_size_and_time():
+    """缓冲区满或超过时间限制时由后台线程落盘"""
+    persistent = MemoryCacheBackend()
+    backend = WriteBehindBackend(persistent, max_pending=3, flush_interval=0.2)
+    for i in range(3):
+        backend.put(f"k{i}", _entry(str(i)))
+    deadline = time.monotonic() + 1
+    while persistent.count() < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert persistent.count() == 3
+
+    backend.put("late", _entry("late"))
+    time.sleep(0.05)
+    assert persistent.get("late") is None
+    time.sleep(0.4)
+    assert persistent.get("late") is not None
+    backend.close()
+
+
+class _FailingOnceBackend(MemoryCacheBackend):
+    """第一次批量写入时抛出异常的内存后端"""
+
+    def __init__(self):
+        super().__init__()
+        self.failures = 1
+
+    def put_many(self, entries):
+        if self.failures:
+            self.failures -= 1
+            raise OSError("disk full")
+        super().put_many(entries)
+
+
+def test_failed_flush_keeps_writes():
+    """落盘失败时写入回到缓冲区，不覆盖之后的新写入，下次 flush 时写入"""
+    persistent = _FailingOnceBackend()
+    backend = WriteBehindBackend(persistent, max_pending=1000, flush_interval=60)
+    backend.put("k1", _entry("a"))
+    backend.put("k2", _entry("b"))
+
+    with pytest.raises(OSError):
+        backend.flush()
+    assert backend.get("k1")["data"] == "a"
+    backend.put("k2", _entry("newer"))
+
+    assert backend.flush() == 2
+    assert persistent.get("k1")["data"] == "a"
+    assert persistent.get("k2")["data"] == "newer"
+    backend.close()
+
+
+def test_context_manager_persists_on_exit(tmp_path):
+    """离开 with 代码块时写入缓冲内容，重新打开后可读"""
+    with CacheMechanism("wb", cache_dir=str(tmp_path), expiration_seconds=3600, enabled=True,
+                        backend="filesystem", write_behind=True) as cache:
+        for i in range(20):
+            cache.cache_data(f"https://example.com/{i}", {"content": i})
+        cache.mark_as_processed("https://example.com/0", "parse")
+        assert cache.get_cached_data("https://example.com/5") == {"content": 5}
+
+    reopened = CacheMechanism("wb", cache_dir=str(tmp_path), expiration_seconds=3600, enabled=True, backend="filesystem")
+    assert reopened.get_stats()["entries"] == 20
+    assert reopened.is_processed_by_stage("https://example.com/0", "parse")
+    reopened.close()
+
+
+def test_durable_sqlite(tmp_path):
+    """durable 选项让 SQLite 使用 synchronous=FULL"""
+    cache = CacheMechanism("durable", cache_dir=str(tmp_path), enabled=True, backend="sqlite", durable=True,
+                           hot_max_entries=0)
+    assert cache._layer(SQLiteCacheBackend)._conn.execute("PRAGMA synchronous").fetchone()[0] == 2
+    cache.close()
+    assert sqlite3.connect(str(tmp_path / "durable" / "cache.db")).execute("PRAGMA journal_mode").fetchone()[0] == "wal"
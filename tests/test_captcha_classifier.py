@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+测试结构化验证码分类器
+
+在带标签的已保存页面语料上评估误报率和漏报率，
+并验证提到 robot/challenge 的普通页面不再触发浏览器验证码流程
+"""
+
+import os
+
+import requests
+
+from web_scraping_toolkit import WebScraper
+from web_scraping_toolkit.detection.captcha_classifier import CaptchaClassifier
+from web_scraping_toolkit.detection.captcha_evaluation import evaluate, keyword_is_captcha, load_corpus
+
+CORPUS_DIR = os.path.join(os.path.dirname(__file__), "data", "captcha_corpus")
+
+
+def test_corpus_has_no_false_positives_or_negatives():
+    """分类器在语料上没有误报和漏报，而原来的关键词判断会误报"""
+    pages = load_corpus(CORPUS_DIR)
+    assert {page["label"] for page in pages} == {"captcha", "ok"}
+
+    result = evaluate(pages, CaptchaClassifier(threshold=0.6).is_captcha)
+    assert result["false_positives"] == []
+    assert result["false_negatives"] == []
+
+    assert evaluate(pages, keyword_is_captcha)["false_positive_rate"] > 0.5
+
+
+def test_confidence_and_vendor():
+    """返回置信度、厂商和匹配到的信号"""
+    classifier = CaptchaClassifier(threshold=0.6)
+
+    result = classifier.classify("<html><body></body></html>", 403, {"CF-Mitigated": "challenge"})
+    assert result["is_captcha"] and result["confidence"] == 1.0 and result["vendor"] == "cloudflare"
+
+    result = classifier.classify("<html><title>Robots in space</title><body><p>robot challenge</p></body></html>")
+    assert result == {"is_captcha": False, "confidence": 0.0, "vendor": None, "signals": []}
+
+
+def test_scraper_ignores_plain_429_and_robot_articles():
+    """普通的 429 页面和讨论机器人的文章不再被当成验证码页面"""
+    scraper = WebScraper()
+
+    response = requests.Response()
+    response.status_code = 429
+    response.encoding = "utf-8"
+    response._content = b"<html><head><title>429 Too Many Requests</title></head><body>slow down</body></html>"
+    assert not scraper._is_captcha_page(response)
+
+    with open(os.path.join(CORPUS_DIR, "captcha", "recaptcha_interstitial.html"), "rb") as f:
+        response._content = f.read()
+    assert scraper._is_captcha_page(response)
@@ -0,0 +1,181 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+测试按结果分类的升级策略
+
+验证状态码和请求异常的分类、可配置的动作链、Retry-After，
+以及 WebScraper.get 只在浏览器能解决问题时才启动浏览器，并在 fetch_info 中报告路径
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from web_scraping_toolkit import RateLimiter, WebScraper
+from web_scraping_toolkit.strategy.fetch_mode_memory import FetchModeMemory
+from web_scraping_toolkit.strategy.escalation_policy import EscalationPolicy
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """按路径返回 404、先 503 后 200、过短的页面"""
+
+    hits = {}
+    article = b"<html><body>" + b"<p>An ordinary paragraph of article text.</p>" * 40 + b"</body></html>"
+
+    def do_GET(self):
+        _Handler.hits[self.path] = _Handler.hits.get(self.path, 0) + 1
+        if self.path == "/missing":
+            self._reply(404, b"<html><body>Not Found</body></html>")
+        elif self.path == "/flaky" and _Handler.hits[self.path] == 1:
+            self._reply(503, b"<html><body>Try again</body></html>", {"Retry-After": "0"})
+        elif self.path == "/flaky":
+            self._reply(200, self.article)
+        else:
+            self._reply(200, b"<html><body>tiny</body></html>")
+
+    def _reply(self, status, body, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def site():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    _Handler.hits = {}
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+@pytest.fixture
+def scraper(tmp_path):
+    scraper = WebScraper(
+        rate_limiter=RateLimiter(enabled=False),
+        fetch_modes=FetchModeMemory(path=str(tmp_path / "fetch_modes.json"), enabled=True),
+        escalation_policy=EscalationPolicy(rules={}, max_retry_after=60)
+    )
+    scraper.rendered = []
+
+    def fake_browser(url, headers=None, retry_count=1):
+        scraper.rendered.append(url)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b"<html><body>rendered</body></html>"
+        return response
+
+    scraper._get_with_browser = fake_browser
+    yield scraper
+    scraper.close()
+
+
+def test_classification():
+    """状态码与异常分类，DNS 失败与普通连接失败区分开"""
+    policy = EscalationPolicy(rules={})
+    assert policy.classify_status(200) is None
+    assert policy.classify_status(404) == "client_error"
+    assert policy.classify_status(410) == "client_error"
+    assert policy.classify_status(403) == "forbidden"
+    assert policy.classify_status(429) == "rate_limited"
+    assert policy.classify_status(502) == "server_error"
+
+    dns = requests.exceptions.ConnectionError(
+        "HTTPSConnectionPool(host='nope.invalid', port=443): Max retries exceeded "
+        "(Caused by NameResolutionError(\"Failed to resolve 'nope.invalid'\"))"
+    )
+    assert policy.classify_exception(dns) == "dns_error"
+    assert policy.classify_exception(requests.exceptions.ConnectionError("Connection refused")) == "connection_error"
+    assert policy.classify_exception(requests.exceptions.ProxyError("bad proxy")) == "proxy_error"
+    assert policy.classify_exception(requests.exceptions.ReadTimeout("slow")) == "timeout"
+    assert policy.classify_exception(requests.exceptions.TooManyRedirects("loop")) == "request_error"
+
+
+def test_action_chains_and_rules():
+    """重试次数用完后采用链中的下一个非重试动作，规则可覆盖默认值"""
+    policy = EscalationPolicy(rules={"client_error": "render", "timeout": ["retry"]})
+    assert policy.action_for("ok", True) == "return"
+    assert policy.action_for("server_error", True) == "retry"
+    assert policy.action_for("server_error", False) == "fail"
+    assert policy.action_for("connection_error", True) == "rotate_proxy"
+    assert policy.action_for("connection_error", False) == "render"
+    assert policy.action_for("dns_error", True) == "fail"
+    assert policy.action_for("client_error", True) == "render"
+    assert policy.action_for("timeout", False) == "fail"
+
+    with pytest.raises(ValueError):
+        EscalationPolicy(rules={"teapot": "fail"})
+    with pytest.raises(ValueError):
+        EscalationPolicy(rules={"server_error": "panic"})
+
+
+def test_retry_delay_honours_retry_after():
+    """Retry-After 延长退避时间，但不超过上限"""
+    policy = EscalationPolicy(rules={}, max_retry_after=10)
+    response = requests.Response()
+    response.headers["Retry-After"] = "7"
+    assert policy.retry_delay(0) == 1
+    assert policy.retry_delay(2) == 4
+    assert policy.retry_delay(0, response) == 7
+    response.headers["Retry-After"] = "600"
+    assert policy.retry_delay(0, response) == 10
+    response.headers["Retry-After"] = "Wed, 21 Oct 2015 07:28:00 GMT"
+    assert policy.retry_delay(1, response) == 2
+
+
+def test_not_found_fails_fast_without_browser(site, scraper):
+    """404 直接返回，不重试也不启动浏览器"""
+    response = scraper.get(site + "/missing", use_cache=False)
+
+    assert response.status_code == 404
+    assert scraper.rendered == []
+    assert _Handler.hits["/missing"] == 1
+    assert response.fetch_info["mode"] == "http"
+    assert [(s["outcome"], s["action"], s["status"]) for s in response.fetch_info["path"]] == [
+        ("client_error", "fail", 404)
+    ]
+
+
+def test_server_error_retries_over_http(site, scraper):
+    """5xx 通过 HTTP 重试，而不是启动浏览器"""
+    response = scraper.get(site + "/flaky", use_cache=False)
+
+    assert response.status_code == 200
+    assert scraper.rendered == []
+    assert [(s["outcome"], s["action"]) for s in response.fetch_info["path"]] == [
+        ("server_error", "retry"), ("ok", "return")
+    ]
+
+
+def test_short_body_is_rendered(site, scraper):
+    """过短的页面升级到浏览器，路径记录每一步"""
+    response = scraper.get(site + "/tiny", use_cache=False)
+
+    assert response.text == "<html><body>rendered</body></html>"
+    assert scraper.rendered == [site + "/tiny"]
+    assert response.fetch_info["mode"] == "browser"
+    assert [(s["mode"], s["outcome"], s["action"]) for s in response.fetch_info["path"]] == [
+        ("http", "short_body", "render"), ("browser", "ok", "return")
+    ]
+
+
+def test_dns_failure_raises_without_browser(scraper):
+    """DNS 解析失败直接抛出异常，不启动浏览器"""
+    def unresolvable(url, params=None, headers=None, timeout=30):
+        raise requests.exceptions.ConnectionError("Failed to resolve 'nope.invalid' (Name or service not known)")
+
+    scraper._get_with_requests = unresolvable
+    with pytest.raises(requests.exceptions.ConnectionError) as excinfo:
+        scraper.get("http://nope.invalid/", use_cache=False)
+
+    assert scraper.rendered == []
+    assert [s["outcome"] for s in excinfo.value.fetch_info["path"]] == ["dns_error"]
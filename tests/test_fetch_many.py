@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+测试 WebScraper.fetch_many 的批量抓取功能
+
+使用本地 HTTP 服务器验证流式结果、保持输入顺序和单站点并发上限
+"""
+
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from web_scraping_toolkit import RateLimiter, WebScraper
+
+PAGE = ("<html><body>" + "<p>paragraph</p>" * 100 + "</body></html>").encode("utf-8")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """按 Host 头统计并发请求数，/slow 路径延迟返回"""
+
+    active = Counter()
+    peak = Counter()
+    lock = threading.Lock()
+
+    def do_GET(self):
+        host = self.headers.get("Host", "").split(":")[0]
+        with _Handler.lock:
+            _Handler.active[host] += 1
+            _Handler.peak[host] = max(_Handler.peak[host], _Handler.active[host])
+        time.sleep(0.3 if self.path.startswith("/slow") else 0.05)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+        with _Handler.lock:
+            _Handler.active[host] -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+def _start_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _scraper():
+    return WebScraper(rate_limiter=RateLimiter(enabled=False))
+
+
+def _no_browser(url, headers=None, retry_count=1):
+    """避免连接失败后回退到浏览器"""
+    raise requests.RequestException("browser disabled in test")
+
+
+def test_fetch_many_per_host_limit():
+    """单个站点的并发数不超过 per_host_limit，其他站点不受影响"""
+    server = _start_server()
+    port = server.server_address[1]
+    _Handler.peak.clear()
+    urls = [f"http://127.0.0.1:{port}/a/{i}" for i in range(8)]
+    urls += [f"http://localhost:{port}/b/{i}" for i in range(8)]
+
+    try:
+        results = list(_scraper().fetch_many(urls, concurrency=8, per_host_limit=2, use_cache=False))
+    finally:
+        server.shutdown()
+
+    assert sorted(url for url, _ in results) == sorted(urls)
+    assert all(r.status_code == 200 for _, r in results)
+    assert _Handler.peak["127.0.0.1"] <= 2
+    assert _Handler.peak["localhost"] <= 2
+
+
+def test_fetch_many_preserve_order_and_errors():
+    """preserve_order 时按输入顺序返回，失败的 URL 以异常形式返回"""
+    server = _start_server()
+    port = server.server_address[1]
+    urls = [
+        f"http://127.0.0.1:{port}/slow",
+        f"http://localhost:{port}/fast",
+        "http://127.0.0.1:1/unreachable",
+    ]
+
+    try:
+        scraper = _scraper()
+        scraper._get_with_browser = _no_browser
+        results = list(scraper.fetch_many(urls, concurrency=3, preserve_order=True,
+                                          use_cache=False, retry_count=1))
+    finally:
+        server.shutdown()
+
+    assert [url for url, _ in results] == urls
+    assert results[0][1].status_code == 200
+    assert isinstance(results[2][1], requests.RequestException)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+测试按域名记忆抓取模式
+
+验证 HTTP 多次失败后直接使用浏览器、定期重新探测 HTTP、
+证据随时间衰减，以及记忆持久化到 JSON 文件
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from web_scraping_toolkit import CacheMechanism, RateLimiter, WebScraper
+from web_scraping_toolkit.strategy.fetch_mode_memory import FetchModeMemory, MODE_BROWSER, MODE_HTTP
+
+URL = "https://www.example.com/page"
+
+
+def _memory(tmp_path, **options):
+    options.setdefault("reprobe_interval", 3600)
+    return FetchModeMemory(path=str(tmp_path / "fetch_modes.json"), enabled=True, min_evidence=2, **options)
+
+
+def _learn_browser(memory, times=2):
+    for _ in range(times):
+        memory.record(URL, MODE_HTTP, False)
+        memory.record(URL, MODE_BROWSER, True)
+
+
+def test_switches_to_browser_after_repeated_http_failures(tmp_path):
+    """HTTP 连续失败且浏览器成功后，同一域名直接使用浏览器"""
+    memory = _memory(tmp_path)
+    assert memory.choose_mode(URL) == MODE_HTTP
+
+    _learn_browser(memory, times=1)
+    assert memory.choose_mode(URL) == MODE_HTTP
+
+    _learn_browser(memory, times=1)
+    assert memory.choose_mode(URL) == MODE_BROWSER
+    assert memory.choose_mode("https://other.example.org/") == MODE_HTTP
+
+
+def test_http_is_reprobed_and_evidence_decays(tmp_path):
+    """到达重新探测间隔时放行一次 HTTP；旧证据衰减后恢复 HTTP"""
+    memory = _memory(tmp_path, reprobe_interval=0)
+    _learn_browser(memory)
+    assert memory.choose_mode(URL) == MODE_HTTP
+    memory.record(URL, MODE_HTTP, True)
+    memory.reprobe_interval = 3600
+    assert memory.choose_mode(URL) == MODE_HTTP
+
+    memory = _memory(tmp_path, half_life_hours=1)
+    _learn_browser(memory)
+    assert memory.choose_mode(URL) == MODE_BROWSER
+    for record in memory._domains.values():
+        record["updated"] -= 3 * 3600
+    assert memory.choose_mode(URL) == MODE_HTTP
+
+
+def test_successful_http_domains_are_not_stored(tmp_path):
+    """只记录出现过失败的域名"""
+    memory = _memory(tmp_path)
+    memory.record(URL, MODE_HTTP, True)
+    memory.save()
+    assert memory.get_stats() == {}
+    assert not (tmp_path / "fetch_modes.json").exists()
+
+
+def test_memory_is_persisted(tmp_path):
+    """保存后新实例可以读取已学习的模式"""
+    memory = _memory(tmp_path)
+    _learn_browser(memory)
+    memory.save()
+
+    assert _memory(tmp_path).choose_mode(URL) == MODE_BROWSER
+
+
+class _ScriptOnlyHandler(BaseHTTPRequestHandler):
+    """返回需要 JavaScript 渲染的页面，并统计请求次数"""
+
+    hits = 0
+    body = b"<html><body><div id='app'></div><script>render()</script><script>x()</script></body></html>"
+
+    def do_GET(self):
+        _ScriptOnlyHandler.hits += 1
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_default_file_follows_cache(tmp_path, monkeypatch):
+    """默认的记忆文件放在爬虫所用缓存的目录中，没有缓存时不写文件"""
+    monkeypatch.delenv("FETCH_MODE_FILE", raising=False)
+    monkeypatch.chdir(tmp_path)
+
+    scraper = WebScraper(rate_limiter=RateLimiter(enabled=False))
+    assert scraper.fetch_modes.path == ""
+    scraper.close()
+
+    cache = CacheMechanism("modes", cache_dir=str(tmp_path / "store"), enabled=True)
+    scraper = WebScraper(cache_mechanism=cache, rate_limiter=RateLimiter(enabled=False))
+    assert scraper.fetch_modes.path == str(tmp_path / "store" / "fetch_modes.json")
+    scraper.close()
+    assert not (tmp_path / "cache").exists()
+
+
+def test_scraper_skips_http_for_learned_domains(tmp_path):
+    """学习到需要浏览器后，WebScraper 不再发送注定失败的 HTTP 请求"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ScriptOnlyHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+    _ScriptOnlyHandler.hits = 0
+
+    rendered = []
+
+    def fake_browser(url, headers=None, retry_count=1):
+        rendered.append(url)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b"<html><body>rendered</body></html>"
+        return response
+
+    scraper = WebScraper(rate_limiter=RateLimiter(enabled=False), fetch_modes=_memory(tmp_path))
+    scraper._get_with_browser = fake_browser
+    try:
+        for _ in range(4):
+            assert scraper.get(url, use_cache=False).text == "<html><body>rendered</body></html>"
+    finally:
+        scraper.close()
+        server.shutdown()
+
+    assert len(rendered) == 4
+    assert _ScriptOnlyHandler.hits == 2
+    assert (tmp_path / "fetch_modes.json").exists()
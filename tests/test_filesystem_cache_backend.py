@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+测试文件系统缓存后端
+
+验证每个条目单独成文件、原子写入、元数据索引的持久化与重建，
+以及默认后端自动导入旧版 items.json
+"""
+
+import json
+import os
+import threading
+import time
+
+from web_scraping_toolkit import CacheMechanism
+from web_scraping_toolkit.cache.backends import filesystem_backend
+from web_scraping_toolkit.cache.backends.filesystem_backend import FilesystemCacheBackend
+
+
+def _entry(item_id, timestamp, data="body"):
+    return {"id": item_id, "data": data, "timestamp": timestamp, "date": "2024-01-01T00:00:00"}
+
+
+def _all_files(root):
+    return sorted(os.path.relpath(os.path.join(d, f), root) for d, _, files in os.walk(root) for f in files)
+
+
+def test_one_file_per_entry(tmp_path):
+    """每个条目写入各自的分片目录，不留下临时文件"""
+    backend = FilesystemCacheBackend(str(tmp_path))
+    backend.put("ab12", _entry("a", 1.0, data="<html>" + "x" * 10000 + "</html>"))
+    backend.put("cd34", _entry("b", 2.0))
+    backend.put("ab12", _entry("a", 3.0))
+    backend.put_status("ab12", {"id": "a", "processed_stages": {}})
+    backend.close()
+
+    assert _all_files(str(tmp_path)) == [
+        os.path.join("entries", "ab", "ab12.json"),
+        os.path.join("entries", "cd", "cd34.json"),
+        "index.jsonl",
+        "index.lock",
+        os.path.join("status", "ab", "ab12.json"),
+    ]
+    assert json.loads((tmp_path / "entries" / "ab" / "ab12.json").read_text(encoding="utf-8"))["data"] == "body"
+
+
+def test_index_log_replay_and_compaction(tmp_path):
+    """重新打开时重放索引日志并压缩，忽略崩溃留下的半行"""
+    backend = FilesystemCacheBackend(str(tmp_path))
+    for i in range(5):
+        backend.put(f"k{i}", _entry(f"id{i}", float(i)))
+    backend.put("k0", _entry("id0", 10.0))
+    backend.delete(["k1", "k2"])
+    backend.close()
+    with open(tmp_path / "index.jsonl", "a", encoding="utf-8") as f:
+        f.write('{"key": "k9", "id')
+
+    backend = FilesystemCacheBackend(str(tmp_path))
+    assert sorted(backend.scan()) == [("k0", "id0", 10.0, None), ("k3", "id3", 3.0, None), ("k4", "id4", 4.0, None)]
+    backend.close()
+    assert len((tmp_path / "index.jsonl").read_text(encoding="utf-8").splitlines()) == 3
+
+
+def test_index_log_compacted_at_runtime(tmp_path, monkeypatch):
+    """被覆盖的索引记录多于有效记录时，运行中也会压缩索引日志"""
+    monkeypatch.setattr(filesystem_backend, "COMPACT_MIN_RECORDS", 20)
+    backend = FilesystemCacheBackend(str(tmp_path))
+    for i in range(100):
+        backend.put(f"k{i % 5}", _entry(f"id{i % 5}", float(i)))
+
+    assert len((tmp_path / "index.jsonl").read_text(encoding="utf-8").splitlines()) <= 25
+    assert sorted(key for key, _, _, _ in backend.scan()) == [f"k{i}" for i in range(5)]
+    backend.put("k0", _entry("id0", 1000.0))
+    backend.close()
+
+    reopened = FilesystemCacheBackend(str(tmp_path))
+    assert dict((key, timestamp) for key, _, timestamp, _ in reopened.scan())["k0"] == 1000.0
+    reopened.close()
+
+
+def test_entry_files_written_outside_locks(tmp_path):
+    """写入条目文件时不持有锁，一个慢写入不会挡住其他线程的写入"""
+    backend = FilesystemCacheBackend(str(tmp_path))
+    release = threading.Event()
+    write_atomic = backend._write_atomic
+
+    def slow_write(path, text):
+        if "slow" in path:
+            release.wait(5)
+        write_atomic(path, text)
+
+    backend._write_atomic = slow_write
+    slow = threading.Thread(target=backend.put, args=("slow", _entry("slow", 1.0)))
+    slow.start()
+    time.sleep(0.05)
+
+    backend.put("fast", _entry("fast", 2.0))
+    backend.put_status("fast", {"id": "fast", "processed_stages": {}})
+    assert backend.get("fast")["id"] == "fast"
+    assert backend.get("slow") is None
+
+    release.set()
+    slow.join(5)
+    assert backend.get("slow")["id"] == "slow"
+    assert backend.count() == 2
+    backend.close()
+
+
+def test_index_rebuilt_from_entry_files(tmp_path):
+    """索引文件丢失时从条目文件重建"""
+    backend = FilesystemCacheBackend(str(tmp_path))
+    backend.put("k1", _entry("a", 1.0))
+    backend.put("k2", _entry("b", 2.0))
+    backend.close()
+    os.remove(tmp_path / "index.jsonl")
+
+    backend = FilesystemCacheBackend(str(tmp_path))
+    assert backend.count() == 2
+    assert sorted(key for key, _, _, _ in backend.scan()) == ["k1", "k2"]
+    backend.close()
+
+
+def test_default_backend_imports_json_cache(tmp_path):
+    """默认的 filesystem 后端首次使用时导入旧版的 items.json/status.json"""
+    legacy = CacheMechanism("legacy", cache_dir=str(tmp_path), expiration_seconds=3600, enabled=True, backend="json")
+    legacy.cache_data("https://example.com/a", {"content": "a"})
+    legacy.mark_as_processed("https://example.com/a", "parse")
+
+    cache = CacheMechanism("legacy", cache_dir=str(tmp_path), expiration_seconds=3600, enabled=True)
+    assert cache.backend == "filesystem"
+    assert cache.get_cached_data("https://example.com/a") == {"content": "a"}
+    assert cache.is_processed_by_stage("https://example.com/a", "parse")
+    assert os.path.exists(tmp_path / "legacy" / "items.json.migrated")
+    cache.close()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+测试页面信号检测
+
+验证验证码/需要 JavaScript/正常页面的分类、返回的匹配信号，
+以及与原来逐个关键词扫描的判断一致
+"""
+
+import random
+
+import requests
+
+from web_scraping_toolkit import WebScraper
+from web_scraping_toolkit.detection.page_signals import (
+    CAPTCHA_SIGNALS,
+    JS_REQUIRED_SIGNALS,
+    PageSignalMatcher,
+    classify_page,
+)
+
+
+def test_classification_and_signals():
+    """验证码信号优先于 JavaScript 信号，并报告所有匹配的关键词"""
+    result = classify_page("<div class='g-reCAPTCHA'></div><noscript>Please enable JavaScript</noscript>")
+    assert result["classification"] == "captcha"
+    assert sorted(result["signals"]["captcha"]) == ["captcha", "recaptcha"]
+    assert sorted(result["signals"]["js_required"]) == ["enable javascript", "please enable javascript"]
+
+    assert classify_page("<p>You need to enable JavaScript to run this app.</p>")["classification"] == "js_required"
+    assert classify_page("<p>An ordinary article.</p>") == {
+        "classification": "ok",
+        "signals": {"captcha": [], "js_required": []},
+    }
+
+
+def test_matches_keyword_scans():
+    """与逐个关键词 in 扫描的结果一致"""
+    matcher = PageSignalMatcher({"captcha": CAPTCHA_SIGNALS, "js": JS_REQUIRED_SIGNALS})
+    words = ["hcaptcha", "robot", "Human", "verification", "enable", "JavaScript", "please", "check", "bot",
+             "security", "are", "you", "need", "to", "is", "required", "article", "text"]
+    rng = random.Random(3)
+    for _ in range(2000):
+        text = " ".join(rng.choice(words) for _ in range(rng.randint(1, 12)))
+        found = matcher.match(text)
+        lower = text.lower()
+        assert sorted(found["captcha"]) == sorted(k for k in CAPTCHA_SIGNALS if k in lower)
+        assert sorted(found["js"]) == sorted(k for k in JS_REQUIRED_SIGNALS if k in lower)
+
+
+def test_scraper_checks_share_one_scan(monkeypatch):
+    """同一个响应的验证码检查和 JavaScript 检查只扫描一次"""
+    calls = []
+
+    def counting_classify(text, matcher=None):
+        calls.append(len(text))
+        return classify_page(text, matcher)
+
+    monkeypatch.setattr("web_scraping_toolkit.scraper.classify_page", counting_classify)
+
+    response = requests.Response()
+    response.status_code = 200
+    response.encoding = "utf-8"
+    response._content = ("<html><body>" + "<p>text</p>" * 200 + "Please enable JavaScript</body></html>").encode("utf-8")
+
+    scraper = WebScraper()
+    assert not scraper._is_captcha_page(response)
+    assert scraper._needs_browser(response)
+    assert len(calls) == 1
+
+
+def test_default_categories_do_not_depend_on_imports():
+    """classify_page 的类别不受是否导入验证码分类器影响"""
+    import web_scraping_toolkit.detection.captcha_classifier  # noqa: F401
+
+    assert set(classify_page("<p>text</p>")["signals"]) == {"captcha", "js_required"}
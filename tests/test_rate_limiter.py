@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+测试按站点的令牌桶限速器
+
+验证同一站点的请求被限速、不同站点互不影响，以及按域名/模式的规则覆盖
+"""
+
+import threading
+import time
+
+from web_scraping_toolkit import RateLimiter
+
+
+def test_same_host_is_spaced():
+    """同一站点超出突发容量后需要等待"""
+    limiter = RateLimiter(default_rate=10, default_burst=2, rules={}, enabled=True)
+    waits = [limiter.reserve("https://example.com/page/%d" % i) for i in range(4)]
+    assert waits[0] == 0 and waits[1] == 0
+    assert 0.05 < waits[2] <= 0.1
+    assert 0.15 < waits[3] <= 0.2
+
+
+def test_hosts_are_independent():
+    """不同站点各自拥有独立的令牌桶"""
+    limiter = RateLimiter(default_rate=1, default_burst=1, rules={}, enabled=True)
+    assert limiter.reserve("https://a.example.com/") == 0
+    assert limiter.reserve("https://b.example.com/") == 0
+    assert limiter.reserve("https://a.example.com/other") > 0.9
+
+
+def test_rules_override_defaults():
+    """精确域名覆盖其子域名，通配符模式按 fnmatch 匹配，最长规则优先"""
+    limiter = RateLimiter(
+        default_rate=1,
+        default_burst=1,
+        rules={
+            "example.com": {"rate": 5, "burst": 3},
+            "slow.example.com": {"rate": 0.5},
+            "*.gov": {"rate": 0.2, "burst": 1},
+        },
+        enabled=True,
+    )
+    assert limiter._get_limits("www.example.com") == (5.0, 3)
+    assert limiter._get_limits("slow.example.com") == (0.5, 1)
+    assert limiter._get_limits("data.gov") == (0.2, 1)
+    assert limiter._get_limits("other.org") == (1.0, 1)
+
+
+def test_acquire_is_thread_safe():
+    """多线程同时获取令牌时，总耗时符合速率限制"""
+    limiter = RateLimiter(default_rate=20, default_burst=1, rules={}, enabled=True)
+    threads = [threading.Thread(target=limiter.acquire, args=("https://example.com/",)) for _ in range(6)]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert time.monotonic() - start >= 0.24
+
+
+def test_disabled_never_waits():
+    """禁用时不做任何限速"""
+    limiter = RateLimiter(default_rate=0.1, enabled=False)
+    assert all(limiter.reserve("https://example.com/") == 0 for _ in range(5))
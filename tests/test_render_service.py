@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+测试 RenderService 的多进程渲染
+
+多个线程通过同一个渲染服务并发渲染本地页面；
+如果本机未安装 Chromium，则验证错误能通过 IPC 返回给调用方
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from web_scraping_toolkit.browser.render_service import RenderService, RenderError
+from web_scraping_toolkit.browser.wait_policy import LoadStateWait
+
+PAGE = b"<html><head><title>render test</title></head><body><p>rendered</p></body></html>"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_threads_share_render_workers():
+    """多个线程共享两个渲染进程"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    service = RenderService(num_workers=2)
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(service.render, url, wait_policy=LoadStateWait("load", timeout=20)) for _ in range(4)]
+            results = []
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except RenderError as e:
+                    if "Executable doesn't exist" in str(e) or "playwright install" in str(e):
+                        pytest.skip("Chromium is not installed for Playwright")
+                    raise
+    finally:
+        service.close()
+        server.shutdown()
+
+    assert all("rendered" in result["html"] for result in results)
+    assert all(result["url"] == url for result in results)
+    assert all(result["wait_condition"] == "load" for result in results)
+
+
+def test_closed_service_rejects_jobs():
+    """关闭后的服务拒绝新的任务"""
+    service = RenderService(num_workers=1)
+    service.close()
+    with pytest.raises(RuntimeError):
+        service.submit("http://127.0.0.1/")
+
+
+def test_workers_checked_while_results_arrive():
+    """其他进程持续返回结果时，仍会按时检查已退出的渲染进程"""
+    service = RenderService(num_workers=1)
+    service._result_queue = queue.Queue()
+    checks = []
+
+    def check_workers():
+        checks.append(time.monotonic())
+        service._closed = True
+
+    service._check_workers = check_workers
+    busy = threading.Event()
+
+    def feed():
+        while not busy.is_set():
+            service._result_queue.put(("started", 1, 0, None))
+            time.sleep(0.05)
+
+    feeder = threading.Thread(target=feed, daemon=True)
+    feeder.start()
+    dispatcher = threading.Thread(target=service._dispatch_results, daemon=True)
+    dispatcher.start()
+    dispatcher.join(5)
+    busy.set()
+
+    assert not dispatcher.is_alive()
+    assert len(checks) == 1
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+测试浏览器资源拦截策略
+
+使用伪造的 Playwright 路由对象，验证按资源类型和域名拦截以及计数器
+"""
+
+import types
+
+from web_scraping_toolkit.browser.resource_policy import ResourceBlockPolicy
+
+
+class _FakeRoute:
+    def __init__(self):
+        self.action = None
+
+    def continue_(self):
+        self.action = "continue"
+
+    def abort(self):
+        self.action = "abort"
+
+
+class _FakePage:
+    def route(self, pattern, handler):
+        self.handler = handler
+
+    def request(self, resource_type, url):
+        route = _FakeRoute()
+        self.handler(route, types.SimpleNamespace(resource_type=resource_type, url=url))
+        return route.action
+
+
+def test_blocks_types_and_domains():
+    """图片、字体和统计域名被拦截，文档和脚本放行"""
+    policy = ResourceBlockPolicy(
+        blocked_resource_types=["image", "font"],
+        blocked_domains=["doubleclick.net"],
+        enabled=True,
+    )
+    page = _FakePage()
+    stats = policy.apply(page)
+
+    assert page.request("document", "https://example.com/") == "continue"
+    assert page.request("script", "https://example.com/app.js") == "continue"
+    assert page.request("image", "https://example.com/a.png") == "abort"
+    assert page.request("font", "https://example.com/a.woff2") == "abort"
+    assert page.request("script", "https://stats.g.doubleclick.net/dc.js") == "abort"
+    assert page.request("script", "https://notdoubleclick.net/x.js") == "continue"
+
+    assert stats["allowed"] == 3
+    assert stats["blocked"] == 3
+    assert stats["blocked_by_type"] == {"image": 1, "font": 1}
+    assert stats["blocked_by_domain"] == 1
+
+
+def test_disabled_policy_installs_no_route():
+    """禁用时不安装路由"""
+    page = _FakePage()
+    stats = ResourceBlockPolicy(enabled=False).apply(page)
+    assert not hasattr(page, "handler")
+    assert stats["blocked"] == 0
@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+测试 SQLite 缓存存储
+
+验证 CacheMechanism 在 sqlite 后端下的读写、处理状态、过期清理，
+以及从 items.json/status.json 的一次性迁移
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+from web_scraping_toolkit import CacheMechanism
+from web_scraping_toolkit.cache.cache_key import CacheKeyBuilder
+from web_scraping_toolkit.cache.backends.factory import main as migrate_main
+from web_scraping_toolkit.cache.backends.sqlite_backend import SQLiteCacheBackend
+
+
+def _cache(tmp_path, **options):
+    options.setdefault("expiration_seconds", 3600)
+    return CacheMechanism("sqlite", cache_dir=str(tmp_path), enabled=True, backend="sqlite", **options)
+
+
+def test_round_trip_and_stages(tmp_path):
+    """数据和处理状态写入 SQLite，重新打开后仍然存在"""
+    cache = _cache(tmp_path)
+    assert cache.cache_data("https://example.com/a", {"content": "页面 a", "status_code": 200})
+    assert cache.cache_data("query: shoes", ["x", "y"], ttl=60)
+    assert cache.mark_as_processed("https://example.com/a", "parse")
+    assert not cache.mark_as_processed("https://example.com/missing", "parse")
+    cache.close()
+
+    db = sqlite3.connect(str(tmp_path / "sqlite" / "cache.db"))
+    assert db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    db.close()
+    assert not (tmp_path / "sqlite" / "items.json").exists()
+
+    cache = _cache(tmp_path)
+    assert cache.get_cached_data("https://example.com/a") == {"content": "页面 a", "status_code": 200}
+    assert cache.get_cached_data("query: shoes") == ["x", "y"]
+    assert cache.is_processed_by_stage("https://example.com/a", "parse")
+    assert cache.get_unprocessed_items("parse") == ["query: shoes"]
+
+    cache.reset_processing_status("https://example.com/a")
+    assert cache.get_processing_stages("https://example.com/a") == []
+    assert cache.clear_cache() == 2
+    assert not cache.is_cached("https://example.com/a")
+    cache.close()
+
+
+def test_expiry_and_clear_by_age(tmp_path):
+    """过期条目按各自的有效期判断，超过保留期后删除"""
+    cache = _cache(tmp_path, stale_retention_seconds=600)
+    cache.cache_data("https://example.com/short", "short", ttl=60)
+    cache.cache_data("https://example.com/long", "long")
+
+    for key, _, _, _ in cache.store.scan():
+        entry = cache.store.get(key)
+        entry["timestamp"] -= 120
+        cache.store.put(key, entry)
+
+    assert not cache.is_cached("https://example.com/short")
+    assert cache.get_cached_data("https://example.com/short", include_stale=True) == "short"
+    assert cache.is_cached("https://example.com/long")
+
+    key = cache._get_cache_key("https://example.com/short")
+    entry = cache.store.get(key)
+    entry["timestamp"] -= 3600
+    cache.store.put(key, entry)
+    assert cache.get_cached_data("https://example.com/short", include_stale=True) is None
+    assert cache.store.count() == 1
+
+    assert cache.clear_cache(age_days=1) == 0
+    cache.close()
+
+
+def test_migrates_json_files(tmp_path):
+    """首次使用 sqlite 后端时导入已有的 JSON 缓存，之后不再重复导入"""
+    json_cache = CacheMechanism("sqlite", cache_dir=str(tmp_path), expiration_seconds=3600, enabled=True, backend="json")
+    json_cache.cache_data("https://example.com/a", {"content": "a"})
+    json_cache.cache_data("https://example.com/b", {"content": "b"}, ttl=1800)
+    json_cache.mark_as_processed("https://example.com/a", "parse")
+
+    cache = _cache(tmp_path)
+    assert cache.store.count() == 2
+    assert cache.get_cached_data("https://example.com/b") == {"content": "b"}
+    assert cache.store.get(cache._get_cache_key("https://example.com/b"))["ttl"] == 1800
+    assert cache.is_processed_by_stage("https://example.com/a", "parse")
+    assert os.path.exists(tmp_path / "sqlite" / "items.json.migrated")
+    assert not os.path.exists(tmp_path / "sqlite" / "items.json")
+    cache.close()
+
+
+def test_migration_rekeys_old_entries(tmp_path):
+    """迁移时按条目的 URL 重新计算键，旧版本去掉查询参数算出的键不再影响查找"""
+    url = "https://example.com/list?page=2"
+    old_key = hashlib.md5(b"https://example.com/list").hexdigest()
+    item = {"id": url, "data": {"content": "page 2"}, "timestamp": time.time(), "date": "2024-01-01T00:00:00"}
+    status = {"id": url, "processed_stages": {"parse": {"timestamp": 1.0}}}
+    (tmp_path / "sqlite").mkdir()
+    (tmp_path / "sqlite" / "items.json").write_text(json.dumps({old_key: item}), encoding="utf-8")
+    (tmp_path / "sqlite" / "status.json").write_text(json.dumps({old_key: status}), encoding="utf-8")
+
+    cache = _cache(tmp_path)
+    assert cache.get_cached_data(url) == {"content": "page 2"}
+    assert cache.is_processed_by_stage(url, "parse")
+    assert list(cache.items_cache) == [cache._get_cache_key(url)]
+    assert cache.status_cache[cache._get_cache_key(url)]["processed_stages"] == status["processed_stages"]
+    cache.close()
+
+
+def test_migration_command(tmp_path):
+    """命令行迁移工具把 JSON 文件导入 cache.db"""
+    items = {"k1": {"id": "https://example.com/", "data": "x", "timestamp": 1.0, "date": "2024-01-01T00:00:00"}}
+    (tmp_path / "items.json").write_text(json.dumps(items), encoding="utf-8")
+
+    assert migrate_main([str(tmp_path), "--backend", "sqlite"]) == 0
+    assert migrate_main([str(tmp_path)]) == 1
+
+    store = SQLiteCacheBackend(str(tmp_path))
+    key = CacheKeyBuilder().storage_key("https://example.com/")
+    assert store.get(key) == items["k1"]
+    assert store.get_status(key) is None
+    store.close()
+
+
+def test_reader_connections_closed_with_their_threads(tmp_path):
+    """每个线程的读连接在线程结束后关闭，不会随线程更替越积越多"""
+    import gc
+    from concurrent.futures import ThreadPoolExecutor
+
+    store = SQLiteCacheBackend(str(tmp_path))
+    store.put("k", {"id": "a", "data": "a", "timestamp": 1.0, "date": "2024-01-01T00:00:00"})
+    for _ in range(10):
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            assert all(entry["data"] == "a" for entry in pool.map(lambda _: store.get("k"), range(8)))
+        del pool
+    gc.collect()
+
+    assert len(store._readers) <= 1
+    assert store.get("k")["data"] == "a"
+    store.close()
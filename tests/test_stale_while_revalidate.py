@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+测试缓存的 stale-while-revalidate 模式
+
+验证窗口内立即返回过期正文并标记为 stale，后台只刷新一次，
+超出窗口时仍同步抓取
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from web_scraping_toolkit import AsyncWebScraper, CacheMechanism, RateLimiter, WebScraper
+from web_scraping_toolkit.cache.cache_policy import CachePolicy
+from web_scraping_toolkit.strategy.fetch_mode_memory import FetchModeMemory
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """较慢的页面，每次返回新的版本号"""
+
+    hits = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with _Handler.lock:
+            _Handler.hits += 1
+            version = _Handler.hits
+        time.sleep(0.3)
+        body = (f"<html><body><h1>version {version}</h1>" + "<p>paragraph text</p>" * 80 + "</body></html>").encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _setup(tmp_path, window=600):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    _Handler.hits = 0
+    url = f"http://127.0.0.1:{server.server_address[1]}/page"
+
+    cache = CacheMechanism("swr", cache_dir=str(tmp_path), expiration_seconds=60, enabled=True)
+    cache.cache_data(url, {"content": "<html><body>old</body></html>", "status_code": 200, "headers": {}, "url": url})
+    key = cache._get_cache_key(url)
+    entry = cache.store.get(key)
+    entry["timestamp"] -= 120
+    cache.store.put(key, entry)
+
+    options = dict(
+        cache_mechanism=cache,
+        cache_policy=CachePolicy(respect_headers=True, min_ttl=0, max_ttl=0, rules={}, stale_while_revalidate=window),
+        rate_limiter=RateLimiter(enabled=False),
+        fetch_modes=FetchModeMemory(path=str(tmp_path / "fetch_modes.json"), enabled=True)
+    )
+    return server, url, cache, options
+
+
+def test_stale_body_served_and_refreshed_once(tmp_path):
+    """窗口内立即返回过期正文，并发请求只触发一次后台刷新"""
+    server, url, cache, options = _setup(tmp_path)
+    scraper = WebScraper(**options)
+    try:
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            responses = list(pool.map(lambda _: scraper.get(url), range(4)))
+        elapsed = time.monotonic() - started
+    finally:
+        scraper.close()
+        server.shutdown()
+
+    assert elapsed < 0.25
+    assert all(r.text == "<html><body>old</body></html>" for r in responses)
+    assert all(r.fetch_info["stale"] and r.fetch_info["refreshing"] for r in responses)
+    assert responses[0].fetch_info["stale_seconds"] >= 60
+
+    # close() waits for the refresh, which replaced the entry
+    assert _Handler.hits == 1
+    assert cache.is_cached(url)
+    assert "version 1" in cache.get_cached_data(url)["content"]
+
+
+def test_refresh_deduplicated_per_cache_key(tmp_path):
+    """同一 URL 不同参数的两个过期条目各自刷新，互不抑制"""
+    server, url, cache, options = _setup(tmp_path)
+    scraper = WebScraper(**options)
+    params = {"q": "1"}
+    identifier = scraper._lookup_cache_keys(url, params, None, False)[0]
+    cache.cache_data(identifier, {"content": "<html><body>old q</body></html>", "status_code": 200, "headers": {}})
+    key = cache._get_cache_key(identifier)
+    entry = cache.store.get(key)
+    entry["timestamp"] -= 120
+    cache.store.put(key, entry)
+    try:
+        first = scraper.get(url)
+        second = scraper.get(url, params=params)
+    finally:
+        scraper.close()
+        server.shutdown()
+
+    assert first.fetch_info["stale"] and second.fetch_info["stale"]
+    assert first.fetch_info["cache_key"] != second.fetch_info["cache_key"]
+    assert _Handler.hits == 2
+
+
+def test_outside_window_fetches_synchronously(tmp_path):
+    """超出窗口或未启用时，照常同步抓取"""
+    server, url, cache, options = _setup(tmp_path, window=30)
+    scraper = WebScraper(**options)
+    try:
+        response = scraper.get(url)
+    finally:
+        scraper.close()
+        server.shutdown()
+
+    assert "version 1" in response.text
+    assert "stale" not in response.fetch_info
+
+
+def test_aget_serves_stale_and_refreshes(tmp_path):
+    """AsyncWebScraper 同样立即返回过期正文，并在后台任务中刷新"""
+    server, url, cache, options = _setup(tmp_path)
+
+    async def run():
+        async with AsyncWebScraper(**options) as scraper:
+            first = await scraper.aget(url)
+            second = await scraper.aget(url)
+        return first, second
+
+    try:
+        first, second = asyncio.run(run())
+    finally:
+        server.shutdown()
+
+    assert first.fetch_info["stale"] and second.fetch_info["stale"]
+    assert _Handler.hits == 1
+    assert "version 1" in cache.get_cached_data(url)["content"]
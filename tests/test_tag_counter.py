@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+测试流式标签计数器
+
+与原来基于 BeautifulSoup 的判断逐一对比，确保 _needs_browser 的结论不变
+"""
+
+import random
+
+import pytest
+from bs4 import BeautifulSoup
+
+from web_scraping_toolkit.detection.tag_counter import count_body_tags, is_script_heavy
+
+PIECES = [
+    "<p>text</p>", "<DIV class='a>b'>", "</div>", "</ div >", "<span/>", "<span>", "</SPAN>",
+    "<script>var a = '<p>';</script>", "<SCRIPT src=x></SCRIPT>", "<script>a</script >b</script>",
+    "<script type=\"x\">if (a<b) {}</script>", "<script/>", "<!-- <p> -->", "<style>p {}</style>",
+    "<style><div></style>", "<h1>title</h1>", "<h7>", "<br>", "<br></br>", "<img src='x' alt=\"<p>\">",
+    "<body>", "<BODY class=x>", "<body/>", "</body>", "<html>", "</html>", "<!DOCTYPE html>",
+    "<?xml x?>", "<![CDATA[<p>]]>", "text < 3 > 2", "<p", "<a href=x>link</a>", "</P>", "<p/>",
+    "<div\n id=1>",
+]
+
+# 随机片段中的 <?xml ?> 会触发 BeautifulSoup 的提示
+pytestmark = pytest.mark.filterwarnings("ignore::bs4.XMLParsedAsHTMLWarning")
+
+
+def _soup_counts(html):
+    """原来的 BeautifulSoup 计数方式"""
+    body = BeautifulSoup(html, "html.parser").find("body")
+    if not body:
+        return None
+    return len(body.find_all("script")), len(body.find_all(["p", "div", "span", "h1", "h2", "h3", "h4", "h5", "h6"]))
+
+
+def test_counts_match_beautifulsoup_on_random_markup():
+    """随机拼接的（包括畸形的）标记与 BeautifulSoup 计数一致"""
+    rng = random.Random(7)
+    for _ in range(3000):
+        html = "".join(rng.choice(PIECES) for _ in range(rng.randint(1, 25)))
+        expected = _soup_counts(html)
+        assert count_body_tags(html) == expected, html
+        assert count_body_tags(html.encode("utf-8")) == expected, html
+
+
+def test_script_heavy_decision():
+    """脚本标签超过内容标签两倍时判定为需要浏览器"""
+    shell = "<html><head><title>x</title></head><body><div id='app'></div>" + "<script>load()</script>" * 3 + "</body></html>"
+    article = "<html><body>" + "<p>paragraph</p>" * 20 + "<script>track()</script></body></html>"
+
+    assert is_script_heavy(shell)
+    assert not is_script_heavy(article)
+    assert not is_script_heavy("<html><script>a()</script></html>")
+    assert is_script_heavy("<html><body><p>中文</p>".encode("utf-8") + b"<script></script>" * 3)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+测试页面等待策略
+
+使用伪造的页面对象，验证各策略在限定时间内结束等待、
+返回结束条件，以及按域名选择策略
+"""
+
+import pickle
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from web_scraping_toolkit.browser.wait_policy import (
+    DomainWaitPolicies,
+    IdleBudgetWait,
+    LoadStateWait,
+    SelectorWait,
+    TextStableWait,
+)
+
+
+class _FakePage:
+    """模拟一个永远达不到 networkidle、正文逐步加载的页面"""
+
+    def __init__(self, text_lengths=(0, 100, 250, 250)):
+        self.text_lengths = list(text_lengths)
+        self.goto_calls = []
+        self.selectors = {"article"}
+
+    def goto(self, url, wait_until=None, timeout=None):
+        self.goto_calls.append((url, wait_until, timeout))
+
+    def wait_for_load_state(self, state, timeout=None):
+        if state == "networkidle":
+            raise PlaywrightTimeoutError(f"Timeout {timeout}ms exceeded")
+
+    def wait_for_selector(self, selector, state=None, timeout=None):
+        if selector not in self.selectors:
+            raise PlaywrightTimeoutError(f"Timeout {timeout}ms exceeded")
+
+    def evaluate(self, expression):
+        if len(self.text_lengths) > 1:
+            return self.text_lengths.pop(0)
+        return self.text_lengths[0]
+
+    def wait_for_timeout(self, timeout):
+        pass
+
+
+def test_policies_report_the_condition_that_ended_the_wait():
+    """各策略返回结束等待的条件，超时不会抛出异常"""
+    assert LoadStateWait("load").navigate(_FakePage(), "http://a.test/") == "load"
+    assert LoadStateWait("networkidle", timeout=1).navigate(_FakePage(), "http://a.test/") == "timeout"
+    assert SelectorWait("article").navigate(_FakePage(), "http://a.test/") == "selector"
+    assert SelectorWait("#missing", timeout=1).navigate(_FakePage(), "http://a.test/") == "timeout"
+    assert IdleBudgetWait(budget=0.1).navigate(_FakePage(), "http://a.test/") == "idle_budget"
+    assert TextStableWait(stable_for=0, timeout=5).navigate(_FakePage(), "http://a.test/") == "text_stable"
+
+
+def test_navigation_stops_at_domcontentloaded():
+    """导航只等待 DOMContentLoaded，其余等待由策略限定时长"""
+    page = _FakePage()
+    IdleBudgetWait(budget=2, timeout=10).navigate(page, "http://a.test/")
+    assert page.goto_calls == [("http://a.test/", "domcontentloaded", 10000)]
+
+
+def test_text_stable_wait_is_bounded():
+    """正文一直变化时在超时后结束"""
+    page = _FakePage(text_lengths=range(1000))
+    assert TextStableWait(stable_for=1, interval=0.01, timeout=0.05).wait(page) == "timeout"
+
+
+def test_policies_resolved_per_domain():
+    """按域名（包括子域名和通配符）选择策略，并可序列化发送到渲染进程"""
+    policies = DomainWaitPolicies(
+        default="load",
+        rules={
+            "news.test": {"strategy": "selector", "selector": "article", "timeout": 10},
+            "*.gov": "text_stable",
+        },
+    )
+
+    assert isinstance(policies.for_url("https://www.news.test/a"), SelectorWait)
+    assert policies.for_url("https://www.news.test/a").timeout == 10
+    assert isinstance(policies.for_url("https://data.example.gov/"), TextStableWait)
+    assert isinstance(policies.for_url("https://other.test/"), LoadStateWait)
+
+    restored = pickle.loads(pickle.dumps(policies.for_url("https://news.test/")))
+    assert restored.selector == "article"